@@ -0,0 +1,176 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Development System
+#
+# Copyright 2008-2025 Neongecko.com Inc. | All Rights Reserved
+#
+# Notice of License - Duplicating this Notice of License near the start of any file containing
+# a derivative of this software is a condition of license for this software.
+# Friendly Licensing:
+# No charge, open source royalty free use of the Neon AI software source and object is offered for
+# educational users, noncommercial enthusiasts, Public Benefit Corporations (and LLCs) and
+# Social Purpose Corporations (and LLCs). Developers can contact developers@neon.ai
+# For commercial licensing, distribution of derivative works or redistribution please contact licenses@neon.ai
+# Distributed on an "AS IS” basis without warranties or conditions of any kind, either express or implied.
+# Trademarks of Neongecko: Neon AI(TM), Neon Assist (TM), Neon Communicator(TM), Klat(TM)
+# Authors: Guy Daniels, Daniel McKnight, Regina Bloomstine, Elon Gasper, Richard Leeds
+#
+# Specialized conversational reconveyance options from Conversation Processing Intelligence Corp.
+# US Patents 2008-2021: US7424516, US20140161250, US20140177813, US8638908, US8068604, US8553852, US10530923, US10530924
+# China Patent: CN102017585  -  Europe Patent: EU2156652  -  Patents Pending
+
+import pickle
+import random
+
+from os import environ
+from os.path import dirname, join
+from tempfile import mkdtemp
+from typing import Dict, List, Optional
+
+BUNDLED_DATA = join(dirname(dirname(__file__)),
+                    "neon_skill_caffeinewiz", "caffeine_wiz_data.pickle")
+FIXTURES = join(dirname(dirname(__file__)), "test", "fixtures")
+
+_BRANDS = ["monster", "red bull", "rockstar", "starbucks", "dunkin",
+           "peet's", "bang", "celsius", "reign", "nos", "full throttle",
+           "coca-cola", "pepsi", "mountain dew", "dr pepper", "arizona",
+           "lipton", "snapple", "tim hortons", "costa", "nescafe", "folgers"]
+_FLAVORS = ["original", "zero", "diet", "cherry", "vanilla", "mango",
+            "lemon", "lime", "berry", "citrus", "sugar free", "peach",
+            "caramel", "mocha", "hazelnut", "cold brew", "decaf", "tropical"]
+_KINDS = ["energy drink", "coffee", "iced tea", "cola", "soda", "latte",
+          "espresso", "energy shot", "sparkling water", "frappuccino"]
+_SYLLABLES = ["ka", "zo", "ri", "ven", "tor", "bli", "xa", "mu", "pel", "dra",
+              "quo", "sin", "fe", "lux", "gra", "nu", "tek", "vo", "sha", "ji"]
+
+
+def _brand(rand: random.Random) -> str:
+    # Most catalog entries come from small brands with unique names
+    if rand.random() < 0.2:
+        return rand.choice(_BRANDS)
+    return "".join(rand.choice(_SYLLABLES)
+                   for _ in range(rand.randint(2, 4)))
+
+
+def offline_skill(rows: List[List[str]]):
+    """
+    Get a CaffeineWizSkill with `rows` loaded, without a message bus,
+    settings or network access. Only the lookup path is usable.
+    """
+    from neon_skill_caffeinewiz import CaffeineWizSkill
+    from neon_skill_caffeinewiz.answers import AnswerCache
+    from neon_skill_caffeinewiz.cleaner import DrinkNameCleaner
+    from neon_skill_caffeinewiz.data import DrinkData
+    from neon_skill_caffeinewiz.extractor import QueryExtractor
+    from neon_skill_caffeinewiz.index import DrinkIndex
+    from neon_skill_caffeinewiz.merge import merge_drink_tables
+    from neon_skill_caffeinewiz.metrics import Metrics
+    from neon_skill_caffeinewiz.store import DrinkStore
+
+    skill = CaffeineWizSkill.__new__(CaffeineWizSkill)
+    skill.config_core = {"lang": "en-us"}
+    table = DrinkStore.from_rows(merge_drink_tables(rows))
+    skill._data = DrinkData(1, table, DrinkIndex(table))
+    # Names are cleaned without locale resources or aliases
+    skill._cleaners = {"en-us": (1, DrinkNameCleaner())}
+    skill._extractors = {"en-us": QueryExtractor()}
+    skill._answers = AnswerCache()
+    skill._metrics = Metrics()
+    return skill
+
+
+def loaded_skill(pages: Optional[Dict[str, bytes]] = None):
+    """
+    Get a fully loaded CaffeineWizSkill on a FakeBus, with its settings and
+    data in a new temporary directory. Sources are stubbed: a fetch returns
+    the page in `pages` for that source name, or fails immediately.
+    """
+    test_fs = mkdtemp()
+    environ["XDG_DATA_HOME"] = f"{test_fs}/data"
+    environ["XDG_CONFIG_HOME"] = f"{test_fs}/config"
+    from ovos_utils.fakebus import FakeBus
+    from neon_skill_caffeinewiz import CaffeineWizSkill
+    from neon_skill_caffeinewiz.fetch import FetchResult, SourceFetcher
+    pages = pages or dict()
+
+    def _fetch(self, name, url, deadline=5):
+        if name in pages:
+            return FetchResult(name, status=200, body=pages[name])
+        return FetchResult(name, error="Benchmark source stub")
+    SourceFetcher.fetch = _fetch
+
+    skill = CaffeineWizSkill(skill_id="skill-caffeinewiz.benchmark",
+                             bus=FakeBus())
+    skill._refresh_data().result()
+    return skill
+
+
+def publish_rows(skill, rows: List[List[str]]):
+    """
+    Replace the drink data of a loaded skill with `rows`
+    """
+    from neon_skill_caffeinewiz.data import DrinkData
+    from neon_skill_caffeinewiz.index import DrinkIndex
+    from neon_skill_caffeinewiz.merge import merge_drink_tables
+    from neon_skill_caffeinewiz.store import DrinkStore
+
+    table = DrinkStore.from_rows(merge_drink_tables(rows))
+    skill._data = DrinkData(skill._data.generation + 1, table,
+                            DrinkIndex(table), sources={"caffeinewiz": rows})
+
+
+def load_fixture(name: str) -> bytes:
+    """
+    Load a recorded source page from the test fixtures
+    """
+    with open(join(FIXTURES, name), 'rb') as f:
+        return f.read()
+
+
+def load_bundled_table() -> List[List[str]]:
+    """
+    Load the bundled caffeinewiz table without its header row
+    """
+    with open(BUNDLED_DATA, 'rb') as f:
+        return [r for r in pickle.load(f) if r[0] != "beverage"]
+
+
+def synthetic_table(size: int, seed: int = 0) -> List[List[str]]:
+    """
+    Build a drink table of `size` unique, plausible drink names
+    :param size: number of rows to generate
+    :param seed: random seed for reproducible tables
+    :return: list of [name, oz, mg] rows
+    """
+    rand = random.Random(seed)
+    rows = dict()
+    while len(rows) < size:
+        name = " ".join((_brand(rand), rand.choice(_FLAVORS),
+                         rand.choice(_KINDS)))
+        if name in rows:
+            name = f"{name} {rand.randint(1, size)}"
+        rows[name] = [name, str(rand.choice((1.93, 8, 8.4, 12, 16, 20, 24))),
+                      str(rand.randint(0, 400))]
+    return list(rows.values())
+
+
+def sample_queries(rows: List[List[str]], count: int,
+                   seed: int = 0) -> List[str]:
+    """
+    Build a query mix of exact names, partial names and misspellings
+    :param rows: drink table to sample names from
+    :param count: number of queries to generate
+    :param seed: random seed for reproducible queries
+    :return: list of query strings
+    """
+    rand = random.Random(seed)
+    queries = list()
+    for _ in range(count):
+        name = rand.choice(rows)[0]
+        kind = rand.randrange(3)
+        if kind == 0:
+            queries.append(name)
+        elif kind == 1:
+            queries.append(" ".join(name.split()[:2]))
+        else:
+            pos = rand.randrange(len(name))
+            queries.append(name[:pos] + name[pos + 1:])
+    return queries
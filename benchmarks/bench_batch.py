@@ -0,0 +1,63 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Development System
+#
+# Copyright 2008-2025 Neongecko.com Inc. | All Rights Reserved
+#
+# Notice of License - Duplicating this Notice of License near the start of any file containing
+# a derivative of this software is a condition of license for this software.
+# Friendly Licensing:
+# No charge, open source royalty free use of the Neon AI software source and object is offered for
+# educational users, noncommercial enthusiasts, Public Benefit Corporations (and LLCs) and
+# Social Purpose Corporations (and LLCs). Developers can contact developers@neon.ai
+# For commercial licensing, distribution of derivative works or redistribution please contact licenses@neon.ai
+# Distributed on an "AS IS” basis without warranties or conditions of any kind, either express or implied.
+# Trademarks of Neongecko: Neon AI(TM), Neon Assist (TM), Neon Communicator(TM), Klat(TM)
+# Authors: Guy Daniels, Daniel McKnight, Regina Bloomstine, Elon Gasper, Richard Leeds
+#
+# Specialized conversational reconveyance options from Conversation Processing Intelligence Corp.
+# US Patents 2008-2021: US7424516, US20140161250, US20140177813, US8638908, US8068604, US8553852, US10530923, US10530924
+# China Patent: CN102017585  -  Europe Patent: EU2156652  -  Patents Pending
+
+"""
+Compare `get_caffeine_info_batch` with calling `get_caffeine_info` per drink.
+Run with `python -m benchmarks.bench_batch` from the repository root. This
+measures in-process cost only; over the message bus the single-item loop also
+pays one round trip per drink.
+"""
+from time import perf_counter
+
+from neon_skill_caffeinewiz.models import CaffeineRequest
+from benchmarks import load_bundled_table, offline_skill, sample_queries, \
+    synthetic_table
+
+
+def _loop(skill, requests):
+    responses = list()
+    for request in requests:
+        try:
+            responses.append(skill.get_caffeine_info(request))
+        except ValueError:
+            responses.append(None)
+    return responses
+
+
+def run(label, rows, batch_size=1000):
+    skill = offline_skill(rows)
+    requests = [CaffeineRequest(drink=q)
+                for q in sample_queries(rows, batch_size)]
+
+    start = perf_counter()
+    _loop(skill, requests)
+    loop_time = perf_counter() - start
+
+    start = perf_counter()
+    skill.get_caffeine_info_batch(requests)
+    batch_time = perf_counter() - start
+
+    print(f"{label}: {len(rows)} drinks, {batch_size} requests | loop "
+          f"{loop_time * 1000:.0f}ms ({batch_size / loop_time:.0f}/s) | batch "
+          f"{batch_time * 1000:.0f}ms ({batch_size / batch_time:.0f}/s)")
+
+
+if __name__ == "__main__":
+    run("bundled", load_bundled_table())
+    run("synthetic", synthetic_table(10000))
@@ -0,0 +1,91 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Development System
+#
+# Copyright 2008-2025 Neongecko.com Inc. | All Rights Reserved
+#
+# Notice of License - Duplicating this Notice of License near the start of any file containing
+# a derivative of this software is a condition of license for this software.
+# Friendly Licensing:
+# No charge, open source royalty free use of the Neon AI software source and object is offered for
+# educational users, noncommercial enthusiasts, Public Benefit Corporations (and LLCs) and
+# Social Purpose Corporations (and LLCs). Developers can contact developers@neon.ai
+# For commercial licensing, distribution of derivative works or redistribution please contact licenses@neon.ai
+# Distributed on an "AS IS” basis without warranties or conditions of any kind, either express or implied.
+# Trademarks of Neongecko: Neon AI(TM), Neon Assist (TM), Neon Communicator(TM), Klat(TM)
+# Authors: Guy Daniels, Daniel McKnight, Regina Bloomstine, Elon Gasper, Richard Leeds
+#
+# Specialized conversational reconveyance options from Conversation Processing Intelligence Corp.
+# US Patents 2008-2021: US7424516, US20140161250, US20140177813, US8638908, US8068604, US8553852, US10530923, US10530924
+# China Patent: CN102017585  -  Europe Patent: EU2156652  -  Patents Pending
+
+
+"""
+Compare drink name cleaning with `DrinkNameCleaner` against the previous
+`_clean_drink_name`, which rebuilt its translate table on every call and
+only replaced aliases matching the whole phrase. Both use the English locale
+resources; queries are drink names from the bundled table with articles,
+filler phrases and punctuation added. Run with
+`python -m benchmarks.bench_clean` from the repository root.
+"""
+import random
+
+from os.path import dirname, join
+from time import perf_counter
+
+from ovos_workshop.resource_files import SkillResources
+
+from benchmarks import load_bundled_table
+from neon_skill_caffeinewiz.cleaner import DrinkNameCleaner
+
+SKILL_DIR = join(dirname(dirname(__file__)), "neon_skill_caffeinewiz")
+_PREFIXES = ["", "", "a ", "a cup of ", "a glass of "]
+_SUFFIXES = ["", "", "?", "!"]
+
+
+def legacy_clean_drink_name(drink: str, translate_drinks: dict) -> str:
+    drink = drink.lower()
+    try:
+        drink = drink.split(maxsplit=1)[1] if \
+            drink.split(maxsplit=1)[0] == "a" else drink
+    except IndexError:
+        return ""
+    if drink.startswith("cup of") or drink.startswith("glass of"):
+        drink = drink.split(" of", 1)[1].strip()
+    drink = drink.translate({ord(i): None for i in '?:!/;@#$'})\
+        .rstrip().replace(" '", "'")
+    return translate_drinks.get(drink, drink)
+
+
+def spoken_queries(names, count: int, seed: int = 0) -> list:
+    rand = random.Random(seed)
+    return [f"{rand.choice(_PREFIXES)}{rand.choice(names)}"
+            f"{rand.choice(_SUFFIXES)}" for _ in range(count)]
+
+
+def _rate(func, queries, repeat: int = 5) -> float:
+    best = None
+    for _ in range(repeat):
+        start = perf_counter()
+        for query in queries:
+            func(query)
+        elapsed = perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return len(queries) / best
+
+
+if __name__ == "__main__":
+    names = [row[0] for row in load_bundled_table()]
+    resources = SkillResources(SKILL_DIR, "en-us")
+    start = perf_counter()
+    cleaner = DrinkNameCleaner.from_resources(resources, names)
+    build_time = perf_counter() - start
+    aliases = cleaner.aliases
+    queries = spoken_queries(names, 20000)
+    # Whitespace left by removed punctuation is now collapsed
+    differ = sum(cleaner.clean(q) != " ".join(
+        legacy_clean_drink_name(q, aliases).split()) for q in queries)
+
+    old = _rate(lambda q: legacy_clean_drink_name(q, aliases), queries)
+    new = _rate(cleaner.clean, queries)
+    print(f"{len(queries)} queries, {len(names)} drink names | compiled in "
+          f"{build_time * 1000:.0f}ms | {old:.0f}/s -> {new:.0f}/s "
+          f"({new / old:.1f}x) | {differ} results differ")
@@ -0,0 +1,127 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Development System
+#
+# Copyright 2008-2025 Neongecko.com Inc. | All Rights Reserved
+#
+# Notice of License - Duplicating this Notice of License near the start of any file containing
+# a derivative of this software is a condition of license for this software.
+# Friendly Licensing:
+# No charge, open source royalty free use of the Neon AI software source and object is offered for
+# educational users, noncommercial enthusiasts, Public Benefit Corporations (and LLCs) and
+# Social Purpose Corporations (and LLCs). Developers can contact developers@neon.ai
+# For commercial licensing, distribution of derivative works or redistribution please contact licenses@neon.ai
+# Distributed on an "AS IS” basis without warranties or conditions of any kind, either express or implied.
+# Trademarks of Neongecko: Neon AI(TM), Neon Assist (TM), Neon Communicator(TM), Klat(TM)
+# Authors: Guy Daniels, Daniel McKnight, Regina Bloomstine, Elon Gasper, Richard Leeds
+#
+# Specialized conversational reconveyance options from Conversation Processing Intelligence Corp.
+# US Patents 2008-2021: US7424516, US20140161250, US20140177813, US8638908, US8068604, US8553852, US10530923, US10530924
+# China Patent: CN102017585  -  Europe Patent: EU2156652  -  Patents Pending
+
+
+"""
+Report p50/p99 latency of `CQS_match_query_phrase` for phrases about a drink
+and for unrelated phrases, compared with skipping the phrase filter and
+negative cache, and the size of the CQS callback data compared with sending
+the serialized message and every matched row. Run with
+`python -m benchmarks.bench_cqs` from the repository root; sources are
+stubbed so no network access is needed.
+"""
+from time import perf_counter
+
+from benchmarks import loaded_skill
+
+MATCHING = ["how much caffeine is in red bull", "what is in diet coke",
+            "caffeine content of coffee", "how much caffeine is in software",
+            "tell me the caffeine content of pepsi"]
+NOT_MATCHING = ["what time is it", "talk to me in french", "tell me a joke",
+                "what's the weather like today", "set a timer for 5 minutes",
+                "who are you", "turn on the lights", "play some music",
+                "what is one plus one", "how old is the president"]
+
+
+def _percentiles(times):
+    times = sorted(times)
+    return (times[len(times) // 2] * 1e6,
+            times[min(len(times) - 1, int(len(times) * 0.99))] * 1e6)
+
+
+def _measure(func, phrases, repeat):
+    from ovos_bus_client import Message
+    times = list()
+    for _ in range(repeat):
+        for phrase in phrases:
+            # Found by `dig_for_message`, as when handling a real query
+            message = Message("question:query", {"phrase": phrase})
+            start = perf_counter()
+            func(phrase)
+            times.append(perf_counter() - start)
+    return _percentiles(times)
+
+
+def _legacy_callback(skill, callback, message):
+    """
+    Callback data as sent before it was reduced to a handle
+    """
+    rows = skill._resolve_results(callback)
+    return {"user": callback["user"], "message": message.serialize(),
+            "results": [list(r) for r in rows] if rows else None}
+
+
+def _round_trip(callback, repeat=100):
+    """
+    Time serializing and parsing the callback data for the bus messages to
+    and from the common query skill
+    """
+    from ovos_bus_client import Message
+    start = perf_counter()
+    for _ in range(repeat):
+        for msg_type in ("question:query.response", "question:action"):
+            serialized = Message(msg_type, {"callback_data": callback}) \
+                .serialize()
+            Message.deserialize(serialized)
+    return (perf_counter() - start) / repeat, len(serialized)
+
+
+def payload_sizes(skill):
+    from ovos_bus_client import Message
+    from neon_utils.user_utils import get_default_user_config
+    for phrase in MATCHING:
+        message = Message("question:query", {"phrase": phrase},
+                          {"user_profiles": [get_default_user_config()]})
+        callback = skill.CQS_match_query_phrase(phrase)[3]
+        legacy = _legacy_callback(skill, callback, message)
+        legacy_time, legacy_size = _round_trip(legacy)
+        handle_time, handle_size = _round_trip(callback)
+        print(f"{phrase} ({len(callback['rows'] or [])} rows): "
+              f"{legacy_size} -> {handle_size} bytes | round trip "
+              f"{legacy_time * 1e6:.0f}us -> {handle_time * 1e6:.0f}us")
+
+
+def main(repeat=20):
+    skill = loaded_skill()
+
+    def _unfiltered(phrase):
+        skill._answers.clear()
+        return skill._match_query_phrase(phrase)
+
+    def _filtered_once(phrase):
+        skill._rejected.clear()
+        return skill.CQS_match_query_phrase(phrase)
+
+    results = {
+        "matching (unfiltered)": _measure(_unfiltered, MATCHING, repeat),
+        "matching": _measure(skill.CQS_match_query_phrase, MATCHING, repeat),
+        "not matching (unfiltered)": _measure(_unfiltered, NOT_MATCHING,
+                                              repeat),
+        "not matching (first seen)": _measure(_filtered_once, NOT_MATCHING,
+                                              repeat),
+        "not matching (repeated)": _measure(skill.CQS_match_query_phrase,
+                                            NOT_MATCHING, repeat)}
+    for label, (p50, p99) in results.items():
+        print(f"{label}: p50 {p50:.0f}us | p99 {p99:.0f}us")
+    payload_sizes(skill)
+    skill.shutdown()
+
+
+if __name__ == "__main__":
+    main()
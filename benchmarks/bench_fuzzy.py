@@ -0,0 +1,72 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Development System
+#
+# Copyright 2008-2025 Neongecko.com Inc. | All Rights Reserved
+#
+# Notice of License - Duplicating this Notice of License near the start of any file containing
+# a derivative of this software is a condition of license for this software.
+# Friendly Licensing:
+# No charge, open source royalty free use of the Neon AI software source and object is offered for
+# educational users, noncommercial enthusiasts, Public Benefit Corporations (and LLCs) and
+# Social Purpose Corporations (and LLCs). Developers can contact developers@neon.ai
+# For commercial licensing, distribution of derivative works or redistribution please contact licenses@neon.ai
+# Distributed on an "AS IS” basis without warranties or conditions of any kind, either express or implied.
+# Trademarks of Neongecko: Neon AI(TM), Neon Assist (TM), Neon Communicator(TM), Klat(TM)
+# Authors: Guy Daniels, Daniel McKnight, Regina Bloomstine, Elon Gasper, Richard Leeds
+#
+# Specialized conversational reconveyance options from Conversation Processing Intelligence Corp.
+# US Patents 2008-2021: US7424516, US20140161250, US20140177813, US8638908, US8068604, US8553852, US10530923, US10530924
+# China Patent: CN102017585  -  Europe Patent: EU2156652  -  Patents Pending
+
+"""
+Compare trigram fuzzy ranking with the difflib ranking it replaced.
+Run with `python -m benchmarks.bench_fuzzy` from the repository root.
+"""
+import difflib
+
+from time import perf_counter
+
+from neon_skill_caffeinewiz.fuzzy import FuzzyIndex
+from benchmarks import load_bundled_table, sample_queries, \
+    synthetic_table
+
+# Misspelled drink names both rankings should resolve
+MISSPELLED = ("coka cola", "monstr energy")
+
+
+def _difflib_rank(names, query, limit):
+    return difflib.get_close_matches(query, names, limit, 0.4)
+
+
+def run(label, rows, query_count=200, limit=5):
+    names = [r[0] for r in rows]
+    queries = sample_queries(rows, query_count)
+
+    start = perf_counter()
+    index = FuzzyIndex(names)
+    build_time = perf_counter() - start
+
+    start = perf_counter()
+    for query in queries:
+        index.search(query, limit, 0.4)
+    fuzzy_time = (perf_counter() - start) / len(queries)
+
+    # difflib over the whole table is too slow to run every query at 100k
+    difflib_queries = queries[:max(1, 2000000 // (len(names) * 10))]
+    start = perf_counter()
+    for query in difflib_queries:
+        _difflib_rank(names, query, limit)
+    difflib_time = (perf_counter() - start) / len(difflib_queries)
+
+    print(f"{label}: {len(names)} drinks | index build {build_time * 1000:.1f}"
+          f"ms | trigram {fuzzy_time * 1e6:.0f}us/query | difflib "
+          f"{difflib_time * 1e6:.0f}us/query | speedup "
+          f"{difflib_time / fuzzy_time:.0f}x")
+    for query in MISSPELLED:
+        trigram_best = [names[idx] for idx, _ in index.search(query, 1, 0.4)]
+        print(f"  {query!r}: trigram {trigram_best} | difflib "
+              f"{_difflib_rank(names, query, 1)}")
+
+
+if __name__ == "__main__":
+    run("bundled", load_bundled_table())
+    run("synthetic", synthetic_table(100000))
@@ -0,0 +1,117 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Development System
+#
+# Copyright 2008-2025 Neongecko.com Inc. | All Rights Reserved
+#
+# Notice of License - Duplicating this Notice of License near the start of any file containing
+# a derivative of this software is a condition of license for this software.
+# Friendly Licensing:
+# No charge, open source royalty free use of the Neon AI software source and object is offered for
+# educational users, noncommercial enthusiasts, Public Benefit Corporations (and LLCs) and
+# Social Purpose Corporations (and LLCs). Developers can contact developers@neon.ai
+# For commercial licensing, distribution of derivative works or redistribution please contact licenses@neon.ai
+# Distributed on an "AS IS” basis without warranties or conditions of any kind, either express or implied.
+# Trademarks of Neongecko: Neon AI(TM), Neon Assist (TM), Neon Communicator(TM), Klat(TM)
+# Authors: Guy Daniels, Daniel McKnight, Regina Bloomstine, Elon Gasper, Richard Leeds
+#
+# Specialized conversational reconveyance options from Conversation Processing Intelligence Corp.
+# US Patents 2008-2021: US7424516, US20140161250, US20140177813, US8638908, US8068604, US8553852, US10530923, US10530924
+# China Patent: CN102017585  -  Europe Patent: EU2156652  -  Patents Pending
+
+"""
+Compare parse time and peak memory of the source page parsers against the
+previous BeautifulSoup and `ast.literal_eval` implementations, on the recorded
+fixture pages and on artificially enlarged copies of them. The previous
+implementations need `beautifulsoup4`, which the skill no longer requires but
+is installed with the `test` extra.
+Run with `python -m benchmarks.bench_parsers` from the repository root.
+"""
+import ast
+import tracemalloc
+
+from os.path import dirname, join
+from time import perf_counter
+
+from bs4 import BeautifulSoup
+from neon_utils import web_utils
+
+from neon_skill_caffeinewiz.parsers import parse_caffeine_informer, \
+    parse_caffeine_wiz
+
+FIXTURES = join(dirname(dirname(__file__)), "test", "fixtures")
+
+
+def legacy_caffeine_wiz(page: bytes) -> list:
+    soup = BeautifulSoup(page, "html.parser")
+    table = soup.find('table')
+    if not table:
+        return []
+    return list(web_utils.chunks([i.text.lower().replace("\n", "")
+                                  for i in table.find_all('td')
+                                  if i.text != "\xa0"], 3))
+
+
+def legacy_caffeine_informer(page: bytes) -> list:
+    soup = BeautifulSoup(page, "html.parser")
+    raw_j2 = str(soup.find_all('script', type="text/javascript")[2])
+    new_url = raw_j2[:raw_j2.rfind("function pause") - 6][
+              raw_j2.rfind("tbldata = [") + 11:].lower()
+    return list(ast.literal_eval(web_utils.strip_tags(new_url)))
+
+
+def load_page(name: str) -> bytes:
+    with open(join(FIXTURES, name), 'rb') as f:
+        return f.read()
+
+
+def enlarge_table(page: bytes, factor: int) -> bytes:
+    """
+    Repeat the body rows of the first table `factor` times and append
+    unrelated markup after it, as a stand-in for a larger live page.
+    """
+    start = page.index(b"<tr", page.index(b"</tr>"))
+    end = page.index(b"</table>")
+    filler = b"<div><p>unrelated content</p></div>\n" * (factor * 20)
+    return page[:start] + page[start:end] * factor + page[end:] + filler
+
+
+def enlarge_array(page: bytes, factor: int) -> bytes:
+    """
+    Repeat the rows of the `tbldata` array `factor` times.
+    """
+    start = page.index(b"tbldata = [") + 11
+    end = page.index(b"];", start)
+    return page[:start] + b",".join([page[start:end]] * factor) + page[end:]
+
+
+def _measure(func, page, repeat):
+    start = perf_counter()
+    for _ in range(repeat):
+        result = func(page)
+    elapsed = (perf_counter() - start) / repeat
+    tracemalloc.start()
+    func(page)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+def compare(label, new, old, page, repeat):
+    new_rows, new_time, new_peak = _measure(new, page, repeat)
+    old_rows, old_time, old_peak = _measure(old, page, repeat)
+    assert new_rows == old_rows, f"{label}: output differs"
+    print(f"{label}: {len(page) / 1024:.0f}KiB page, {len(new_rows)} rows | "
+          f"time {old_time * 1000:.2f}ms -> {new_time * 1000:.2f}ms | "
+          f"peak memory {old_peak / 1024:.0f}KiB -> {new_peak / 1024:.0f}KiB")
+
+
+if __name__ == "__main__":
+    wiz = load_page("caffeinewiz.html")
+    compare("caffeinewiz fixture", parse_caffeine_wiz, legacy_caffeine_wiz,
+            wiz, 50)
+    compare("caffeinewiz x50", parse_caffeine_wiz, legacy_caffeine_wiz,
+            enlarge_table(wiz, 50), 3)
+    informer = load_page("caffeineinformer.html")
+    compare("caffeineinformer fixture", parse_caffeine_informer,
+            legacy_caffeine_informer, informer, 50)
+    compare("caffeineinformer x50", parse_caffeine_informer,
+            legacy_caffeine_informer, enlarge_array(informer, 50), 3)
@@ -0,0 +1,81 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Development System
+#
+# Copyright 2008-2025 Neongecko.com Inc. | All Rights Reserved
+#
+# Notice of License - Duplicating this Notice of License near the start of any file containing
+# a derivative of this software is a condition of license for this software.
+# Friendly Licensing:
+# No charge, open source royalty free use of the Neon AI software source and object is offered for
+# educational users, noncommercial enthusiasts, Public Benefit Corporations (and LLCs) and
+# Social Purpose Corporations (and LLCs). Developers can contact developers@neon.ai
+# For commercial licensing, distribution of derivative works or redistribution please contact licenses@neon.ai
+# Distributed on an "AS IS” basis without warranties or conditions of any kind, either express or implied.
+# Trademarks of Neongecko: Neon AI(TM), Neon Assist (TM), Neon Communicator(TM), Klat(TM)
+# Authors: Guy Daniels, Daniel McKnight, Regina Bloomstine, Elon Gasper, Richard Leeds
+#
+# Specialized conversational reconveyance options from Conversation Processing Intelligence Corp.
+# US Patents 2008-2021: US7424516, US20140161250, US20140177813, US8638908, US8068604, US8553852, US10530923, US10530924
+# China Patent: CN102017585  -  Europe Patent: EU2156652  -  Patents Pending
+
+"""
+Measure the cost of applying a refresh to the drink table and index, for an
+unchanged refresh, a small delta and a full rebuild.
+Run with `python -m benchmarks.bench_refresh` from the repository root.
+"""
+import random
+
+from time import perf_counter
+
+from neon_skill_caffeinewiz.index import DrinkIndex
+from neon_skill_caffeinewiz.merge import merge_drink_tables
+from neon_skill_caffeinewiz.store import DrinkStore
+from benchmarks import load_bundled_table, synthetic_table
+
+
+def small_delta(rows, seed: int = 0):
+    """
+    Change, remove and add about 1% of the rows each
+    """
+    rand = random.Random(seed)
+    count = max(1, len(rows) // 100)
+    updated = [list(row) for row in rows]
+    for row in rand.sample(updated, count):
+        row[2] = str(int(float(row[2])) + 1)
+    for row in rand.sample(updated, count):
+        updated.remove(row)
+    updated += [[f"{row[0]} limited edition", row[1], row[2]]
+                for row in rand.sample(rows, count)]
+    return updated
+
+
+def _timed(func):
+    start = perf_counter()
+    result = func()
+    return result, (perf_counter() - start) * 1000
+
+
+def run(label, rows):
+    store = DrinkStore.from_rows(merge_drink_tables(rows))
+    index = DrinkIndex(store)
+
+    def _refresh(new_rows, incremental):
+        new_store = DrinkStore.from_rows(merge_drink_tables(new_rows))
+        delta = store.diff(new_store)
+        if not delta:
+            return delta, index
+        if incremental:
+            return delta, index.apply(new_store)
+        return delta, DrinkIndex(new_store)
+
+    _, unchanged = _timed(lambda: _refresh(rows, True))
+    updated = small_delta(rows)
+    (delta, _), applied = _timed(lambda: _refresh(updated, True))
+    _, rebuilt = _timed(lambda: _refresh(updated, False))
+    print(f"{label}: {len(store)} drinks | unchanged {unchanged:.1f}ms | "
+          f"delta {delta.summary()} applied {applied:.1f}ms, "
+          f"rebuilt {rebuilt:.1f}ms")
+
+
+if __name__ == "__main__":
+    run("bundled", load_bundled_table())
+    run("synthetic 10k", synthetic_table(10000))
@@ -0,0 +1,81 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Development System
+#
+# Copyright 2008-2025 Neongecko.com Inc. | All Rights Reserved
+#
+# Notice of License - Duplicating this Notice of License near the start of any file containing
+# a derivative of this software is a condition of license for this software.
+# Friendly Licensing:
+# No charge, open source royalty free use of the Neon AI software source and object is offered for
+# educational users, noncommercial enthusiasts, Public Benefit Corporations (and LLCs) and
+# Social Purpose Corporations (and LLCs). Developers can contact developers@neon.ai
+# For commercial licensing, distribution of derivative works or redistribution please contact licenses@neon.ai
+# Distributed on an "AS IS” basis without warranties or conditions of any kind, either express or implied.
+# Trademarks of Neongecko: Neon AI(TM), Neon Assist (TM), Neon Communicator(TM), Klat(TM)
+# Authors: Guy Daniels, Daniel McKnight, Regina Bloomstine, Elon Gasper, Richard Leeds
+#
+# Specialized conversational reconveyance options from Conversation Processing Intelligence Corp.
+# US Patents 2008-2021: US7424516, US20140161250, US20140177813, US8638908, US8068604, US8553852, US10530923, US10530924
+# China Patent: CN102017585  -  Europe Patent: EU2156652  -  Patents Pending
+
+"""
+Report skill load time with no cached data (cold), fresh cached data (warm)
+and expired cached data (stale). Sources are replaced by a stub that takes
+several seconds to fail, to show loading does not wait for a refresh.
+Run with `python -m benchmarks.bench_startup` from the repository root.
+"""
+import datetime
+
+from os import environ
+from tempfile import mkdtemp
+from time import perf_counter, sleep
+
+SLOW_SOURCE_SECONDS = 5
+
+
+def _slow_fetch(self, name, url, deadline=5):
+    from neon_skill_caffeinewiz.fetch import FetchResult
+    sleep(SLOW_SOURCE_SECONDS)
+    return FetchResult(name, error="Benchmark source stub")
+
+
+def _load_skill(bus):
+    from neon_skill_caffeinewiz import CaffeineWizSkill
+    start = perf_counter()
+    skill = CaffeineWizSkill(skill_id="skill-caffeinewiz.benchmark", bus=bus)
+    elapsed = perf_counter() - start
+    return skill, elapsed
+
+
+def main():
+    test_fs = mkdtemp()
+    environ["XDG_DATA_HOME"] = f"{test_fs}/data"
+    environ["XDG_CONFIG_HOME"] = f"{test_fs}/config"
+    from neon_skill_caffeinewiz.fetch import SourceFetcher
+    SourceFetcher.fetch = _slow_fetch
+
+    from ovos_utils.fakebus import FakeBus
+    bus = FakeBus()
+
+    skill, cold = _load_skill(bus)
+    ready = skill._drink_in_database("coffee")
+    # Persist data as a completed refresh would
+    skill._get_new_info()
+    skill.shutdown()
+
+    skill, warm = _load_skill(bus)
+    skill.shutdown()
+
+    yesterday = datetime.datetime.now() - datetime.timedelta(days=1)
+    skill._write_snapshot(yesterday)
+    skill.settings["lastUpdate"] = str(yesterday)
+    skill.settings.store()
+    skill, stale = _load_skill(bus)
+    skill.shutdown()
+
+    print(f"cold {cold * 1000:.0f}ms (answers immediately: {ready}) | "
+          f"warm {warm * 1000:.0f}ms | stale {stale * 1000:.0f}ms | "
+          f"each source stub takes {SLOW_SOURCE_SECONDS}s")
+
+
+if __name__ == "__main__":
+    main()
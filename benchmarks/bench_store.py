@@ -0,0 +1,69 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Development System
+#
+# Copyright 2008-2025 Neongecko.com Inc. | All Rights Reserved
+#
+# Notice of License - Duplicating this Notice of License near the start of any file containing
+# a derivative of this software is a condition of license for this software.
+# Friendly Licensing:
+# No charge, open source royalty free use of the Neon AI software source and object is offered for
+# educational users, noncommercial enthusiasts, Public Benefit Corporations (and LLCs) and
+# Social Purpose Corporations (and LLCs). Developers can contact developers@neon.ai
+# For commercial licensing, distribution of derivative works or redistribution please contact licenses@neon.ai
+# Distributed on an "AS IS” basis without warranties or conditions of any kind, either express or implied.
+# Trademarks of Neongecko: Neon AI(TM), Neon Assist (TM), Neon Communicator(TM), Klat(TM)
+# Authors: Guy Daniels, Daniel McKnight, Regina Bloomstine, Elon Gasper, Richard Leeds
+#
+# Specialized conversational reconveyance options from Conversation Processing Intelligence Corp.
+# US Patents 2008-2021: US7424516, US20140161250, US20140177813, US8638908, US8068604, US8553852, US10530923, US10530924
+# China Patent: CN102017585  -  Europe Patent: EU2156652  -  Patents Pending
+
+"""
+Measure the memory used by a DrinkStore compared to list-of-string-list rows.
+Run with `python -m benchmarks.bench_store` from the repository root.
+"""
+import tracemalloc
+
+from time import perf_counter
+
+from neon_skill_caffeinewiz.store import DrinkStore
+from benchmarks import load_bundled_table, synthetic_table
+
+
+def _measure(build):
+    tracemalloc.start()
+    obj = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return obj, size
+
+
+def _copy(rows):
+    # New string objects, so they are allocated while tracing
+    return [[c.encode().decode() for c in r] for r in rows]
+
+
+def run(label, rows):
+    rows, list_bytes = _measure(lambda: _copy(rows))
+    _, store_bytes = _measure(lambda: DrinkStore.from_rows(_copy(rows)))
+    store = DrinkStore.from_rows(rows)
+
+    start = perf_counter()
+    for row in rows:
+        float(row[1]), float(row[2])
+    list_time = perf_counter() - start
+    start = perf_counter()
+    volume, caffeine = store.volume, store.caffeine
+    for idx in range(len(store)):
+        volume[idx], caffeine[idx]
+    store_time = perf_counter() - start
+
+    print(f"{label}: {len(rows)} drinks | list rows {list_bytes / 1024:.0f}KiB"
+          f" | DrinkStore {store_bytes / 1024:.0f}KiB (nbytes "
+          f"{store.nbytes / 1024:.0f}KiB) | value access "
+          f"{list_time * 1e9 / len(rows):.0f}ns -> "
+          f"{store_time * 1e9 / len(rows):.0f}ns per row")
+
+
+if __name__ == "__main__":
+    run("bundled", load_bundled_table())
+    run("synthetic", synthetic_table(100000))
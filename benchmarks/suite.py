@@ -0,0 +1,334 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Development System
+#
+# Copyright 2008-2025 Neongecko.com Inc. | All Rights Reserved
+#
+# Notice of License - Duplicating this Notice of License near the start of any file containing
+# a derivative of this software is a condition of license for this software.
+# Friendly Licensing:
+# No charge, open source royalty free use of the Neon AI software source and object is offered for
+# educational users, noncommercial enthusiasts, Public Benefit Corporations (and LLCs) and
+# Social Purpose Corporations (and LLCs). Developers can contact developers@neon.ai
+# For commercial licensing, distribution of derivative works or redistribution please contact licenses@neon.ai
+# Distributed on an "AS IS” basis without warranties or conditions of any kind, either express or implied.
+# Trademarks of Neongecko: Neon AI(TM), Neon Assist (TM), Neon Communicator(TM), Klat(TM)
+# Authors: Guy Daniels, Daniel McKnight, Regina Bloomstine, Elon Gasper, Richard Leeds
+#
+# Specialized conversational reconveyance options from Conversation Processing Intelligence Corp.
+# US Patents 2008-2021: US7424516, US20140161250, US20140177813, US8638908, US8068604, US8553852, US10530923, US10530924
+# China Patent: CN102017585  -  Europe Patent: EU2156652  -  Patents Pending
+
+
+"""
+Offline benchmark suite for drink lookup, dialog generation, refresh and the
+source parsers. Lookups run against the bundled drink table and synthetic
+tables of 10k and 100k drinks, and German and Ukrainian queries against the
+bundled table; parsers run against the recorded source pages
+in `test/fixtures`. Run with `python -m benchmarks.suite` from the
+repository root.
+
+Results are written as JSON and compared with `benchmarks/baseline.json`.
+A case whose median time exceeds its baseline by more than the tolerance is
+reported as a regression and the suite exits with a non-zero status. Timings
+depend on the machine; record a new baseline with `--update-baseline` on the
+machine used for comparisons.
+"""
+import argparse
+import gc
+import json
+import platform
+import sys
+
+from datetime import datetime
+from os.path import dirname, join
+from time import perf_counter
+from typing import Callable, Dict, Iterable, List, Optional
+
+from benchmarks import load_bundled_table, load_fixture, loaded_skill, \
+    publish_rows, sample_queries, synthetic_table
+
+BASELINE = join(dirname(__file__), "baseline.json")
+RESULTS_VERSION = 1
+# Default allowed slowdown relative to the baseline median
+TOLERANCE = 2.0
+# Slowdowns smaller than this are timing noise (microseconds)
+MIN_DELTA_US = 5
+SYNTHETIC_SIZES = (10000, 100000)
+QUERY_COUNT = 100
+# Calls per pass for cases without a list of inputs
+SINGLE_CALLS = 10
+UNRELATED_PHRASES = ["what time is it", "talk to me in french",
+                     "tell me a joke", "what's the weather like today",
+                     "set a timer for 5 minutes", "who are you",
+                     "turn on the lights", "play some music",
+                     "what is one plus one", "how old is the president"]
+# Queries in other supported languages, including drinks that aren't found
+# and unrelated phrases
+LOCALE_PHRASES = {
+    "de-de": ["wie viel Koffein ist in einer Tasse Kaffee",
+              "wie viel Koffein hat Red Bull",
+              "wie viel Koffein ist in Cola und Red Bull",
+              "wie viel Koffein ist im Eistee",
+              "wie viel Koffein ist in grünem Tee", "wie spät ist es"],
+    "uk-ua": ["скільки кофеїну в каві", "скільки кофеїну в red bull",
+              "скільки кофеїну в чаї",
+              "скільки кофеїну в кока-колі і red bull",
+              "скільки кофеїну в еспресо", "котра година"]}
+
+
+def _time_calls(func: Callable, inputs: Iterable, passes: int,
+                setup: Optional[Callable] = None) -> List[float]:
+    """
+    Time each call of `func` for every input, after one untimed pass.
+    Garbage collection is paused while timing, as `timeit` does.
+    """
+    from ovos_bus_client import Message
+    inputs = list(inputs)
+    times = list()
+    gc.collect()
+    gc.disable()
+    try:
+        for timed in [False] + [True] * passes:
+            if setup:
+                setup()
+            for item in inputs:
+                # Found by `dig_for_message`, as when handling a real request
+                message = Message("benchmark", {"utterance": str(item)})
+                start = perf_counter()
+                func(item)
+                if timed:
+                    times.append(perf_counter() - start)
+    finally:
+        gc.enable()
+    return times
+
+
+def _summary(times: List[float]) -> dict:
+    times = sorted(times)
+    return {"calls": len(times),
+            "p50_us": round(times[len(times) // 2] * 1e6, 1),
+            "p99_us": round(times[min(len(times) - 1,
+                                      int(len(times) * 0.99))] * 1e6, 1),
+            "mean_us": round(sum(times) / len(times) * 1e6, 1)}
+
+
+def _uncached(skill, func: Callable) -> Callable:
+    """
+    Wrap `func` so skill answer and rejection caches are bypassed
+    """
+    def _call(item):
+        skill._answers.clear()
+        skill._rejected.clear()
+        return func(item)
+    return _call
+
+
+def source_cases(skill, passes: int) -> Dict[str, dict]:
+    """
+    Benchmark the source parsers and a refresh from recorded pages
+    """
+    from neon_skill_caffeinewiz.parsers import parse_caffeine_informer, \
+        parse_caffeine_wiz
+    wiz = load_fixture("caffeinewiz.html")
+    informer = load_fixture("caffeineinformer.html")
+    queries = sample_queries(load_bundled_table(), QUERY_COUNT)
+    results = {
+        "parse_caffeine_wiz": _time_calls(parse_caffeine_wiz,
+                                          [wiz] * SINGLE_CALLS, passes),
+        "parse_caffeine_informer": _time_calls(
+            parse_caffeine_informer, [informer] * SINGLE_CALLS, passes),
+        "get_new_info": _time_calls(
+            lambda _: skill._get_new_info(force=True),
+            range(SINGLE_CALLS), passes),
+        "clean_drink_name": _time_calls(skill._clean_drink_name, queries,
+                                        passes)}
+    return {f"sources/{name}": _summary(times)
+            for name, times in results.items()}
+
+
+def locale_cases(skill, passes: int) -> Dict[str, dict]:
+    """
+    Benchmark query extraction and CQS matching in every language of
+    `LOCALE_PHRASES`, against the published rows
+    """
+    from ovos_bus_client import Message
+    results = dict()
+    for lang, phrases in LOCALE_PHRASES.items():
+        extractor = skill._get_extractor(lang)
+        message = Message("benchmark", {}, {"lang": lang})
+
+        def _match(phrase, lang=lang, message=message):
+            return skill._match_query_phrase(phrase, message, lang)
+        results[f"{lang}/extract_query"] = _time_calls(
+            extractor.extract, phrases * SINGLE_CALLS, passes)
+        results[f"{lang}/CQS_match_query_phrase"] = _time_calls(
+            _uncached(skill, _match), phrases * SINGLE_CALLS, passes)
+    return {f"locales/{name}": _summary(times)
+            for name, times in results.items()}
+
+
+def lookup_cases(skill, label: str, rows: List[List[str]],
+                 passes: int) -> Dict[str, dict]:
+    """
+    Benchmark lookups and dialog generation after publishing `rows`
+    """
+    from neon_skill_caffeinewiz.models import CaffeineRequest
+    publish_rows(skill, rows)
+    queries = sample_queries(rows, QUERY_COUNT)
+    requests = [CaffeineRequest(drink=q) for q in queries]
+    phrases = [f"how much caffeine is in {q}" for q in queries]
+    # Two listed drinks; scan cost should not grow with the table
+    lists = [f"{a} and {b}" for a, b in
+             zip(sample_queries(rows, QUERY_COUNT, 1)[::2],
+                 sample_queries(rows, QUERY_COUNT, 2)[::2])]
+
+    def _dialog(drink):
+        return skill._generate_drink_dialog(drink, None)
+
+    def _info(request):
+        try:
+            return skill.get_caffeine_info(request)
+        except ValueError:
+            return None
+
+    # Alternate between the published rows and a copy with one changed
+    # value, so every call applies a one row delta
+    changed = [list(r) for r in rows]
+    changed[0][2] = str(float(changed[0][2]) + 1)
+    versions = [changed, rows]
+
+    def _add_more(i):
+        skill._add_more_caffeine_data(versions[i % 2], list())
+
+    results = {
+        "drink_in_database": _time_calls(skill._drink_in_database, queries,
+                                         passes),
+        "get_matching_drinks": _time_calls(skill._get_matching_drinks,
+                                           queries, passes),
+        "generate_drink_dialog": _time_calls(_uncached(skill, _dialog),
+                                             queries, passes),
+        "generate_drink_dialog_cached": _time_calls(_dialog, queries,
+                                                    passes),
+        "get_caffeine_info": _time_calls(_info, requests, passes),
+        "drink_mentions": _time_calls(
+            lambda drinks: skill._data.index.mentions(drinks), lists, passes),
+        "CQS_match_query_phrase": _time_calls(
+            _uncached(skill, skill.CQS_match_query_phrase), phrases, passes),
+        "CQS_match_query_phrase_unrelated": _time_calls(
+            _uncached(skill, skill.CQS_match_query_phrase),
+            UNRELATED_PHRASES, passes),
+        "add_more_caffeine_data": _time_calls(
+            _add_more, range(2 if len(rows) > 10000 else SINGLE_CALLS),
+            passes)}
+    return {f"{label}/{name}": _summary(times)
+            for name, times in results.items()}
+
+
+def run(passes: int = 3, sizes: Iterable[int] = SYNTHETIC_SIZES) -> dict:
+    """
+    Run every benchmark case
+    :param passes: number of timed passes over each case's inputs
+    :param sizes: synthetic table sizes to benchmark
+    :return: dict with run metadata and per-case results
+    """
+    from ovos_utils.log import LOG
+    skill = loaded_skill({"caffeinewiz": load_fixture("caffeinewiz.html"),
+                          "caffeineinformer":
+                              load_fixture("caffeineinformer.html")})
+    # Log calls still cost the same, but don't flood the report
+    LOG.set_level("ERROR")
+    try:
+        results = source_cases(skill, passes)
+        results.update(lookup_cases(skill, "bundled", load_bundled_table(),
+                                    passes))
+        results.update(locale_cases(skill, passes))
+        for size in sizes:
+            results.update(lookup_cases(skill, f"synthetic-{size}",
+                                        synthetic_table(size), passes))
+    finally:
+        skill.shutdown()
+    return {"version": RESULTS_VERSION,
+            "created": datetime.now().isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "passes": passes,
+            "results": results}
+
+
+def compare(results: dict, baseline: dict,
+            tolerance: float = TOLERANCE) -> List[str]:
+    """
+    Compare median times with a baseline. Cases missing from the baseline
+    are reported too, so new cases aren't added without one.
+    :param results: output of `run`
+    :param baseline: output of an earlier `run`
+    :param tolerance: allowed ratio of new to baseline median time
+    :return: list of regression descriptions (empty if none)
+    """
+    regressions = list()
+    for case, result in sorted(results["results"].items()):
+        base = baseline.get("results", dict()).get(case)
+        if not base:
+            line = f"{case}: {result['p50_us']}us (no baseline)"
+            regressions.append(line)
+            print(line)
+            continue
+        ratio = result["p50_us"] / base["p50_us"] if base["p50_us"] else 1
+        line = f"{case}: {base['p50_us']}us -> {result['p50_us']}us " \
+               f"({ratio:.2f}x)"
+        if ratio > tolerance and \
+                result["p50_us"] - base["p50_us"] > MIN_DELTA_US:
+            regressions.append(line)
+            line = f"{line} REGRESSION"
+        print(line)
+    return regressions
+
+
+def main(args: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--output", default="benchmark_results.json",
+                        help="path to write JSON results to")
+    parser.add_argument("--baseline", default=BASELINE,
+                        help="JSON results to compare with")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="write results to the baseline and skip "
+                             "comparison")
+    parser.add_argument("--tolerance", type=float, default=TOLERANCE,
+                        help="allowed ratio of new to baseline median time")
+    parser.add_argument("--passes", type=int, default=3,
+                        help="timed passes over each case's inputs")
+    parser.add_argument("--sizes", type=int, nargs="*",
+                        default=list(SYNTHETIC_SIZES),
+                        help="synthetic table sizes")
+    args = parser.parse_args(args)
+
+    results = run(args.passes, args.sizes)
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+    if args.update_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(results, f, indent=2)
+            f.write("\n")
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    try:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+    except FileNotFoundError:
+        print(f"No baseline at {args.baseline}; "
+              f"record one with --update-baseline")
+        return 1
+    regressions = compare(results, baseline, args.tolerance)
+    if regressions:
+        print(f"\n{len(regressions)} case(s) slower than {args.tolerance}x "
+              f"the baseline or without a baseline:", file=sys.stderr)
+        for line in regressions:
+            print(f"  {line}", file=sys.stderr)
+        return 1
+    print(f"\nNo regressions against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
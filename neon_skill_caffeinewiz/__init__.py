@@ -26,99 +26,112 @@
 # NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
 # SOFTWARE,  EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-import ast
 import datetime
-import difflib
 import os.path
-import pickle
-import urllib.request
 
-from threading import Event, Thread
-from typing import Optional, Tuple
-from bs4 import BeautifulSoup
+from concurrent.futures import Future, TimeoutError
+from itertools import chain
+from typing import Dict, List, Optional, Tuple
 from time import sleep
-from lingua_franca import load_language
+from lingua_franca import get_supported_langs, load_language
 from ovos_bus_client import Message
 from ovos_bus_client.message import dig_for_message
+from ovos_bus_client.util import get_message_lang
 from ovos_utils import classproperty
 from ovos_utils.log import LOG
 from ovos_utils.process_utils import RuntimeRequirements
 from neon_utils.user_utils import get_user_prefs, get_message_user
 from ovos_workshop.skills.common_query_skill import \
     CQSMatchLevel, CommonQuerySkill
-from neon_utils import web_utils
 from ovos_workshop.decorators import intent_handler, skill_api_method
 from ovos_workshop.intents import IntentBuilder
-from lingua_franca.parse import normalize
+from ovos_workshop.resource_files import SkillResources
 
+from neon_skill_caffeinewiz.answers import NO_ANSWER, \
+    REJECTED_CACHE_SIZE, Answer, AnswerCache
+from neon_skill_caffeinewiz.cleaner import DrinkNameCleaner
+from neon_skill_caffeinewiz.data import DrinkData
+from neon_skill_caffeinewiz.extractor import QueryExtractor
+from neon_skill_caffeinewiz.fetch import SourceFetcher
+from neon_skill_caffeinewiz.index import DrinkIndex, DrinkMention, \
+    MatchResult
+from neon_skill_caffeinewiz.metrics import Metrics
+from neon_skill_caffeinewiz.names import NameCache
+from neon_skill_caffeinewiz.prefilter import PhraseFilter
+from neon_skill_caffeinewiz.providers import CaffeineInformerProvider, \
+    CaffeineWizProvider, DrinkProvider, LocalFileProvider, MemoryProvider, \
+    ProviderAggregator, ProviderResult
+from neon_skill_caffeinewiz.scheduler import RefreshScheduler
+from neon_skill_caffeinewiz.snapshot import Snapshot, SnapshotError, \
+    load_snapshot, write_snapshot
+from neon_skill_caffeinewiz.store import DrinkRecord, DrinkStore, Source, \
+    StoreDelta
 from neon_skill_caffeinewiz.models import CaffeineInformation, CaffeineRequest, CaffeineResponse
 
 
+# Default seconds between data updates
 TIME_TO_CHECK = 3600
+EXTRA_DRINKS = (('rocket chocolate', '.4', '150'),)
+SNAPSHOT_FILE = "caffeine_snapshot.bin"
+REFRESH_EVENT = "CaffeineWizRefresh"
+NAME_CACHE_FILE = "caffeine_names.json"
+# Language of the drink names published by the data sources
+DATA_LANG = "en"
+# Seconds allowed for fetching each source
+SOURCE_DEADLINE = 15
 
 
 class CaffeineWizSkill(CommonQuerySkill):
     def __init__(self, **kwargs):
-        self.translate_drinks = {
-            'pepsi': 'pepsi cola',
-            # 'coke 0': 'coke zero',
-            'coke': 'coca-cola classic',
-            'coca-cola': 'coca-cola classic',
-            'coca cola': 'coca-cola classic',
-            'starbucks blonde': 'starbucks coffee blonde roast',
-            'starbucks blond': 'starbucks coffee blonde roast',
-            'diet cherry coke': 'diet cherry coca-cola',
-            "and w root beer": "a&w root beer",
-            "mcdonald's coffee": "mcdonalds coffee",
-            "okay energy drink": "ok energy drink",
-            "vitamin water energy drink": "vitaminwater energy drink",
-            # "7 11 energy shot": "7-eleven energy shot",
-            # "7 up": "7-up",
-            # "amp energy 0": "amp energy zero",
-            "all day energy shot": "allday energy shot",
-            "blue energy drinks": "blu energy drinks",
-            "blue frog energy drink": "blu frog energy drink"
-            }
-
         self.default_intent_timeout = 60
-        self.from_caffeine_wiz = list()
-        self.from_caffeine_informer = list()
-        self._update_event = Event()
+        # Current DrinkData, replaced as a whole when the data changes
+        self._data = DrinkData.empty()
+        self._snapshot: Optional[Snapshot] = None
+        self._fetcher = SourceFetcher()
+        self._answers = AnswerCache()
+        self._rejected = AnswerCache(REJECTED_CACHE_SIZE)
+        self._phrase_filter: Optional[tuple] = None
+        # Resource vocabulary of the phrase filter, loaded once
+        self._filter_vocab: Optional[List[str]] = None
+        # lang -> (generation, DrinkNameCleaner)
+        self._cleaners: Dict[str, Tuple[int, DrinkNameCleaner]] = dict()
+        # lang -> QueryExtractor, compiled once per language
+        self._extractors: Dict[str, QueryExtractor] = dict()
+        self._metrics = Metrics()
+        # Providers added with `add_provider`, kept when settings change
+        self._added_providers: List[DrinkProvider] = list()
         CommonQuerySkill.__init__(self, **kwargs)
+        self._name_cache = NameCache(
+            os.path.join(self.file_system.path, NAME_CACHE_FILE))
+        self._providers = self._build_providers()
+        for lang in self._resource_langs:
+            self._get_extractor(lang)
+        self._metrics.enabled = self.metrics_enabled
+        self._metrics.add_gauge("drinks", lambda: len(self._data.table))
+        self._metrics.add_gauge("generation", lambda: self._data.generation)
+        self._metrics.add_gauge("snapshot_age_s", self._snapshot_age)
+        self._metrics.add_gauge("answer_cache_size", lambda: len(self._answers))
+        self.add_event("caffeinewiz.metrics", self._handle_metrics_request)
 
         goodbye_intent = IntentBuilder("CaffeineContentGoodbyeIntent")\
             .require("goodbye").build()
         self.register_intent(goodbye_intent, self.handle_goodbye_intent)
         self.disable_intent('CaffeineContentGoodbyeIntent')
 
-        tdelta = datetime.datetime.now() - self.last_updated if \
-            self.last_updated else datetime.timedelta(hours=1.1)
-        # if more than one hour, calculate and fetch new data again:
-        if any((tdelta.total_seconds() > TIME_TO_CHECK,
-                not self.file_system.exists(
-                    'drinkList_from_caffeine_informer.txt'),
-                not self.file_system.exists(
-                    'drinkList_from_caffeine_wiz.txt'))):
-            LOG.info("Updating Caffeine data")
-            # starting a separate process because this might take some time
-            Thread(target=self._get_new_info, daemon=True).start()
+        # Answer from the last persisted (or bundled) data right away and
+        # refresh in the background if that data is stale
+        self._load_cached_data()
+        self._refresh = RefreshScheduler(self.update_interval,
+                                         on_complete=self._schedule_refresh)
+        self._refresh.last_success = self.last_updated
+        self.settings_change_callback = self._on_settings_changed
+        if self._snapshot is None or not self.last_updated or \
+                self._refresh.schedule() <= datetime.datetime.now():
+            LOG.info("Updating Caffeine data in the background")
+            self._refresh_data()
         else:
-            self._update_event.set()
             LOG.info("Using cached caffeine data")
-            # Open cached results from the appropriate files:
-            with self.file_system.open('drinkList_from_caffeine_wiz.txt',
-                                       'rb') as from_caffeine_wiz_file:
-                self.from_caffeine_wiz = pickle.load(from_caffeine_wiz_file)
-
-            with self.file_system.open('drinkList_from_caffeine_informer.txt',
-                                       'rb') as from_caffeine_informer_file:
-                self.from_caffeine_informer = \
-                    pickle.load(from_caffeine_informer_file)
-            # combine them as in get_new_info and add rocket chocolate:
-            self._add_more_caffeine_data()
-
-        # TODO: Below troubleshooting intent test failures
-        self._update_event.wait()
+            self._schedule_refresh()
 
     @classproperty
     def runtime_requirements(self):
@@ -134,10 +147,89 @@ class CaffeineWizSkill(CommonQuerySkill):
 
     @property
     def last_updated(self) -> Optional[datetime.datetime]:
+        # The snapshot is only rewritten when the data changes
+        updated = [self._snapshot.created] if self._snapshot else []
         if self.settings.get("lastUpdate"):
-            return datetime.datetime.strptime(self.settings["lastUpdate"],
-                                              '%Y-%m-%d %H:%M:%S.%f')
-        return None
+            updated.append(datetime.datetime.strptime(
+                self.settings["lastUpdate"], '%Y-%m-%d %H:%M:%S.%f'))
+        return max(updated) if updated else None
+
+    @property
+    def update_interval(self) -> float:
+        """
+        Seconds between scheduled data updates
+        """
+        try:
+            return float(self.settings.get("updateInterval")) * 60
+        except (TypeError, ValueError):
+            return TIME_TO_CHECK
+
+    @property
+    def source_timeout(self) -> float:
+        """
+        Seconds allowed for reading each data provider
+        """
+        try:
+            return float(self.settings.get("sourceTimeout")) or \
+                SOURCE_DEADLINE
+        except (TypeError, ValueError):
+            return SOURCE_DEADLINE
+
+    @property
+    def local_sources(self) -> List[str]:
+        """
+        Paths of local CSV or JSON drink files to read
+        """
+        return [path.strip() for path in
+                str(self.settings.get("localSources") or "").split(",")
+                if path.strip()]
+
+    @property
+    def metrics_enabled(self) -> bool:
+        """
+        True if latency and counter metrics should be recorded
+        """
+        # Settings synced from a web UI may store booleans as strings
+        return str(self.settings.get("enableMetrics", False)).lower() == \
+            "true"
+
+    @property
+    def speak_total(self) -> bool:
+        """
+        True if the total caffeine is spoken after answering for several
+        drinks
+        """
+        return self._setting_enabled("speakTotalCaffeine")
+
+    @property
+    def translate_drinks(self) -> Dict[str, str]:
+        """
+        Spoken drink names replaced before lookup in the default language,
+        as listed in its `drink_alias.value` resource
+        """
+        return self._get_cleaner(self._get_message_lang(None)).aliases
+
+    @property
+    def _resource_langs(self) -> List[str]:
+        """
+        Languages this skill provides resources for
+        """
+        return sorted(os.listdir(os.path.join(self.res_dir, "locale")))
+
+    @property
+    def _name_langs(self) -> List[str]:
+        """
+        Languages drink names are normalized in: the language of the data
+        sources, then each language this skill provides that lingua_franca
+        can normalize
+        """
+        langs = [DATA_LANG]
+        supported = get_supported_langs()
+        for lang in self._resource_langs:
+            code = lang.split('-')[0]
+            if code in supported and code not in langs:
+                langs.append(code)
+        return langs
 
     @property
     def ww_enabled(self):
@@ -149,62 +241,187 @@ class CaffeineWizSkill(CommonQuerySkill):
             return True
         return False
 
+    @skill_api_method
+    def get_refresh_status(self) -> dict:
+        """Get the data update schedule, the state of each source and the
+        configuration of each data provider."""
+        return {**self._refresh.status(),
+                "providers": self._providers.status()}
+
+    @skill_api_method
+    def get_metrics(self) -> dict:
+        """Get per-stage latency histograms, counters and data gauges."""
+        return self._metrics.snapshot()
+
+    @skill_api_method
+    def get_answer_cache_stats(self) -> dict:
+        """Get the size and hit/miss counters of the spoken answer cache and
+        of the cache of phrases with no answer."""
+        return {"answers": self._answers.stats(),
+                "rejected": self._rejected.stats()}
+
     @skill_api_method
     def get_caffeine_info(self, request: CaffeineRequest) -> CaffeineResponse:
-        """Get the caffeine content of a given drink."""
-        if not self._update_event.is_set():
-            LOG.warning("Waiting for update to complete")
-            self._update_event.wait(10)
-        drink = self.translate_drinks.get(request.drink) or request.drink
-        if not self._drink_in_database(drink):
+        """Get the caffeine content of a given drink. If the request names
+        several known drinks (i.e. "coke and red bull"), `drinks` holds the
+        best match of each; `total` adds their total caffeine."""
+        self._metrics.increment("api.queries")
+        lang = self._get_message_lang(None)
+        drink = self._clean_drink_name(request.drink, lang) or request.drink
+        mentions = self._find_drinks(drink, lang)
+        if mentions:
+            self._metrics.increment("lookup.multi")
+            return self._build_drinks_response(mentions, total=request.total)
+        with self._metrics.timer("lookup"):
+            match = self._match_drink(drink)
+        if not match:
+            self._metrics.increment("lookup.misses")
             raise ValueError(f"No data for drink: {request.drink}")
-        results = self._get_matching_drinks(drink)
-        drinks = []
-        for result in results:
-            formatted_imperial = f"{result[2]}mg/{result[1]}oz"
-            metric_mg, metric_vol, metric_unit = self.convert_metric(float(result[1]),
-                                                                     float(result[2]))
-            if metric_unit == 'word_liter':
-                metric_vol = 1000
-            else:
-                metric_vol = int(metric_vol)
-            formatted_metric = f"{metric_mg}mg/{metric_vol}mL"
-            drinks.append(CaffeineInformation(name=result[0],
-                                              caffeine_mg=float(result[2]),
-                                              volume=float(result[1]),
-                                              formatted_imperial=formatted_imperial,
-                                              formatted_metric=formatted_metric,
-                                              source="caffeinewiz"))
-        return CaffeineResponse(best_match=drinks[0], alternatives=drinks[1:])
+        self._metrics.increment("lookup.hits")
+        return self._build_caffeine_response(match, total=request.total)
+
+    @skill_api_method
+    def get_caffeine_info_batch(self, requests: List[CaffeineRequest]) -> \
+            List[CaffeineResponse]:
+        """Get the caffeine content of each drink in a list of requests.
+        Responses are returned in request order; drinks that can't be found
+        get a response with `error` set instead of raising."""
+        # Resolve every item against the same index, even if a refresh
+        # completes while this batch is being handled
+        data = self._data
+        lang = self._get_message_lang(None)
+        cleaner = self._get_cleaner(lang, data)
+        resolved = dict()
+        info_cache = dict()
+        responses = list()
+        self._metrics.increment("api.batch_queries", len(requests))
+        for request in requests:
+            try:
+                if isinstance(request, dict):
+                    request = CaffeineRequest(**request)
+                drink = cleaner.clean(request.drink) or request.drink
+                key = (drink, request.total)
+                if key not in resolved:
+                    mentions = self._find_drinks(drink, lang, data)
+                    if mentions:
+                        self._metrics.increment("lookup.multi")
+                        resolved[key] = self._build_drinks_response(
+                            mentions, info_cache, request.total)
+                    else:
+                        with self._metrics.timer("lookup"):
+                            match = data.index.find(drink)
+                        self._metrics.increment("lookup.hits" if match else
+                                                "lookup.misses")
+                        resolved[key] = self._build_caffeine_response(
+                            match, info_cache, request.total) \
+                            if match else None
+                response = resolved[key] or CaffeineResponse(
+                    error=f"No data for drink: {request.drink}")
+            except Exception as e:
+                LOG.error(f"Failed to handle batch item {request}: {e}")
+                response = CaffeineResponse(error=f"Invalid request: {e}")
+            responses.append(response)
+        return responses
+
+    @staticmethod
+    def _caffeine_information(result: DrinkRecord, info_cache: dict) -> \
+            CaffeineInformation:
+        """
+        Get the API representation of a drink row
+        :param result: row of the drink table
+        :param info_cache: dict of row index to CaffeineInformation, shared
+            between calls that use the same drink table
+        :return: CaffeineInformation for `result`
+        """
+        if result.index not in info_cache:
+            formatted_imperial = \
+                f"{result.caffeine:g}mg/{result.volume:g}oz"
+            formatted_metric = \
+                f"{result.metric[0]}mg/{result.metric_ml}mL"
+            info_cache[result.index] = CaffeineInformation(
+                name=result.name, caffeine_mg=result.caffeine,
+                volume=result.volume,
+                formatted_imperial=formatted_imperial,
+                formatted_metric=formatted_metric,
+                source=result.source.label)
+        return info_cache[result.index]
+
+    @classmethod
+    def _build_caffeine_response(cls, match: MatchResult,
+                                 info_cache: Optional[dict] = None,
+                                 total: bool = False) -> CaffeineResponse:
+        """
+        Build an API response from a non-empty match result
+        :param match: result of a drink lookup
+        :param info_cache: optional dict of row index to CaffeineInformation,
+            shared between calls that use the same drink table
+        :param total: if True, include the caffeine of the best match as
+            the total
+        :return: CaffeineResponse with the best match and alternatives
+        """
+        info_cache = dict() if info_cache is None else info_cache
+        drinks = [cls._caffeine_information(result, info_cache)
+                  for result in match.rows]
+        return CaffeineResponse(
+            best_match=drinks[0], alternatives=drinks[1:],
+            total_caffeine_mg=drinks[0].caffeine_mg if total else None)
+
+    @classmethod
+    def _build_drinks_response(cls, mentions: List[DrinkMention],
+                               info_cache: Optional[dict] = None,
+                               total: bool = False) -> CaffeineResponse:
+        """
+        Build an API response for a request naming several drinks
+        :param mentions: drinks found in the request
+        :param info_cache: optional dict of row index to CaffeineInformation,
+            shared between calls that use the same drink table
+        :param total: if True, include the total caffeine of the drinks
+        :return: CaffeineResponse with the first drink as the best match
+            and every drink in `drinks`
+        """
+        info_cache = dict() if info_cache is None else info_cache
+        drinks = [cls._caffeine_information(mention.row, info_cache)
+                  for mention in mentions]
+        return CaffeineResponse(
+            best_match=drinks[0], drinks=drinks,
+            total_caffeine_mg=sum(d.caffeine_mg for d in drinks)
+            if total else None)
 
     @intent_handler(IntentBuilder("CaffeineUpdate").require("update_caffeine"))
     def handle_caffeine_update(self, message):
         self.speak_dialog("updating")
-        t = Thread(target=self._get_new_info, kwargs={"reply": True},
-                   daemon=True)
-        t.start()
-        if not self._update_event.wait(30):
+        try:
+            success = self._refresh_data(force=True).result(30)
+        except TimeoutError:
             LOG.error("Timeout waiting for update")
+            return
+        except Exception as e:
+            LOG.exception(e)
+            success = False
+        self.speak_dialog("update_complete" if success else "update_error")
 
     @intent_handler(IntentBuilder("CaffeineContentIntent")
                     .require("query_caffeine").require("drink"))
     def handle_caffeine_intent(self, message):
-
-        drink = self._clean_drink_name(message.data.get("drink", None))
+        self._metrics.increment("intent.queries")
+        lang = self._get_message_lang(message)
+        with self._metrics.timer("clean_drink_name"):
+            drink = self._clean_drink_name(message.data.get("drink", None),
+                                           lang)
         if not drink:
             self.speak_dialog("no_drink_heard")
             return
 
-        if not self._update_event.is_set():
-            self.speak_dialog('one_moment')
-            if not self._update_event.wait(30):
-                LOG.error("Update taking more than 30s, clearing event")
-                self._update_event.set()
-        elif get_user_prefs(message)['response_mode'].get('hesitation'):
+        if get_user_prefs(message)['response_mode'].get('hesitation'):
             self.speak_dialog('one_moment')
 
-        if self._drink_in_database(drink):
-            dialog, results = self._generate_drink_dialog(drink, message)
+        mentions = self._find_drinks(drink, lang)
+        if mentions:
+            answer = self._generate_drinks_dialog(mentions, message, lang)
+        else:
+            answer = self._generate_drink_dialog(drink, message, lang)
+        if answer:
+            dialog, results = answer
             if dialog:
                 self.speak(dialog)
             else:
@@ -231,37 +448,114 @@ class CaffeineWizSkill(CommonQuerySkill):
             self.speak_dialog("not_found", {'drink': drink})
 
     def CQS_match_query_phrase(self, phrase: str):
+        metrics = self._metrics
+        metrics.increment("cqs.queries")
+        with metrics.timer("cqs"):
+            # Reject phrases that can't be about a drink before doing any
+            # work; the filter is language independent so `self.lang` isn't
+            # read yet
+            data = self._data
+            if not self._get_phrase_filter(data).accepts(phrase):
+                metrics.increment("cqs.filtered")
+                return None
+            message = dig_for_message()
+            lang = self._get_message_lang(message)
+            key = (phrase, lang)
+            if self._rejected.get(key, data.generation) is not None:
+                metrics.increment("cqs.rejected")
+                return None
+            match = self._match_query_phrase(phrase, message, lang)
+            if match is None:
+                metrics.increment("cqs.no_answer")
+                self._rejected.put(key, data.generation, NO_ANSWER)
+            else:
+                metrics.increment(f"cqs.{match[1].name.lower()}")
+            return match
+
+    def _get_phrase_filter(self, data: DrinkData) -> PhraseFilter:
+        """
+        Get the PhraseFilter for `data`. It is normally built when `data` is
+        published; data set without `_publish` builds it here on first use.
+        """
+        cached = self._phrase_filter
+        if cached and cached[0] == data.generation:
+            return cached[1]
+        phrase_filter = self._build_phrase_filter(data)
+        self._phrase_filter = (data.generation, phrase_filter)
+        return phrase_filter
 
-        message = dig_for_message()
+    def _build_phrase_filter(self, data: DrinkData) -> PhraseFilter:
+        """
+        Build a PhraseFilter over the drink names and indexed aliases of
+        `data`. Caffeine vocabulary and spoken aliases from every language
+        this skill provides are included.
+        """
+        if self._filter_vocab is None:
+            vocab = list()
+            for lang in self._resource_langs:
+                # Spoken aliases may not share a word with the drink they name
+                vocab.extend(self._get_cleaner(lang, data).aliases)
+                try:
+                    vocab.extend(chain(*self.load_lang(
+                        lang=lang).load_vocabulary_file("caffeine")))
+                except FileNotFoundError:
+                    pass
+            self._filter_vocab = vocab
+        return PhraseFilter(chain(data.table.names, data.index.aliases),
+                            self._filter_vocab)
+
+    def _publish(self, data: DrinkData):
+        """
+        Make `data` the current DrinkData. Per-generation lookup structures
+        are built before the swap so the first query is not slowed down.
+        """
+        if data.generation != self._data.generation or \
+                not self._phrase_filter:
+            self._phrase_filter = (data.generation,
+                                   self._build_phrase_filter(data))
+        self._data = data
+
+    def _get_message_lang(self, message: Optional[Message]) -> str:
+        """
+        Get the language of `message` like `self.lang` does, without looking
+        up the current message again
+        """
+        lang = get_message_lang(message) if message else None
+        return (lang or self.core_lang).lower()
+
+    def _match_query_phrase(self, phrase: str,
+                            message: Optional[Message] = None,
+                            lang: Optional[str] = None):
+        message = message or dig_for_message()
+        lang = lang or self._get_message_lang(message)
+        data = self._data
+        with self._metrics.timer("user_prefs"):
+            units = get_user_prefs(message)['units']['measure']
         try:
-            # TODO: Language agnostic parsing here
-            if " of " in phrase:
-                drink = phrase.split(" of ", 1)[1]
-            elif " in " in phrase:
-                drink = phrase.split(" in ", 1)[1]
-            else:
-                drink = phrase
-            drink = self._clean_drink_name(drink)
+            query = self._get_extractor(lang).extract(phrase)
+            with self._metrics.timer("clean_drink_name"):
+                drink = self._clean_drink_name(query.drink or phrase, lang)
             if not drink:
                 LOG.debug("No drink matched")
                 return None
 
-            # If we wait very long, CommonQuery will time out
-            if not self._update_event.wait(5):
-                LOG.warning("CaffeineWiz is updating")
-
-            if self._drink_in_database(drink):
+            mentions = self._find_drinks(drink, lang, data)
+            if mentions:
+                answer = self._generate_drinks_dialog(mentions, message,
+                                                      lang, data, units)
+            else:
+                answer = self._generate_drink_dialog(drink, message, lang,
+                                                     data, units)
+            if answer:
                 try:
-                    to_speak, results = self._generate_drink_dialog(drink, message)
-                    matched_drink = results[0][0]
-                    LOG.debug(matched_drink)
+                    to_speak, results = answer
+                    matched_drink = results[0].name
                     if not to_speak:
                         # No dialog generated
                         return None
-                    if self.voc_match(phrase, "caffeine"):
-                        LOG.info(f"Query is about caffeine ({phrase})")
+                    if query.caffeine:
                         conf = CQSMatchLevel.EXACT
-                    elif matched_drink.lower() in phrase.lower():
+                    elif mentions or matched_drink.lower() in phrase.lower():
                         # If the exact drink name was matched
                         # but caffeine not requested, consider this a general match
                         conf = CQSMatchLevel.GENERAL
@@ -274,32 +568,41 @@ class CaffeineWizSkill(CommonQuerySkill):
                     LOG.error(e)
                     LOG.error(drink)
                     return None
-            elif drink == phrase:
+            elif query.drink is None:
                 LOG.debug("No drink extracted from utterance")
                 return None
             else:
                 LOG.debug(f"No match for: {drink}")
-                if self.voc_match(phrase, "caffeine"):
+                if query.caffeine:
                     conf = CQSMatchLevel.CATEGORY
                     results = None
-                    to_speak = self.dialog_renderer.render("not_found",
-                                                           {"drink": drink})
+                    to_speak = self.load_lang(lang=lang).dialog_renderer\
+                        .render("not_found", {"drink": drink})
                 else:
                     return None
-            LOG.info(f"results={results}, to_speak={to_speak}")
             user = get_message_user(message) if message else 'local'
-            return phrase, conf, to_speak, {"user": user,
-                                         "message": message.serialize() if message
-                                         else None,
-                                         "results": results}
+            # Only a handle to the results is sent over the bus; rows are
+            # resolved again in `CQS_action`
+            callback = {
+                "user": user,
+                "units": units,
+                "drink": drink,
+                "generation": data.generation,
+                "rows": [r.index for r in results] if results else None}
+            if mentions:
+                # Every drink was answered; there are no alternatives
+                callback["drinks"] = [m.key for m in mentions]
+                callback["rows"] = None
+            return phrase, conf, to_speak, callback
         except FileNotFoundError as e:
-            LOG.warning(f"Missing resource for lang: {self.lang} - {e}")
+            LOG.warning(f"Missing resource for lang: {lang} - {e}")
             return None
 
     def CQS_action(self, phrase, data):
-        results = data.get("results")
-        message = Message.deserialize(data.get("message")) if \
-            data.get("message") else None
+        if data.get("drinks"):
+            self.speak_dialog("stay_caffeinated")
+            return
+        results = self._resolve_results(data)
         if results:
             if len(results) == 1:
                 self.speak_dialog("stay_caffeinated")
@@ -307,7 +610,8 @@ class CaffeineWizSkill(CommonQuerySkill):
                 # This will ask infinitely until the user responds
                 if self.ask_yesno("more_drinks") == "yes":
                     LOG.info("YES")
-                    self._speak_alternate_results(message, results)
+                    self._speak_alternate_results(None, results,
+                                                  data.get("units"))
                     self.speak_dialog("provided_by_caffeinewiz")
                 else:
                     LOG.info("NO")
@@ -359,29 +663,164 @@ class CaffeineWizSkill(CommonQuerySkill):
     def stop(self):
         pass
 
-    def _speak_alternate_results(self, message, caff_list=None):
+    def add_provider(self, provider: DrinkProvider) -> Future:
+        """
+        Add a data provider, with a higher priority than the built-in
+        sources, and update the drink data from it in the background
+        :param provider: provider with a name not used by another provider
+        :return: Future resolving to True if the update succeeded
+        :raises ValueError: if the provider name is already used
+        """
+        self._providers.add(provider)
+        self._added_providers.append(provider)
+        return self._refresh_data()
+
+    def _provider_config(self) -> tuple:
+        """
+        Get the settings that determine the configured providers
+        """
+        return (self._setting_enabled("enableCaffeineWiz"),
+                self._setting_enabled("enableCaffeineInformer"),
+                tuple(self.local_sources), self.source_timeout)
+
+    def _setting_enabled(self, key: str) -> bool:
+        # Settings synced from a web UI may store booleans as strings
+        return str(self.settings.get(key, True)).lower() != "false"
+
+    def _build_providers(self) -> ProviderAggregator:
+        """
+        Create the data providers configured in settings. Local files come
+        first, then providers added with `add_provider`, then the built-in
+        sources.
+        """
+        config = self._provider_config()
+        wiz, informer, paths, timeout = config
+        self._built_config = config
+        providers = ProviderAggregator()
+        for provider in chain(
+                (LocalFileProvider(path, timeout=timeout) for path in paths),
+                self._added_providers):
+            try:
+                providers.add(provider)
+            except ValueError as e:
+                LOG.error(e)
+        if wiz:
+            providers.add(CaffeineWizProvider(fetcher=self._fetcher,
+                                              timeout=timeout))
+        providers.add(MemoryProvider(EXTRA_DRINKS, source=Source.SKILL))
+        if informer:
+            providers.add(CaffeineInformerProvider(fetcher=self._fetcher,
+                                                   timeout=timeout))
+        return providers
+
+    def _source_priority(self) -> List[str]:
+        """
+        Get provider names in the order used to resolve duplicate drinks;
+        `preferredSource` selects the built-in source that is preferred
+        """
+        builtin = [Source.CAFFEINEWIZ.label, Source.SKILL.label,
+                   Source.CAFFEINEINFORMER.label]
+        if self.settings.get("preferredSource") == "caffeineinformer":
+            builtin = [Source.CAFFEINEINFORMER.label,
+                       Source.CAFFEINEWIZ.label, Source.SKILL.label]
+        return [name for name in self._providers.names
+                if name not in builtin] + builtin
+
+    def _on_settings_changed(self):
+        self._metrics.enabled = self.metrics_enabled
+        if self._provider_config() != self._built_config:
+            LOG.info("Data providers changed")
+            self._providers = self._build_providers()
+            self._refresh_data()
+        interval = self.update_interval
+        if interval != self._refresh.interval:
+            LOG.info(f"Update interval changed to {interval}s")
+            self._refresh.interval = interval
+            if not self._refresh.running:
+                self._schedule_refresh()
+
+    def _handle_metrics_request(self, message: Message):
+        """
+        Reply to a `caffeinewiz.metrics` request with current metrics
+        """
+        self.bus.emit(message.response(self._metrics.snapshot()))
+
+    def _snapshot_age(self) -> Optional[float]:
+        """
+        Seconds since the loaded drink data was last updated
+        """
+        updated = self.last_updated
+        return (datetime.datetime.now() - updated).total_seconds() \
+            if updated else None
+
+    def _refresh_data(self, force: bool = False) -> Future:
+        """
+        Start a data update in the background, or join the one in progress.
+        The next update is scheduled when it completes.
+        :param force: fetch sources that are backing off after failures
+        :return: Future resolving to True if the update succeeded
+        """
+        return self._refresh.run(self._run_refresh, force)
+
+    def _run_refresh(self, force: bool = False) -> bool:
+        with self._metrics.timer("refresh"):
+            return self._get_new_info(force=force)
+
+    def _schedule_refresh(self):
+        next_run = self._refresh.schedule()
+        delay = (next_run - datetime.datetime.now()).total_seconds()
+        self.cancel_scheduled_event(REFRESH_EVENT)
+        self.schedule_event(self._handle_scheduled_refresh, max(delay, 1),
+                            name=REFRESH_EVENT)
+        LOG.debug(f"Next caffeine data update at {next_run}")
+
+    def _handle_scheduled_refresh(self, message=None):
+        self._refresh_data()
+
+    def _resolve_results(self, handle: dict) -> list:
+        """
+        Get the drink rows referenced by `CQS_match_query_phrase` callback data
+        :param handle: callback data with `generation`, `rows` and `drink`
+        :return: list of DrinkRecord, best match first
+        """
+        rows = handle.get("rows")
+        if not rows:
+            return list()
+        data = self._data
+        if handle.get("generation") == data.generation:
+            return [data.table[i] for i in rows]
+        # Row ids of an older generation can't be used; look the drink up again
+        LOG.info(f"Drink data changed since match: {handle.get('drink')}")
+        return data.index.find(handle["drink"]).rows \
+            if handle.get("drink") else list()
+
+    def _speak_alternate_results(self, message, caff_list=None,
+                                 units: Optional[str] = None):
         """
         Speak alternate drink data from caff_list
         :param message: Message associated with request
         :param caff_list: List of alternate drinks as
             returned by _generate_drink_dialog
+        :param units: measurement system to use, else read from user prefs
         """
         cnt = 0
         spoken = []
         if not caff_list:
             LOG.error("No results to handle")
             return
+        units = units or get_user_prefs(message)['units']['measure']
         for i in range(len(caff_list)):
             # TODO: Check for stop request
             if caff_list[i][0] not in spoken:
-                oz = float(caff_list[i][1])
-                caffeine = float(caff_list[i][2])
+                oz = caff_list[i][1]
+                caffeine = caff_list[i][2]
 
                 drink = caff_list[i][0]
-                units = get_user_prefs(message)['units']['measure']
 
                 if units == "metric":
                     caff_mg, caff_vol, unit_dialog = \
+                        caff_list[i].metric if \
+                        isinstance(caff_list[i], DrinkRecord) else \
                         self.convert_metric(oz, caffeine)
                 else:
                     caff_mg = str(caffeine)
@@ -400,116 +839,184 @@ class CaffeineWizSkill(CommonQuerySkill):
                 sleep(0.5)  # Prevent simultaneous speak inserts
             cnt = cnt + 1
 
-    def _add_more_caffeine_data(self):
+    def _add_more_caffeine_data(self, caffeine_wiz: Optional[list] = None,
+                                caffeine_informer: Optional[list] = None,
+                                tables: Optional[Dict[str, list]] = None) \
+            -> StoreDelta:
+        """
+        Merge the rows of every provider into the lookup table and update
+        the lookup index. Normalized names known to the name cache are
+        indexed as aliases. The result is published as a new DrinkData
+        generation; the current table and index are kept if nothing changed.
+        :param caffeine_wiz: new caffeinewiz rows, default current rows
+        :param caffeine_informer: new caffeineinformer rows, default current
+        :param tables: new rows of other providers by name, default current
+        :return: StoreDelta from the previous lookup table
+        """
+        data = self._data
+        rows = dict(data.source_rows())
+        rows.update(tables or {})
+        if caffeine_wiz is not None:
+            rows[Source.CAFFEINEWIZ.label] = caffeine_wiz
+        if caffeine_informer is not None:
+            rows[Source.CAFFEINEINFORMER.label] = caffeine_informer
+        providers = self._providers
+        # Rows of providers that are no longer configured are dropped
+        rows = {name: rows[name] if rows.get(name) is not None else
+                providers.get(name).default_rows() for name in providers.names}
+        drink_table = DrinkStore.from_rows(
+            providers.merge(rows, self._source_priority()))
+        # Aliases share one index; where languages normalize different
+        # names to the same alias, the first language wins
+        aliases = dict()
+        collisions = dict()
+        for lang in self._name_langs:
+            for alias, name in self._name_cache.aliases(drink_table.names,
+                                                        lang).items():
+                if aliases.setdefault(alias, name) != name:
+                    collisions[alias] = f"'{alias}' ({lang}: {name})"
+        if collisions:
+            LOG.warning(f"Ignored aliases of other drinks in other languages: "
+                        f"{', '.join(collisions.values())}")
+        delta = data.table.diff(drink_table)
+        if not delta and aliases == data.index.aliases:
+            self._publish(data.update(sources=rows))
+            return delta
+        drink_index = data.index.apply(drink_table, aliases)
+        self._publish(data.update(drink_table, drink_index, sources=rows))
+        LOG.debug(f"Published drink data generation {self._data.generation}")
+        return delta
+
+    @property
+    def _snapshot_path(self) -> str:
+        return os.path.join(self.file_system.path, SNAPSHOT_FILE)
+
+    def _load_cached_data(self):
+        """
+        Load the last persisted snapshot, falling back to the bundled
+        defaults. A corrupt or incompatible snapshot is discarded.
+        """
+        if self.file_system.exists(SNAPSHOT_FILE):
+            try:
+                snapshot = load_snapshot(self._snapshot_path)
+                self._snapshot = snapshot
+                self._publish(DrinkData.from_snapshot(
+                    snapshot, self._data.generation + 1))
+                self._fetcher.validators = snapshot.validators
+                LOG.info(f"Loaded caffeine snapshot from {snapshot.created}")
+                return
+            except SnapshotError as e:
+                LOG.warning(f"Discarding caffeine snapshot: {e}")
+                # Drop any table still mapped from the discarded file
+                self._data = DrinkData.empty(self._data.generation + 1)
+                try:
+                    os.remove(self._snapshot_path)
+                except OSError as x:
+                    LOG.error(x)
+        self._snapshot = None
+        LOG.info("Loading Caffeine data from bundled defaults")
+        self._add_more_caffeine_data(
+            tables=self._providers.resolve(self._data.source_rows()))
+
+    def _write_snapshot(self, created: datetime.datetime):
         """
-        Add in some arbitrary additional data.
+        Persist the current provider rows, drink table and index
+        :param created: time the source data was fetched
         """
-        self.from_caffeine_wiz.append(['rocket chocolate', '.4', '150'])
-        self.from_caffeine_wiz.extend(x[:-2] for x in
-                                      self.from_caffeine_informer
-                                      if str(x[:-2]) not in
-                                      str(self.from_caffeine_wiz))
-        invalid_entry = ["beverage", "quantity (oz)", "caffeine content (mg)"]
-        if invalid_entry in self.from_caffeine_wiz:
-            self.from_caffeine_wiz.remove(invalid_entry)
-        sorted(self.from_caffeine_wiz)
+        data = self._data
+        write_snapshot(self._snapshot_path, data.table, data.index,
+                       data.source_rows(), created, self._fetcher.validators)
+        self._snapshot = load_snapshot(self._snapshot_path)
 
-    def _get_new_info(self, reply=False):
-        """fetches and combines new data from the two caffeine sources"""
-        self._update_event.clear()
+    def _get_new_info(self, reply=False, force=False):
+        """
+        Reads and combines new data from every provider. Lookups keep using
+        the previous data until the new table is swapped in. Providers
+        backing off after failures are skipped unless `force` is set.
+        """
         success = False
         time_check = datetime.datetime.now()
+        providers = self._providers
+        results = providers.collect(
+            [provider for provider in providers.providers
+             if force or self._refresh.is_due(provider.name, time_check)])
+        updated = dict()
+        for name, result in results.items():
+            if result.error:
+                LOG.error(f"Error updating from {name}: {result.error}")
+            elif result.not_modified:
+                LOG.debug(f"{name} data not modified")
+            else:
+                LOG.debug(f"Updated {name} data")
+                updated[name] = result.rows
+            if result.parse_time is not None:
+                self._metrics.observe(f"parse.{name}", result.parse_time)
+            self._record_source(result, time_check)
 
-        # TODO: caffeineinformer update failing DM
-        # Update from caffeineinformer
-        try:
-            # prep the html pages:
-            page = urllib.request.urlopen(
-                "https://www.caffeineinformer.com/the-caffeine-database",
-                timeout=15).read()
-            soup = BeautifulSoup(page, "html.parser")
-
-            # extract the parts that we need.
-            # note that the html formats are very different, so we are using 2 separate approaches:
-            # 1 - using strings and ast.literal:
-            raw_j2 = str(soup.find_all('script', type="text/javascript")[2])
-            new_url = raw_j2[:raw_j2.rfind("function pause") - 6][
-                      raw_j2.rfind("tbldata = [") + 11:].lower()
-            new = web_utils.strip_tags(new_url)
-            self.from_caffeine_informer = list(ast.literal_eval(new))
-            LOG.debug("Updated caffeineinformer data")
-        except Exception as e:
-            LOG.error(f"Error updating from caffeineinformer: {e}")
-            self.from_caffeine_informer = self.from_caffeine_informer or list()
-
-        # Update from caffeinewiz
+        # Normalize names not seen in a previous refresh, as utterances in
+        # each language the skill provides would be normalized
         try:
-            htmldoc = urllib.request.urlopen("http://caffeinewiz.com/",
-                                             timeout=15).read()
-            soup2 = BeautifulSoup(htmldoc, "html.parser")
-
-            # 2 - by parsing the table on a given page:
-            areatable = soup2.find('table')
-            if areatable:
-                self.from_caffeine_wiz = list(
-                    (web_utils.chunks([i.text.lower().replace("\n", "")
-                                       for i in areatable.findAll('td')
-                                       if i.text != "\xa0"], 3)))
-            LOG.debug("Updated caffeinewiz data")
-        except Exception as e:
-            LOG.error(f"Error updating from caffeinewiz: {e}")
-            self.from_caffeine_wiz = self.from_caffeine_wiz or list()
-
-        # Add Normalized drink names
-        def _normalize_drink_list(drink_list):
+            for lang in self._name_langs:
+                load_language(lang)
             load_language(self.lang)  # Necessary for intent tests
-            for drink in drink_list:
-                try:
-                    parsed_name = normalize(drink[0].replace('-', ' '), 'en')
-                    if drink[0] != parsed_name:
-                        new_drink = [parsed_name] + drink[1:]
-                        drink_list.append(new_drink)
-                except Exception as x:
-                    LOG.exception(x)
-        try:
-            _normalize_drink_list(self.from_caffeine_informer)
-            _normalize_drink_list(self.from_caffeine_wiz)
+            for table in updated.values():
+                for lang in self._name_langs:
+                    self._name_cache.update((row[0] for row in table), lang)
+            self._name_cache.save()
         except Exception as e:
             LOG.error(e)
 
-        # saving and pickling the results:
-        if not self.from_caffeine_wiz:
-            LOG.info("Loading Caffeine data from bundled defaults")
-            with open(os.path.join(os.path.dirname(__file__),
-                                   "caffeine_wiz_data.pickle"), 'rb') as f:
-                self.from_caffeine_wiz = pickle.load(f)
-        with self.file_system.open('drinkList_from_caffeine_wiz.txt',
-                                   'wb+') as from_caffeine_wiz_file:
-            pickle.dump(self.from_caffeine_wiz, from_caffeine_wiz_file)
-
-        if self.from_caffeine_informer:
-            with self.file_system.open('drinkList_from_caffeine_informer.txt',
-                                       'wb+') as from_caffeine_informer_file:
-                pickle.dump(self.from_caffeine_informer,
-                            from_caffeine_informer_file)
-        self._add_more_caffeine_data()
+        # Keep previous data for any provider that failed to update
+        previous = self._data.source_rows()
+        tables = providers.resolve({**previous, **updated})
+        if tables == previous and self._snapshot:
+            LOG.debug("Caffeine data not changed")
+        else:
+            # Build the new table and index, then swap them in
+            generation = self._data.generation
+            delta = self._add_more_caffeine_data(tables=tables)
+            if delta:
+                LOG.info(f"Caffeine data updated: {delta.summary()}")
+                self.bus.emit(Message("caffeinewiz.data.updated",
+                                      {**delta.summary(),
+                                       "drinks": len(self.drink_table),
+                                       "updated": str(time_check)}))
+            if self._data.generation != generation or not self._snapshot:
+                try:
+                    self._write_snapshot(time_check)
+                except Exception as e:
+                    LOG.error(f"Failed to save caffeine snapshot: {e}")
 
         try:
-            # TODO: Check for CW and CI success
-            if self.from_caffeine_wiz:
+            if any(tables.values()):
                 self.update_skill_settings({"lastUpdate": str(time_check)})
                 if reply:
                     self.speak_dialog("update_complete")
                 success = True
             elif reply:
-                LOG.error("CaffeineWiz source failed to update!")
+                LOG.error("No drink data available after update!")
                 self.speak_dialog("update_error")
         except Exception as e:
             LOG.error(f"An error occurred during the CaffeineWiz update: {e}")
-            # self.check_for_signal("WIZ_getting_new_content")
-        self._update_event.set()
         return success
 
+    def _record_source(self, result: ProviderResult,
+                       time_check: datetime.datetime):
+        """
+        Record the outcome of updating one provider for scheduling and
+        metrics
+        :param result: result of reading the provider
+        :param time_check: time the update started
+        """
+        if result.not_modified:
+            outcome = "not_modified"
+        elif result.ok:
+            outcome = "updated"
+        else:
+            outcome = "failed"
+        self._metrics.increment(f"refresh.{result.name}.{outcome}")
+        self._refresh.record(result.name, result.ok, time_check)
+
     def update_skill_settings(self, new_preferences: dict):
         """
         Updates skill settings with the passed new_preferences
@@ -520,87 +1027,241 @@ class CaffeineWizSkill(CommonQuerySkill):
             self.settings[setting] = new_preferences[setting]
         self.settings.store()
 
-    def _clean_drink_name(self, drink: str) -> str:
+    def _clean_drink_name(self, drink: str,
+                          lang: Optional[str] = None) -> str:
         """
         Normalizes an input drink name and handles known alternative names
         :param drink: Parsed user requested drink
-        :return: normalized drink or None if no name was parsed
+        :param lang: language of the drink name (default core language)
+        :return: normalized drink or "" if no name was parsed
         """
         if not drink:
             LOG.error(f"No Drink name provided to normalize")
             return ""
-        drink = drink.lower()
+        return self._get_cleaner(lang or self._get_message_lang(None))\
+            .clean(drink)
 
-        try:
-            # Strip leading "a"
-            drink = drink.split(maxsplit=1)[1] if \
-                drink.split(maxsplit=1)[0] == "a" else drink
-        except IndexError:
-            LOG.error(f"Invalid drink passed: {drink}")
-            return ""
-        if drink.startswith("cup of") or drink.startswith("glass of"):
-            drink = drink.split(" of", 1)[1].strip()
-        drink = drink.translate({ord(i): None for i in '?:!/;@#$'})\
-            .rstrip().replace(" '", "'")
-        # Check for common mis-matched names
-        drink = self.translate_drinks.get(drink, drink)
-        LOG.info(drink)
-        return drink
+    def _get_extractor(self, lang: str) -> QueryExtractor:
+        """
+        Get the QueryExtractor compiled from the resources of `lang`
+        """
+        extractor = self._extractors.get(lang)
+        if extractor is None:
+            extractor = QueryExtractor.from_resources(self.load_lang(lang=lang))
+            self._extractors[lang] = extractor
+        return extractor
+
+    def _get_cleaner(self, lang: str,
+                     data: Optional[DrinkData] = None) -> DrinkNameCleaner:
+        """
+        Get the DrinkNameCleaner compiled from the resources of `lang`,
+        protecting the drink names of `data` (default current data)
+        """
+        data = data or self._data
+        cached = self._cleaners.get(lang)
+        if cached and cached[0] == data.generation:
+            return cached[1]
+        if cached:
+            cleaner = cached[1].with_names(data.table.names)
+        else:
+            cleaner = DrinkNameCleaner.from_resources(
+                self.load_lang(lang=lang), data.table.names)
+        self._cleaners[lang] = (data.generation, cleaner)
+        return cleaner
+
+    @property
+    def drink_table(self) -> DrinkStore:
+        """
+        Lookup table of the current DrinkData generation
+        """
+        return self._data.table
+
+    @property
+    def drink_index(self) -> DrinkIndex:
+        """
+        Lookup index of the current DrinkData generation
+        """
+        return self._data.index
+
+    @property
+    def from_caffeine_wiz(self) -> list:
+        """
+        caffeinewiz rows of the current DrinkData generation
+        """
+        return self._data.source_tables()[0]
+
+    @property
+    def from_caffeine_informer(self) -> list:
+        """
+        caffeineinformer rows of the current DrinkData generation
+        """
+        return self._data.source_tables()[1]
 
     def _drink_in_database(self, drink: str) -> bool:
-        return any(i for i in self.from_caffeine_wiz
-                   if i[0] in drink or drink in i[0])
+        return self.drink_index.contains(drink)
 
     def _get_matching_drinks(self, drink: str) -> list:
-        return [i for i in self.from_caffeine_wiz
-                if i[0] in drink or drink in i[0]]
+        return self.drink_index.match(drink)
+
+    def _find_drinks(self, drink: str, lang: str,
+                     data: Optional[DrinkData] = None) -> List[DrinkMention]:
+        """
+        Find the drinks listed in a cleaned drink phrase (i.e. "coca-cola
+        classic and red bull") with one scan over the phrase. Drinks must be
+        known names or aliases separated by a `drink_separator` word or a
+        comma.
+        :param drink: cleaned drink phrase
+        :param lang: language of the phrase
+        :param data: DrinkData to find drinks in (default current data)
+        :return: drinks in phrase order, or an empty list if the phrase
+            doesn't list several drinks
+        """
+        extractor = self._get_extractor(lang)
+        # Most phrases name a single drink and are never scanned
+        if not extractor.separates(drink):
+            return list()
+        data = data or self._data
+        with self._metrics.timer("mentions"):
+            mentions = data.index.mentions(drink)
+        if len(mentions) < 2 or not all(
+                extractor.separates(drink[prev.end:mention.start])
+                for prev, mention in zip(mentions, mentions[1:])):
+            return list()
+        return mentions
+
+    def _match_drink(self, drink: str) -> MatchResult:
+        """
+        Look up a drink once and rank all matching results
+        :param drink: normalized drink name
+        :return: MatchResult (falsy if nothing matched)
+        """
+        return self.drink_index.find(drink)
 
-    def _generate_drink_dialog(self, drink: str,
-                               message: Message) -> Optional[Tuple[str, list]]:
+    def _generate_drink_dialog(self, drink: str, message: Message,
+                               lang: Optional[str] = None,
+                               data: Optional[DrinkData] = None,
+                               units: Optional[str] = None) -> \
+            Optional[Tuple[str, list]]:
         """
-        Generates the dialog and alternate results for the requested drink
-        :param drink: raw input drink to find
+        Generates the dialog and alternate results for the requested drink.
+        Answers are cached per drink, units, language and data generation;
+        the dialog is rendered again on every call so variants still rotate.
+        :param drink: cleaned drink name to find
         :param message: message associated with request
-        :return: generated dialog to speak
+        :param lang: language to respond in (default `self.lang`)
+        :param data: DrinkData to look the drink up in (default current data)
+        :param units: unit system to respond in (default user preference)
+        :return: generated dialog to speak and matched rows, best match first
         """
-        results = self._get_matching_drinks(drink)
-        LOG.debug(results)
-        if len(results) == 0:
+        data = data or self._data
+        if units is None:
+            with self._metrics.timer("user_prefs"):
+                units = get_user_prefs(message)['units']['measure']
+        lang = lang or self.lang
+        resources = self.load_lang(lang=lang)
+        answer = self._get_answer(drink, units, lang, resources, data)
+        if answer is None:
             return None
-        if len(results) == 1:
-            # Return the only result
-            drink = str(results[0][0])
-            caff_mg = float(results[0][2])
-            caff_oz = float(results[0][1])
+        with self._metrics.timer("render"):
+            to_speak = resources.dialog_renderer.render('drink_caffeine',
+                                                        answer.context)
+        return to_speak, answer.rows
 
+    def _generate_drinks_dialog(self, mentions: List[DrinkMention],
+                                message: Message,
+                                lang: Optional[str] = None,
+                                data: Optional[DrinkData] = None,
+                                units: Optional[str] = None) -> \
+            Optional[Tuple[str, list]]:
+        """
+        Generates the dialog for several requested drinks, followed by their
+        total caffeine if `speak_total` is enabled and the data source
+        :param mentions: drinks found in the request
+        :param message: message associated with request
+        :param lang: language to respond in (default `self.lang`)
+        :param data: DrinkData the drinks were found in (default current data)
+        :param units: unit system to respond in (default user preference)
+        :return: generated dialog to speak and the row of each drink
+        """
+        data = data or self._data
+        if units is None:
+            with self._metrics.timer("user_prefs"):
+                units = get_user_prefs(message)['units']['measure']
+        lang = lang or self.lang
+        resources = self.load_lang(lang=lang)
+        answers = [answer for answer in
+                   (self._get_answer(mention.key, units, lang, resources, data)
+                    for mention in mentions) if answer]
+        if not answers:
+            return None
+        with self._metrics.timer("render"):
+            dialogs = [resources.dialog_renderer.render('multiple_drinks',
+                                                        answer.context)
+                       for answer in answers]
+            if self.speak_total and len(answers) > 1:
+                # Spoken amounts may be per metric volume; the total is per
+                # serving, like `total_caffeine_mg` of `get_caffeine_info`
+                total = sum(answer.rows[0].caffeine for answer in answers)
+                dialogs.append(resources.dialog_renderer.render(
+                    'total_caffeine', {
+                        'total': f"{total:g}",
+                        'caffeine_units': answers[0].context['caffeine_units']
+                    }))
+            dialogs.append(resources.dialog_renderer.render(
+                'provided_by_caffeinewiz', {}))
+        return " ".join(dialogs), [answer.rows[0] for answer in answers]
+
+    def _get_answer(self, drink: str, units: str, lang: str,
+                    resources: SkillResources,
+                    data: DrinkData) -> Optional[Answer]:
+        """
+        Get the cached answer for a drink, looking it up on a cache miss
+        :param drink: cleaned drink name to find
+        :param units: user's preferred measurement system
+        :param lang: language to respond in
+        :param resources: resources of `lang`
+        :param data: DrinkData to look the drink up in
+        :return: Answer, or None if the drink wasn't found
+        """
+        metrics = self._metrics
+        key = (drink, units, lang)
+        answer = self._answers.get(key, data.generation)
+        if answer is None:
+            with metrics.timer("lookup"):
+                match = data.index.find(drink)
+            if not match:
+                metrics.increment("lookup.misses")
+                return None
+            metrics.increment("lookup.hits")
+            answer = self._build_answer(match, units, resources)
+            self._answers.put(key, data.generation, answer)
         else:
-            # Find the best match from all of the returned results
-            matched_drink_names = [results[i][0]
-                                   for i in range(len(results))]
-            match = difflib.get_close_matches(drink, matched_drink_names, 1)
-            if match:
-                match2 = [i for i in results if i[0] in match]
-            else:
-                match2 = [i for i in results
-                          if i[0] in matched_drink_names[0]]
-            LOG.debug(match)
-            LOG.debug(match2)
-            drink = str(match2[0][0])
-            caff_mg = float(match2[0][2])
-            caff_oz = float(match2[0][1])
-        if get_user_prefs(message)['units']['measure'] == 'metric':
-            caff_mg, caff_vol, unit_dialog = self.convert_metric(caff_oz,
-                                                                 caff_mg)
+            metrics.increment("lookup.cached")
+        return answer
+
+    @staticmethod
+    def _build_answer(match: MatchResult, units: str,
+                      resources: SkillResources) -> Answer:
+        """
+        Format the best match of a lookup for the `drink_caffeine` dialog
+        :param match: non-empty result of a drink lookup
+        :param units: user's preferred measurement system
+        :param resources: resources of the language to respond in
+        :return: Answer with dialog context and matched rows
+        """
+        best = match.best.row
+        drink = best.name
+        if units == 'metric':
+            caff_mg, caff_vol, unit_dialog = best.metric
         else:
-            caff_mg = str(caff_mg)
-            caff_vol = str(caff_oz)
+            caff_mg = str(best.caffeine)
+            caff_vol = str(best.volume)
             unit_dialog = 'word_ounces'
 
-        LOG.info(f"{drink} | {caff_mg} | {caff_vol} | {unit_dialog}")
-        to_speak = self.dialog_renderer.render('drink_caffeine', {
+        return Answer({
             'drink': drink,
             'caffeine_content': caff_mg,
-            'caffeine_units': self.resources.render_dialog('word_milligrams'),
+            'caffeine_units': resources.render_dialog('word_milligrams'),
             'drink_size': caff_vol,
-            'drink_units': self.resources.render_dialog(unit_dialog)})
-        return to_speak, results
+            'drink_units': resources.render_dialog(unit_dialog)},
+            match.rows)
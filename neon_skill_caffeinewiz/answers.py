@@ -0,0 +1,132 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Framework
+# All trademark and other rights reserved by their respective owners
+# Copyright 2008-2025 Neongecko.com Inc.
+# Contributors: Daniel McKnight, Guy Daniels, Elon Gasper, Richard Leeds,
+# Regina Bloomstine, Casimiro Ferreira, Andrii Pernatii, Kirill Hrymailo
+# BSD-3 License
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from this
+#    software without specific prior written permission.
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS  BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS;  OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE,  EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+from time import monotonic
+from typing import Callable, Hashable, Optional
+
+# Most answers kept at once
+ANSWER_CACHE_SIZE = 256
+# Longest time an answer is reused (seconds)
+ANSWER_CACHE_TTL = 3600
+# Most phrases remembered as having no answer
+REJECTED_CACHE_SIZE = 1024
+
+
+@dataclass(frozen=True)
+class Answer:
+    """
+    Everything needed to speak a drink lookup result. `context` holds the
+    already formatted `drink_caffeine` dialog values so a cached answer is
+    rendered again (with a random dialog variant) instead of being replayed.
+    """
+    context: dict
+    rows: list
+
+
+# Cached result of a phrase this skill has no answer for
+NO_ANSWER = Answer(dict(), list())
+
+
+class AnswerCache:
+    """
+    Bounded LRU cache of answers with a TTL. Keys include the DrinkData
+    generation they were built from; once a newer generation is seen every
+    older entry is dropped and answers for older generations are not stored.
+    """
+    def __init__(self, size: int = ANSWER_CACHE_SIZE,
+                 ttl: float = ANSWER_CACHE_TTL,
+                 clock: Callable[[], float] = monotonic):
+        self.size = size
+        self.ttl = ttl
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _check_generation(self, generation: int) -> bool:
+        if generation > self.generation:
+            self._entries.clear()
+            self.generation = generation
+        return generation == self.generation
+
+    def get(self, key: Hashable, generation: int) -> Optional[Answer]:
+        """
+        Get a cached answer
+        :param key: answer key, excluding the generation
+        :param generation: generation of the data being queried
+        :return: cached Answer or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key) \
+                if self._check_generation(generation) else None
+            if entry and entry[0] < self._clock():
+                del self._entries[key]
+                entry = None
+            if not entry:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: Hashable, generation: int, answer: Answer):
+        """
+        Cache an answer, evicting the least recently used one if full
+        :param key: answer key, excluding the generation
+        :param generation: generation of the data the answer was built from
+        :param answer: Answer to cache
+        """
+        if self.size <= 0:
+            return
+        with self._lock:
+            if not self._check_generation(generation):
+                return
+            self._entries[key] = (self._clock() + self.ttl, answer)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """
+        Get cache size and hit/miss counters
+        """
+        return {"size": len(self._entries), "max_size": self.size,
+                "ttl": self.ttl, "generation": self.generation,
+                "hits": self.hits, "misses": self.misses}
@@ -0,0 +1,195 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Framework
+# All trademark and other rights reserved by their respective owners
+# Copyright 2008-2025 Neongecko.com Inc.
+# Contributors: Daniel McKnight, Guy Daniels, Elon Gasper, Richard Leeds,
+# Regina Bloomstine, Casimiro Ferreira, Andrii Pernatii, Kirill Hrymailo
+# BSD-3 License
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from this
+#    software without specific prior written permission.
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS  BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS;  OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE,  EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import re
+
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from ovos_workshop.resource_files import SkillResources
+
+# Resource files read for each language
+ARTICLES_VOC = "drink_article"
+FILLERS_VOC = "drink_filler"
+PUNCTUATION_WORD = "drink_punctuation"
+ALIASES_VALUE = "drink_alias"
+
+# First word -> (words, replacement) of each phrase, longest phrase first
+PhraseTable = Dict[str, List[Tuple[List[str], str]]]
+
+
+def _phrase_table(phrases: Dict[str, str]) -> PhraseTable:
+    """
+    Index phrases by their first word so a phrase is only compared at
+    words it can start with
+    """
+    table: PhraseTable = dict()
+    for phrase, replacement in phrases.items():
+        words = phrase.split()
+        if words:
+            table.setdefault(words[0], list()).append((words, replacement))
+    for candidates in table.values():
+        candidates.sort(key=lambda c: -len(c[0]))
+    return table
+
+
+def _match(table: PhraseTable, words: Sequence[str],
+           pos: int) -> Optional[Tuple[List[str], str]]:
+    """
+    Get the longest phrase in `table` starting at `words[pos]`
+    """
+    for candidate in table.get(words[pos], ()):
+        phrase = candidate[0]
+        if words[pos:pos + len(phrase)] == phrase:
+            return candidate
+    return None
+
+
+class DrinkNameCleaner:
+    """
+    Normalizes drink names parsed from utterances in one pass over their
+    words: a leading article and filler phrase (i.e. "a cup of") are
+    removed and aliases are replaced wherever they appear in the phrase,
+    longest alias first. Known drink names that contain an alias are left
+    as they are, so a "coke" alias doesn't rewrite "diet coke".
+    """
+    def __init__(self, articles: Iterable[str] = (),
+                 fillers: Iterable[str] = (), punctuation: str = "",
+                 aliases: Optional[Dict[str, str]] = None,
+                 names: Iterable[str] = ()):
+        """
+        :param articles: words removed from the start of a phrase
+        :param fillers: phrases removed from the start of a phrase, after
+            any article
+        :param punctuation: characters removed anywhere
+        :param aliases: dict of spoken phrase to drink name
+        :param names: drink names that are never rewritten by an alias
+        """
+        self.articles = [a.lower() for a in articles if a.strip()]
+        self.fillers = [f.lower() for f in fillers if f.strip()]
+        self.punctuation = punctuation
+        self.aliases = {" ".join(k.lower().split()): v
+                        for k, v in (aliases or {}).items() if k.strip()}
+        # A character class is much faster than `str.translate` here
+        self._punctuation = re.compile(f"[{re.escape(punctuation)}]") \
+            if punctuation else None
+        self._articles = set(self.articles)
+        self._fillers = _phrase_table({f: "" for f in self.fillers})
+        self._aliases = _phrase_table(self.aliases)
+        replacements = dict(self.aliases)
+        for name in self._protected(names):
+            replacements.setdefault(name, name)
+        self._replacements = _phrase_table(replacements)
+
+    @classmethod
+    def from_resources(cls, resources: SkillResources,
+                       names: Iterable[str] = ()) -> 'DrinkNameCleaner':
+        """
+        Build a cleaner from the `drink_article` and `drink_filler` vocab,
+        `drink_punctuation` word and `drink_alias` value files of one
+        language. Missing files are treated as empty.
+        :param resources: resources of the language to clean names in
+        :param names: drink names that are never rewritten by an alias
+        :return: DrinkNameCleaner for the language of `resources`
+        """
+        def _vocab(name: str) -> List[str]:
+            try:
+                return [phrase for line in
+                        resources.load_vocabulary_file(name)
+                        for phrase in line]
+            except FileNotFoundError:
+                return list()
+
+        try:
+            punctuation = resources.load_word_file(PUNCTUATION_WORD) or ""
+        except FileNotFoundError:
+            punctuation = ""
+        try:
+            aliases = resources.load_named_value_file(ALIASES_VALUE)
+        except FileNotFoundError:
+            aliases = dict()
+        return cls(_vocab(ARTICLES_VOC), _vocab(FILLERS_VOC), punctuation,
+                   {k.strip(): v.strip() for k, v in aliases.items()}, names)
+
+    def with_names(self, names: Iterable[str]) -> 'DrinkNameCleaner':
+        """
+        Get a cleaner with the same rules protecting another set of names
+        """
+        return DrinkNameCleaner(self.articles, self.fillers, self.punctuation,
+                                self.aliases, names)
+
+    def _protected(self, names: Iterable[str]) -> List[str]:
+        """
+        Get the drink names an alias would otherwise rewrite
+        """
+        protected = list()
+        for name in names:
+            words = name.split()
+            if self._aliases.keys().isdisjoint(words):
+                continue
+            if any(_match(self._aliases, words, pos)
+                   for pos in range(len(words))):
+                protected.append(" ".join(words))
+        return protected
+
+    def clean(self, drink: str) -> str:
+        """
+        Normalize a drink name parsed from an utterance
+        :param drink: parsed drink phrase
+        :return: normalized name, or "" if only fillers were parsed
+        """
+        drink = drink.lower()
+        if self._punctuation:
+            drink = self._punctuation.sub("", drink)
+        drink = drink.replace(" '", "'")
+        # Commas separate listed drinks; split them off so a word before a
+        # comma still matches
+        comma = "," in drink
+        if comma:
+            drink = drink.replace(",", " , ")
+        words = drink.split()
+        pos = 0
+        if words and words[0] in self._articles:
+            pos = 1
+        if pos < len(words):
+            filler = _match(self._fillers, words, pos)
+            if filler:
+                pos += len(filler[0])
+        if self._replacements.keys().isdisjoint(words):
+            cleaned = words[pos:]
+        else:
+            cleaned = list()
+            while pos < len(words):
+                replacement = _match(self._replacements, words, pos)
+                if replacement:
+                    cleaned.append(replacement[1])
+                    pos += len(replacement[0])
+                else:
+                    cleaned.append(words[pos])
+                    pos += 1
+        drink = " ".join(cleaned)
+        return drink.replace(" ,", ",") if comma else drink
@@ -0,0 +1,119 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Framework
+# All trademark and other rights reserved by their respective owners
+# Copyright 2008-2025 Neongecko.com Inc.
+# Contributors: Daniel McKnight, Guy Daniels, Elon Gasper, Richard Leeds,
+# Regina Bloomstine, Casimiro Ferreira, Andrii Pernatii, Kirill Hrymailo
+# BSD-3 License
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from this
+#    software without specific prior written permission.
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS  BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS;  OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE,  EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from dataclasses import dataclass, field, replace
+from typing import Dict, Optional, Tuple
+
+from neon_skill_caffeinewiz.index import DrinkIndex
+from neon_skill_caffeinewiz.snapshot import Snapshot
+from neon_skill_caffeinewiz.store import DrinkStore, Source
+
+
+@dataclass(frozen=True)
+class DrinkData:
+    """
+    One immutable generation of the drink data. A refresh builds a new
+    instance and publishes it with a single reference assignment, so a
+    reader holding an instance always sees a matching table, index and
+    sources. Source tables are shared between generations and must not be
+    modified.
+    """
+    generation: int
+    table: DrinkStore
+    index: DrinkIndex
+    # Rows of each provider by provider name
+    sources: Dict[str, list] = field(default_factory=dict)
+    snapshot: Optional[Snapshot] = None
+
+    @classmethod
+    def empty(cls, generation: int = 0) -> 'DrinkData':
+        """
+        Get a generation without any drinks
+        :param generation: generation number of the empty data
+        :return: empty DrinkData
+        """
+        table = DrinkStore.from_rows([])
+        return cls(generation, table, DrinkIndex(table))
+
+    @classmethod
+    def from_snapshot(cls, snapshot: Snapshot,
+                      generation: int) -> 'DrinkData':
+        """
+        Get a generation backed by a loaded snapshot. Source tables are only
+        read from the snapshot when requested.
+        :param snapshot: loaded Snapshot
+        :param generation: generation number of the new data
+        :return: DrinkData using the snapshot table and index
+        """
+        return cls(generation, snapshot.store, snapshot.index,
+                   snapshot=snapshot)
+
+    @property
+    def caffeine_wiz(self) -> list:
+        return self.sources.get(Source.CAFFEINEWIZ.label) or list()
+
+    @property
+    def caffeine_informer(self) -> list:
+        return self.sources.get(Source.CAFFEINEINFORMER.label) or list()
+
+    def source_rows(self) -> Dict[str, list]:
+        """
+        Get the rows of each provider this data was built from
+        """
+        if not self.sources and self.snapshot:
+            return self.snapshot.sources()
+        return self.sources
+
+    def source_tables(self) -> Tuple[list, list]:
+        """
+        Get the caffeinewiz and caffeineinformer tables this data was built
+        from
+        """
+        sources = self.source_rows()
+        return sources.get(Source.CAFFEINEWIZ.label) or list(), \
+            sources.get(Source.CAFFEINEINFORMER.label) or list()
+
+    def update(self, table: Optional[DrinkStore] = None,
+               index: Optional[DrinkIndex] = None,
+               sources: Optional[Dict[str, list]] = None) -> 'DrinkData':
+        """
+        Get the next generation of this data. The generation number only
+        changes if the table or index changes.
+        :param table: updated table
+        :param index: index over `table`
+        :param sources: updated rows of each provider
+        :return: new DrinkData
+        """
+        changes = dict()
+        if sources is not None:
+            # Sources are no longer read lazily from a snapshot
+            changes.update(sources=sources, snapshot=None)
+        if table is not None:
+            changes.update(generation=self.generation + 1, table=table,
+                           index=index)
+        return replace(self, **changes)
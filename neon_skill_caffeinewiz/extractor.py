@@ -0,0 +1,156 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Framework
+# All trademark and other rights reserved by their respective owners
+# Copyright 2008-2025 Neongecko.com Inc.
+# Contributors: Daniel McKnight, Guy Daniels, Elon Gasper, Richard Leeds,
+# Regina Bloomstine, Casimiro Ferreira, Andrii Pernatii, Kirill Hrymailo
+# BSD-3 License
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from this
+#    software without specific prior written permission.
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS  BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS;  OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE,  EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import re
+
+from typing import Iterable, List, NamedTuple, Optional
+
+from ovos_workshop.resource_files import SkillResources
+
+# Resource files read for each language
+DRINK_REGEX = "drink"
+CAFFEINE_VOC = "caffeine"
+SEPARATORS_VOC = "drink_separator"
+
+# Named group of `DRINK_REGEX` patterns holding the drink phrase
+DRINK_GROUP = "drink"
+
+_GROUP = re.compile(r"\(\?P<(\w+)>")
+
+
+def _rename_drink_group(pattern: str, name: str) -> str:
+    """
+    Rename the drink group of `pattern` so group names are unique in the
+    combined expression. The group name is matched case-insensitively;
+    other named groups are kept as they are.
+    """
+    return _GROUP.sub(lambda m: f"(?P<{name}>"
+                      if m.group(1).lower() == DRINK_GROUP else m.group(0),
+                      pattern)
+
+
+def _words_regex(words: Iterable[str], *literals: str) -> \
+        Optional[re.Pattern]:
+    """
+    Compile a case-insensitive expression matching any of `words` as a whole
+    word, longest first, or any of `literals` anywhere
+    """
+    words = sorted({re.escape(w) for w in words}, key=len, reverse=True)
+    alternatives = [f"(?<!\\w)(?:{'|'.join(words)})(?!\\w)"] if words \
+        else []
+    alternatives.extend(re.escape(literal) for literal in literals)
+    return re.compile("|".join(alternatives), re.IGNORECASE) \
+        if alternatives else None
+
+
+class DrinkQuery(NamedTuple):
+    # Drink phrase extracted by a pattern, None if no pattern matched
+    drink: Optional[str]
+    # True if the query mentions caffeine
+    caffeine: bool
+
+
+class QueryExtractor:
+    """
+    Extracts the drink phrase from a query with the `drink.rx` patterns of
+    one language, compiled into a single expression so the query is only
+    searched once. Patterns only match at the start of a word and the
+    leftmost match wins (i.e. "caffeine in a cup of tea" -> "a cup of tea").
+    """
+    def __init__(self, patterns: Iterable[str] = (),
+                 caffeine: Iterable[str] = (),
+                 separators: Iterable[str] = ()):
+        """
+        :param patterns: regular expressions with a `drink` named group
+        :param caffeine: words that make a query about caffeine
+        :param separators: words separating drinks in a list; a comma
+            always separates drinks
+        """
+        self.patterns = [p for p in patterns if p.strip()]
+        self.caffeine = [c.lower() for c in caffeine if c.strip()]
+        self.separators = [s.lower() for s in separators if s.strip()]
+        alternatives = list()
+        self._groups: List[str] = list()
+        for idx, pattern in enumerate(self.patterns):
+            group = f"{DRINK_GROUP}{idx}"
+            alternatives.append(
+                f"(?<!\\w)(?:{_rename_drink_group(pattern, group)})")
+            self._groups.append(group)
+        self._drink = re.compile("|".join(alternatives), re.IGNORECASE) \
+            if alternatives else None
+        self._caffeine = _words_regex(self.caffeine)
+        self._separators = _words_regex(self.separators, ",")
+
+    @classmethod
+    def from_resources(cls, resources: SkillResources) -> 'QueryExtractor':
+        """
+        Build an extractor from the `drink` regex and `caffeine` and
+        `drink_separator` vocab files of one language. Missing files are
+        treated as empty.
+        :param resources: resources of the language to parse queries in
+        :return: QueryExtractor for the language of `resources`
+        """
+        try:
+            patterns = resources.load_regex_file(DRINK_REGEX)
+        except FileNotFoundError:
+            patterns = list()
+        def _vocab(name: str) -> List[str]:
+            try:
+                return [word for line in resources.load_vocabulary_file(name)
+                        for word in line]
+            except FileNotFoundError:
+                return list()
+
+        return cls(patterns, _vocab(CAFFEINE_VOC), _vocab(SEPARATORS_VOC))
+
+    def extract(self, query: str) -> DrinkQuery:
+        """
+        Parse a query
+        :param query: utterance to parse
+        :return: DrinkQuery with the drink phrase and whether the query is
+            about caffeine
+        """
+        drink = None
+        if self._drink:
+            match = self._drink.search(query)
+            if match:
+                for group in self._groups:
+                    drink = match.group(group)
+                    if drink is not None:
+                        break
+        return DrinkQuery(drink, bool(self._caffeine and
+                                      self._caffeine.search(query)))
+
+    def separates(self, text: str) -> bool:
+        """
+        Check if `text` (i.e. what is between two drink names) separates
+        items of a list
+        :param text: part of a query
+        :return: True if `text` has a separator word or a comma
+        """
+        return bool(self._separators and self._separators.search(text))
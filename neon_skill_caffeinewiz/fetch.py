@@ -0,0 +1,128 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Framework
+# All trademark and other rights reserved by their respective owners
+# Copyright 2008-2025 Neongecko.com Inc.
+# Contributors: Daniel McKnight, Guy Daniels, Elon Gasper, Richard Leeds,
+# Regina Bloomstine, Casimiro Ferreira, Andrii Pernatii, Kirill Hrymailo
+# BSD-3 License
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from this
+#    software without specific prior written permission.
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS  BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS;  OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE,  EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from dataclasses import dataclass
+from time import monotonic
+from typing import Dict, Optional
+
+import requests
+
+from ovos_utils.log import LOG
+
+# Upper bound on a source page; the real pages are well under 1MiB
+DEFAULT_MAX_BYTES = 8 * 1024 * 1024
+DEFAULT_DEADLINE = 15
+_CHUNK_SIZE = 64 * 1024
+
+
+@dataclass
+class FetchResult:
+    """
+    Outcome of fetching one source. `body` is only set for a 200 response;
+    a 304 response means the cached data for this source is still current.
+    """
+    name: str
+    status: Optional[int] = None
+    body: Optional[bytes] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def not_modified(self) -> bool:
+        return self.status == 304
+
+
+class SourceFetcher:
+    """
+    Fetches source pages over a shared, pooled HTTP session (with gzip) and
+    remembers ETag/Last-Modified validators so unchanged pages are answered
+    with 304 Not Modified.
+    """
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES,
+                 session: Optional[requests.Session] = None):
+        self.max_bytes = max_bytes
+        self.session = session or requests.Session()
+        self.session.headers.update({"Accept-Encoding": "gzip, deflate",
+                                     "User-Agent": "neon-skill-caffeinewiz"})
+        self.validators: Dict[str, Dict[str, str]] = dict()
+
+    def fetch(self, name: str, url: str,
+              deadline: float = DEFAULT_DEADLINE) -> FetchResult:
+        """
+        Fetch a single source
+        :param name: source name, used to look up stored validators
+        :param url: URL to request
+        :param deadline: seconds allowed for the whole request and download
+        :return: FetchResult; errors are reported, not raised
+        """
+        result = FetchResult(name)
+        validators = self.validators.get(name, {})
+        headers = dict()
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+        expires = monotonic() + deadline
+        try:
+            with self.session.get(url, headers=headers, stream=True,
+                                  timeout=deadline) as resp:
+                result.status = resp.status_code
+                if resp.status_code == 304:
+                    return result
+                resp.raise_for_status()
+                length = resp.headers.get("Content-Length")
+                if length and length.isdigit() and \
+                        int(length) > self.max_bytes:
+                    raise ValueError(f"Response too large ({length} bytes)")
+                body = bytearray()
+                for chunk in resp.iter_content(_CHUNK_SIZE):
+                    body.extend(chunk)
+                    if len(body) > self.max_bytes:
+                        raise ValueError(f"Response exceeded "
+                                         f"{self.max_bytes} bytes")
+                    if monotonic() > expires:
+                        raise TimeoutError(f"Deadline of {deadline}s "
+                                           f"exceeded")
+                result.body = bytes(body)
+                result.etag = resp.headers.get("ETag")
+                result.last_modified = resp.headers.get("Last-Modified")
+        except Exception as e:
+            result.error = str(e) or type(e).__name__
+            LOG.error(f"Error fetching {name} ({url}): {result.error}")
+        return result
+
+    def commit(self, result: FetchResult):
+        """
+        Store the validators of a successfully parsed response, so the next
+        request for this source can be conditional
+        :param result: FetchResult with a parsed body
+        """
+        if result.etag or result.last_modified:
+            self.validators[result.name] = {
+                "etag": result.etag, "last_modified": result.last_modified}
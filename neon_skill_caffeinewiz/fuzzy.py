@@ -0,0 +1,130 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Framework
+# All trademark and other rights reserved by their respective owners
+# Copyright 2008-2025 Neongecko.com Inc.
+# Contributors: Daniel McKnight, Guy Daniels, Elon Gasper, Richard Leeds,
+# Regina Bloomstine, Casimiro Ferreira, Andrii Pernatii, Kirill Hrymailo
+# BSD-3 License
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from this
+#    software without specific prior written permission.
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS  BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS;  OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE,  EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from math import ceil
+from typing import Dict, FrozenSet, List, Sequence, Tuple
+
+
+def trigrams(text: str) -> FrozenSet[str]:
+    """
+    Get the padded character trigrams of a string. Padding lets word
+    boundaries contribute to the score, so short names still match.
+    :param text: string to split
+    :return: set of trigrams
+    """
+    padded = f"  {text} "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+def similarity(query: FrozenSet[str], name: FrozenSet[str]) -> float:
+    """
+    Get the similarity of a query to a name: the mean of the fraction of
+    query trigrams found in the name (containment) and the Jaccard index of
+    both sets. Containment keeps misspellings of a name close to it when the
+    name has more words than the query ("coka cola" and "coca-cola classic"),
+    while Jaccard prefers the name closest in length.
+    :param query: trigrams of the query
+    :param name: trigrams of the name
+    :return: similarity in [0.0, 1.0]
+    """
+    overlap = len(query & name)
+    if not overlap:
+        return 0.0
+    return (overlap / len(query) +
+            overlap / (len(query) + len(name) - overlap)) / 2
+
+
+class FuzzyIndex:
+    """
+    Trigram index ranking names by `similarity` to a query. Candidates
+    are generated with prefix filtering: a name can only reach `cutoff` if it
+    shares one of the query's rarest trigrams, so common trigrams are never
+    scanned.
+    """
+    def __init__(self, names: Sequence[str]):
+        self._grams: List[FrozenSet[str]] = [trigrams(n) for n in names]
+        self._postings: Dict[str, List[int]] = dict()
+        for idx, grams in enumerate(self._grams):
+            for gram in grams:
+                self._postings.setdefault(gram, list()).append(idx)
+
+    def __len__(self):
+        return len(self._grams)
+
+    def score(self, query: str, idx: int) -> float:
+        """
+        Get the similarity of `query` to a single indexed name
+        :param query: string to compare
+        :param idx: id of the indexed name
+        :return: similarity in [0.0, 1.0]
+        """
+        return self._similarity(trigrams(query), self._grams[idx])
+
+    _similarity = staticmethod(similarity)
+
+    def rank(self, query: str,
+             ids: Sequence[int]) -> List[Tuple[int, float]]:
+        """
+        Score and sort a set of already matched names
+        :param query: string to compare
+        :param ids: ids of the names to rank
+        :return: list of (name id, score), best match first
+        """
+        query_grams = trigrams(query)
+        scored = [(idx, self._similarity(query_grams, self._grams[idx]))
+                  for idx in ids]
+        scored.sort(key=lambda s: (-s[1], s[0]))
+        return scored
+
+    def search(self, query: str, limit: int = 5,
+               cutoff: float = 0.3) -> List[Tuple[int, float]]:
+        """
+        Get the indexed names most similar to `query`
+        :param query: string to search for
+        :param limit: maximum number of results to return
+        :param cutoff: minimum similarity of returned results (> 0.0)
+        :return: list of (name id, score), best match first
+        """
+        query_grams = trigrams(query)
+        known = sorted((g for g in query_grams if g in self._postings),
+                       key=lambda g: len(self._postings[g]))
+        # Similarity is at most the containment, so similarity >= cutoff
+        # needs at least `required` shared trigrams
+        required = max(1, ceil(cutoff * len(query_grams)))
+        if len(known) < required:
+            return []
+        candidates = set()
+        for gram in known[:len(known) - required + 1]:
+            candidates.update(self._postings[gram])
+        scored = list()
+        for idx in candidates:
+            score = self._similarity(query_grams, self._grams[idx])
+            if score >= cutoff:
+                scored.append((idx, score))
+        scored.sort(key=lambda s: (-s[1], s[0]))
+        return scored[:limit]
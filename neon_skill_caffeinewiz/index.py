@@ -0,0 +1,494 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Framework
+# All trademark and other rights reserved by their respective owners
+# Copyright 2008-2025 Neongecko.com Inc.
+# Contributors: Daniel McKnight, Guy Daniels, Elon Gasper, Richard Leeds,
+# Regina Bloomstine, Casimiro Ferreira, Andrii Pernatii, Kirill Hrymailo
+# BSD-3 License
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from this
+#    software without specific prior written permission.
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS  BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS;  OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE,  EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from array import array
+from collections import deque
+from dataclasses import dataclass, field
+from enum import Enum
+from itertools import chain
+from typing import Callable, Dict, FrozenSet, Iterable, Iterator, List, \
+    Optional, Sequence, Set, Tuple
+
+from neon_skill_caffeinewiz.fuzzy import FuzzyIndex, similarity, trigrams
+from neon_skill_caffeinewiz.store import DrinkStore
+
+GRAM_SIZE = 3
+# Minimum similarity and maximum number of results for fuzzy fallback matches.
+# Similarity of trigram sets (see `fuzzy.similarity`) scores lower than the
+# difflib ratio (cutoff 0.6) this replaced
+FUZZY_CUTOFF = 0.4
+FUZZY_LIMIT = 5
+# Maximum number of keys `DrinkIndex.apply` adds before rebuilding
+OVERLAY_LIMIT = 512
+# Fraction of keys `DrinkIndex.apply` may add or leave unused before
+# rebuilding
+REBUILD_RATIO = 0.25
+
+
+class MatchType(str, Enum):
+    EXACT = "exact"
+    SUBSTRING = "substring"
+    FUZZY = "fuzzy"
+
+
+@dataclass
+class DrinkMatch:
+    row: Sequence[str]
+    score: float
+    match_type: MatchType
+
+    @property
+    def name(self) -> str:
+        return self.row[0]
+
+
+@dataclass
+class MatchResult:
+    """
+    Ranked result of a single drink lookup. `matches` is ordered best first.
+    """
+    query: str
+    matches: List[DrinkMatch] = field(default_factory=list)
+
+    def __bool__(self):
+        return bool(self.matches)
+
+    def __len__(self):
+        return len(self.matches)
+
+    @property
+    def best(self) -> Optional[DrinkMatch]:
+        return self.matches[0] if self.matches else None
+
+    @property
+    def alternatives(self) -> List[DrinkMatch]:
+        return self.matches[1:]
+
+    @property
+    def rows(self) -> list:
+        return [m.row for m in self.matches]
+
+
+@dataclass
+class DrinkMention:
+    """
+    A drink name or alias found in a query, at `query[start:end]`
+    """
+    start: int
+    end: int
+    key: str
+    row: Sequence[str]
+
+    @property
+    def name(self) -> str:
+        return self.row[0]
+
+
+class SubstringIndex:
+    """
+    q-gram index answering "which names contain this query".
+    Every substring of length 1..GRAM_SIZE is indexed, so short queries are
+    a single dict lookup; longer queries intersect trigram postings and then
+    verify the (few) remaining candidates.
+    """
+    def __init__(self, names: Sequence[str]):
+        self._names = names
+        self._grams: Dict[str, List[int]] = dict()
+        for idx, name in enumerate(names):
+            seen = set()
+            for size in range(1, GRAM_SIZE + 1):
+                for start in range(len(name) - size + 1):
+                    gram = name[start:start + size]
+                    if gram not in seen:
+                        seen.add(gram)
+                        self._grams.setdefault(gram, list()).append(idx)
+
+    def search(self, query: str) -> List[int]:
+        """
+        Get the sorted ids of every name that contains `query`
+        :param query: string to search for
+        :return: list of matching name ids
+        """
+        if not query:
+            return list(range(len(self._names)))
+        if len(query) <= GRAM_SIZE:
+            return list(self._grams.get(query, ()))
+        postings = list()
+        for start in range(len(query) - GRAM_SIZE + 1):
+            posting = self._grams.get(query[start:start + GRAM_SIZE])
+            if not posting:
+                return []
+            postings.append(posting)
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates.intersection_update(posting)
+            if not candidates:
+                return []
+        return sorted(idx for idx in candidates
+                      if query in self._names[idx])
+
+
+class NameAutomaton:
+    """
+    Aho-Corasick automaton answering "which names occur in this query" in a
+    single pass over the query, independent of the number of names.
+    """
+    def __init__(self, names: Sequence[str]):
+        self._goto: List[Dict[str, int]] = [dict()]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [list()]
+        self._always: List[int] = list()
+        for idx, name in enumerate(names):
+            if not name:
+                # An empty name is contained in every query
+                self._always.append(idx)
+                continue
+            state = 0
+            for char in name:
+                nxt = self._goto[state].get(char)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto.append(dict())
+                    self._fail.append(0)
+                    self._out.append(list())
+                    self._goto[state][char] = nxt
+                state = nxt
+            self._out[state].append(idx)
+        self._build_failure_links()
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def search(self, text: str) -> List[int]:
+        """
+        Get the sorted ids of every name that occurs in `text`
+        :param text: string to scan
+        :return: list of matching name ids
+        """
+        found = set(self._always)
+        state = 0
+        for char in text:
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            found.update(self._out[state])
+        return sorted(found)
+
+    def finditer(self, text: str) -> Iterator[Tuple[int, int]]:
+        """
+        Find every occurrence of a (non-empty) name in `text`
+        :param text: string to scan
+        :return: iterator of (end offset, name id) in order of end offset
+        """
+        state = 0
+        for end, char in enumerate(text, 1):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            for idx in self._out[state]:
+                yield end, idx
+
+
+class DrinkIndex:
+    """
+    Prebuilt lookup over a drink table (a DrinkStore or a sequence of
+    `[name, ...]` rows). Returns exactly the rows selected by
+    `name in drink or drink in name`, in table order. Optional `aliases`
+    (alias -> name) are matched like names and resolve to the named row.
+
+    Lookup structures are built over "keys" (names and aliases) and map to
+    rows through `_key_rows`, so `apply` can move an index to an updated
+    table without rebuilding them.
+    """
+    def __init__(self, rows: Iterable[Sequence],
+                 aliases: Optional[Dict[str, str]] = None):
+        self.rows = rows if isinstance(rows, DrinkStore) else tuple(rows)
+        names = _names(self.rows)
+        keys = names
+        key_rows = array('i', range(len(names)))
+        if aliases:
+            keys = list(names)
+            for alias, idx in _alias_rows(names, aliases).items():
+                keys.append(alias)
+                key_rows.append(idx)
+        self._keys = keys
+        self._key_rows = key_rows
+        self._unused = 0
+        self._extra_keys: List[str] = list()
+        self._extra_rows: List[int] = list()
+        self._extra_grams: List[FrozenSet[str]] = list()
+        self._extra_automaton = NameAutomaton(())
+        self._substrings = SubstringIndex(keys)
+        self._automaton = NameAutomaton(keys)
+        self._fuzzy = FuzzyIndex(keys)
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __getattr__(self, name):
+        # Lookup structures of a restored index are loaded on first use
+        if self._load_deferred():
+            return getattr(self, name)
+        raise AttributeError(name)
+
+    def _load_deferred(self) -> bool:
+        """
+        Load the lookup structures passed to `from_state` as `deferred`
+        :return: True if anything was loaded
+        """
+        deferred = self.__dict__.get("_deferred")
+        if deferred is None:
+            return False
+        # Kept until loading succeeds, so a failure is raised again instead
+        # of leaving an index without lookup structures
+        self.__dict__.update(deferred())
+        del self.__dict__["_deferred"]
+        return True
+
+    def export_state(self) -> dict:
+        """
+        Get the built lookup structures, without rows, for persisting
+        """
+        self._load_deferred()
+        return {key: val for key, val in self.__dict__.items()
+                if key != "rows"}
+
+    @classmethod
+    def from_state(cls, rows: Sequence, state: dict,
+                   deferred: Optional[Callable[[], dict]] = None) \
+            -> 'DrinkIndex':
+        """
+        Restore an index from `export_state` without rebuilding it
+        :param rows: the rows the index was built from
+        :param state: value returned by `export_state`
+        :param deferred: optional function returning the rest of `state`,
+            called the first time a missing structure is used
+        :return: DrinkIndex over `rows`
+        """
+        index = cls.__new__(cls)
+        index.__dict__.update(state)
+        index.rows = rows
+        if deferred is not None:
+            index._deferred = deferred
+        return index
+
+    def apply(self, rows: Iterable[Sequence],
+              aliases: Optional[Dict[str, str]] = None) -> 'DrinkIndex':
+        """
+        Get an index over an updated version of this index's table. Lookup
+        structures are shared with this index, which is not modified: keys
+        that are gone are ignored and new keys are matched by scanning a
+        small overlay. The index is rebuilt instead once the overlay or the
+        number of unused keys grows past OVERLAY_LIMIT or REBUILD_RATIO.
+        :param rows: updated rows
+        :param aliases: aliases for the updated rows (alias -> name)
+        :return: DrinkIndex over `rows`
+        """
+        rows = rows if isinstance(rows, DrinkStore) else tuple(rows)
+        names = _names(rows)
+        wanted: Dict[str, List[int]] = dict()
+        for idx, name in enumerate(names):
+            wanted.setdefault(name, list()).append(idx)
+        for alias, idx in _alias_rows(names, aliases).items():
+            wanted[alias] = [idx]
+
+        key_rows = array('i')
+        unused = 0
+        for key in self._keys:
+            ids = wanted.get(key)
+            if ids:
+                key_rows.append(ids.pop(0))
+            else:
+                key_rows.append(-1)
+                unused += 1
+        extra = [(key, idx) for key, ids in wanted.items() for idx in ids]
+        limit = REBUILD_RATIO * len(self._keys)
+        if len(extra) > min(OVERLAY_LIMIT, limit) or unused > limit:
+            return DrinkIndex(rows, aliases)
+
+        index = DrinkIndex.from_state(rows, self.export_state())
+        index._key_rows = key_rows
+        index._unused = unused
+        index._extra_keys = [key for key, _ in extra]
+        index._extra_rows = [idx for _, idx in extra]
+        index._extra_grams = [trigrams(key) for key, _ in extra]
+        index._extra_automaton = NameAutomaton(index._extra_keys)
+        return index
+
+    @property
+    def aliases(self) -> Dict[str, str]:
+        """
+        Aliases indexed for this table (alias -> name)
+        """
+        names = _names(self.rows)
+        keys = chain(zip(self._keys, self._key_rows),
+                     zip(self._extra_keys, self._extra_rows))
+        return {key: names[idx] for key, idx in keys
+                if idx >= 0 and key != names[idx]}
+
+    def _search_keys(self, drink: str) -> Set[int]:
+        keys = set(self._substrings.search(drink))
+        keys.update(self._automaton.search(drink))
+        if self._unused:
+            keys = {key for key in keys if self._key_rows[key] >= 0}
+        return keys
+
+    def _search_extra(self, drink: str) -> List[int]:
+        return [i for i, key in enumerate(self._extra_keys)
+                if key in drink or drink in key]
+
+    def match_ids(self, drink: str) -> List[int]:
+        """
+        Get the sorted row ids matching the requested drink
+        :param drink: normalized drink name
+        :return: list of row ids in table order
+        """
+        key_rows = self._key_rows
+        ids = {key_rows[key] for key in self._search_keys(drink)}
+        ids.update(self._extra_rows[i] for i in self._search_extra(drink))
+        ids.discard(-1)
+        return sorted(ids)
+
+    def match(self, drink: str) -> list:
+        """
+        Get the rows matching the requested drink
+        :param drink: normalized drink name
+        :return: list of matching rows in table order
+        """
+        return [self.rows[idx] for idx in self.match_ids(drink)]
+
+    def contains(self, drink: str) -> bool:
+        """
+        Check if any row matches the requested drink
+        :param drink: normalized drink name
+        :return: True if at least one row matches
+        """
+        if self._unused or self._extra_keys:
+            return bool(self.match_ids(drink))
+        return bool(self._automaton.search(drink) or
+                    self._substrings.search(drink))
+
+    def mentions(self, query: str) -> List[DrinkMention]:
+        """
+        Find the drink names and aliases mentioned in a query with a single
+        scan, whose cost doesn't depend on the size of the table. Mentions
+        start and end at word boundaries and don't overlap; the leftmost,
+        then longest, name wins.
+        :param query: normalized query
+        :return: list of DrinkMention in query order
+        """
+        found = list()
+        for keys, key_rows, automaton in (
+                (self._keys, self._key_rows, self._automaton),
+                (self._extra_keys, self._extra_rows, self._extra_automaton)):
+            for end, key in automaton.finditer(query):
+                start = end - len(keys[key])
+                if key_rows[key] < 0 or \
+                        (start and query[start - 1].isalnum()) or \
+                        (end < len(query) and query[end].isalnum()):
+                    continue
+                found.append((start, -end, keys[key], key_rows[key]))
+        found.sort()
+        mentions = list()
+        end = 0
+        for start, neg_end, key, idx in found:
+            if start >= end:
+                end = -neg_end
+                mentions.append(DrinkMention(start, end, key, self.rows[idx]))
+        return mentions
+
+    def find(self, drink: str) -> MatchResult:
+        """
+        Look up a drink with a single index probe and rank the results by
+        trigram similarity. If no name contains (or is contained in) the
+        query, the closest names by similarity are returned instead.
+        :param drink: normalized drink name
+        :return: MatchResult with the best match first
+        """
+        keys = self._search_keys(drink)
+        extra = self._search_extra(drink)
+        if keys or extra:
+            scored = self._fuzzy.rank(drink, sorted(keys))
+            match_type = MatchType.SUBSTRING
+            limit = None
+        else:
+            # Unused keys and aliases may take some of the top results
+            scored = self._fuzzy.search(drink, len(self._keys), FUZZY_CUTOFF)
+            extra = range(len(self._extra_keys))
+            match_type = MatchType.FUZZY
+            limit = FUZZY_LIMIT
+        candidates = [(self._key_rows[key], score, self._keys[key])
+                      for key, score in scored]
+        if extra:
+            grams = trigrams(drink)
+            for i in extra:
+                score = similarity(grams, self._extra_grams[i])
+                if match_type == MatchType.SUBSTRING or score >= FUZZY_CUTOFF:
+                    candidates.append((self._extra_rows[i], score,
+                                       self._extra_keys[i]))
+            candidates.sort(key=lambda c: (-c[1], c[0]))
+
+        matches = list()
+        seen = {-1}
+        for idx, score, key in candidates:
+            if idx in seen:
+                continue
+            seen.add(idx)
+            matches.append(DrinkMatch(self.rows[idx], score, MatchType.EXACT
+                                      if key == drink else match_type))
+        return MatchResult(drink, matches[:limit])
+
+
+def _names(rows: Sequence) -> Sequence[str]:
+    return getattr(rows, "names", None) or [row[0] for row in rows]
+
+
+def _alias_rows(names: Sequence[str],
+                aliases: Optional[Dict[str, str]]) -> Dict[str, int]:
+    """
+    Resolve aliases to the first row with the aliased name. Aliases that
+    are names themselves or refer to unknown names are dropped.
+    """
+    if not aliases:
+        return dict()
+    first = dict()
+    for idx, name in enumerate(names):
+        first.setdefault(name, idx)
+    return {alias: first[name] for alias, name in aliases.items()
+            if alias not in first and name in first}
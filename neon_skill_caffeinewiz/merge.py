@@ -0,0 +1,70 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Framework
+# All trademark and other rights reserved by their respective owners
+# Copyright 2008-2025 Neongecko.com Inc.
+# Contributors: Daniel McKnight, Guy Daniels, Elon Gasper, Richard Leeds,
+# Regina Bloomstine, Casimiro Ferreira, Andrii Pernatii, Kirill Hrymailo
+# BSD-3 License
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from this
+#    software without specific prior written permission.
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS  BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS;  OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE,  EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+DrinkRow = Tuple
+DrinkTable = Tuple[DrinkRow, ...]
+
+HEADER_ROW = ("beverage", "quantity (oz)", "caffeine content (mg)")
+
+
+def normalize_key(name: str) -> str:
+    """
+    Get the key used to identify duplicate drink names across sources
+    :param name: drink name as parsed from a source
+    :return: lowercase name with collapsed whitespace
+    """
+    return " ".join(name.lower().split())
+
+
+def merge_drink_tables(*tables: Iterable[Sequence[str]],
+                       sources: Optional[Sequence[int]] = None) -> DrinkTable:
+    """
+    Merge drink tables into one sorted, de-duplicated table in linear time.
+    Rows are truncated to (name, oz, mg); header and malformed rows are
+    dropped. When a drink name is duplicated, the first table's row is kept.
+    :param tables: drink tables in priority order
+    :param sources: optional source id of each table, appended to its rows
+    :return: immutable table sorted by drink name
+    """
+    header_key = normalize_key(HEADER_ROW[0])
+    merged: Dict[str, DrinkRow] = dict()
+    for table_idx, table in enumerate(tables):
+        tag = (sources[table_idx],) if sources else ()
+        for row in table or ():
+            if len(row) < 3:
+                continue
+            key = normalize_key(row[0])
+            if not key or (key == header_key and tuple(row[1:3]) ==
+                           HEADER_ROW[1:]):
+                continue
+            if key in merged:
+                continue
+            merged[key] = (row[0], row[1], row[2]) + tag
+    return tuple(sorted(merged.values()))
@@ -0,0 +1,181 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Framework
+# All trademark and other rights reserved by their respective owners
+# Copyright 2008-2025 Neongecko.com Inc.
+# Contributors: Daniel McKnight, Guy Daniels, Elon Gasper, Richard Leeds,
+# Regina Bloomstine, Casimiro Ferreira, Andrii Pernatii, Kirill Hrymailo
+# BSD-3 License
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from this
+#    software without specific prior written permission.
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS  BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS;  OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE,  EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from bisect import bisect_left
+from collections import Counter
+from contextlib import nullcontext
+from datetime import datetime
+from threading import Lock
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional
+
+from ovos_utils.log import LOG
+
+# Upper bounds of latency histogram buckets (milliseconds)
+LATENCY_BUCKETS_MS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250,
+                      500, 1000, 2500, 5000, 10000)
+
+# Returned by `Metrics.timer` when disabled so timing a block costs nothing
+_NOT_TIMED = nullcontext()
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram of latencies in milliseconds
+    """
+    def __init__(self, bounds: tuple = LATENCY_BUCKETS_MS):
+        self.bounds = bounds
+        # The last bucket counts values above every bound
+        self.counts: List[int] = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate a quantile as the upper bound of the bucket containing it
+        :param q: quantile to estimate, between 0 and 1
+        :return: estimated value, or None if nothing was observed
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def as_dict(self) -> dict:
+        return {"count": self.count,
+                "mean_ms": round(self.total / self.count, 3)
+                if self.count else None,
+                "max_ms": round(self.max, 3),
+                "p50_ms": self.quantile(0.5),
+                "p99_ms": self.quantile(0.99),
+                "buckets_ms": list(self.bounds),
+                "counts": list(self.counts)}
+
+
+class _StageTimer:
+    __slots__ = ("_metrics", "_stage", "_start")
+
+    def __init__(self, metrics: 'Metrics', stage: str):
+        self._metrics = metrics
+        self._stage = stage
+
+    def __enter__(self):
+        self._start = perf_counter()
+        return self
+
+    def __exit__(self, *args):
+        self._metrics.observe(self._stage, perf_counter() - self._start)
+
+
+class Metrics:
+    """
+    Per-stage latency histograms, event counters and gauges. Recording is a
+    no-op while `enabled` is False; gauges are only evaluated when read.
+    """
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self.since = datetime.now()
+        self._counters = Counter()
+        self._histograms: Dict[str, Histogram] = dict()
+        self._gauges: Dict[str, Callable[[], Any]] = dict()
+        self._lock = Lock()
+
+    def increment(self, name: str, value: int = 1):
+        """
+        Add to a counter
+        :param name: counter name
+        :param value: amount to add
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[name] += value
+
+    def observe(self, stage: str, seconds: float):
+        """
+        Record the latency of one run of a stage
+        :param stage: stage name
+        :param seconds: time the stage took
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            if stage not in self._histograms:
+                self._histograms[stage] = Histogram()
+            self._histograms[stage].observe(seconds * 1000)
+
+    def timer(self, stage: str):
+        """
+        Get a context manager recording the latency of a block as `stage`
+        """
+        return _StageTimer(self, stage) if self.enabled else _NOT_TIMED
+
+    def add_gauge(self, name: str, func: Callable[[], Any]):
+        """
+        Register a value reported with every snapshot
+        :param name: gauge name
+        :param func: function returning the current value
+        """
+        self._gauges[name] = func
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+            self.since = datetime.now()
+
+    def snapshot(self) -> dict:
+        """
+        Get all metrics as a JSON-serializable dict
+        """
+        gauges = dict()
+        for name, func in self._gauges.items():
+            try:
+                gauges[name] = func()
+            except Exception as e:
+                LOG.error(f"Failed to read gauge {name}: {e}")
+                gauges[name] = None
+        with self._lock:
+            return {"enabled": self.enabled,
+                    "since": self.since.isoformat(),
+                    "counters": dict(sorted(self._counters.items())),
+                    "latency": {stage: hist.as_dict() for stage, hist
+                                in sorted(self._histograms.items())},
+                    "gauges": gauges}
@@ -26,12 +26,16 @@
 # NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
 # SOFTWARE,  EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
 
-from typing import List
+from typing import List, Optional
 from pydantic import BaseModel, Field
 
 
 class CaffeineRequest(BaseModel):
     drink: str = Field(description="Name of the drink to get information for")
+    total: bool = Field(
+        default=False,
+        description="Include the total caffeine of the requested drinks"
+    )
 
 
 class CaffeineInformation(BaseModel):
@@ -48,7 +52,20 @@ class CaffeineInformation(BaseModel):
 
 
 class CaffeineResponse(BaseModel):
-    best_match: CaffeineInformation = Field(description="Best matched result")
+    best_match: Optional[CaffeineInformation] = Field(
+        default=None, description="Best matched result, None if not found"
+    )
     alternatives: List[CaffeineInformation] = Field(
         default=[], description="List of alternative drinks found"
     )
+    drinks: List[CaffeineInformation] = Field(
+        default=[], description="Best match of each drink named in a request "
+                                "for more than one drink"
+    )
+    total_caffeine_mg: Optional[float] = Field(
+        default=None, description="Total caffeine of the requested drinks in "
+                                  "milligrams, if requested"
+    )
+    error: Optional[str] = Field(
+        default=None, description="Reason a batch item has no result"
+    )
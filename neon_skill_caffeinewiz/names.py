@@ -0,0 +1,149 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Framework
+# All trademark and other rights reserved by their respective owners
+# Copyright 2008-2025 Neongecko.com Inc.
+# Contributors: Daniel McKnight, Guy Daniels, Elon Gasper, Richard Leeds,
+# Regina Bloomstine, Casimiro Ferreira, Andrii Pernatii, Kirill Hrymailo
+# BSD-3 License
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from this
+#    software without specific prior written permission.
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS  BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS;  OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE,  EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import json
+import os
+
+from typing import Callable, Dict, Iterable, Optional
+
+from lingua_franca.parse import normalize
+from ovos_utils.log import LOG
+
+NAME_CACHE_VERSION = 1
+
+
+def normalize_drink_name(name: str, lang: str) -> str:
+    """
+    Normalize a drink name from a data source for matching against parsed
+    utterances (i.e. "five-hour energy" -> "5 hour energy")
+    :param name: drink name as published by the source
+    :param lang: language of the name
+    :return: normalized name
+    """
+    return normalize(name.replace('-', ' '), lang)
+
+
+class NameCache:
+    """
+    Memoized drink name normalization keyed by (raw name, lang), optionally
+    persisted as JSON so names are only normalized once across refreshes.
+    """
+    def __init__(self, path: Optional[str] = None,
+                 normalizer: Callable[[str, str], str] = normalize_drink_name):
+        self.path = path
+        self._normalizer = normalizer
+        self._names: Dict[str, Dict[str, str]] = dict()
+        self._dirty = False
+        self.misses = 0
+        if path:
+            self._load()
+
+    def __len__(self):
+        return sum(len(names) for names in self._names.values())
+
+    def _load(self):
+        try:
+            with open(self.path) as f:
+                data = json.load(f)
+            if data.get("version") != NAME_CACHE_VERSION:
+                raise ValueError(f"Unsupported version: {data.get('version')}")
+            self._names = data["names"]
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            LOG.warning(f"Discarding name cache {self.path}: {e}")
+
+    def save(self):
+        """
+        Write the cache to `path` if any names were added since it was read
+        """
+        if not self.path or not self._dirty:
+            return
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({"version": NAME_CACHE_VERSION, "names": self._names},
+                      f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+    def get(self, name: str, lang: str) -> Optional[str]:
+        """
+        Get the cached normalized form of a name without normalizing it
+        :param name: raw drink name
+        :param lang: language of the name
+        :return: normalized name, or None if `name` was never normalized
+        """
+        return self._names.get(lang, {}).get(name)
+
+    def normalize(self, name: str, lang: str) -> str:
+        """
+        Get the normalized form of a name, normalizing it on a cache miss
+        :param name: raw drink name
+        :param lang: language of the name
+        :return: normalized name
+        """
+        names = self._names.setdefault(lang, dict())
+        normalized = names.get(name)
+        if normalized is None:
+            self.misses += 1
+            try:
+                normalized = self._normalizer(name, lang)
+            except Exception as e:
+                LOG.error(f"Failed to normalize '{name}': {e}")
+                normalized = name
+            names[name] = normalized
+            self._dirty = True
+        return normalized
+
+    def update(self, names: Iterable[str], lang: str) -> int:
+        """
+        Normalize every name that is not cached yet
+        :param names: raw drink names
+        :param lang: language of the names
+        :return: number of names that were normalized
+        """
+        misses = self.misses
+        for name in names:
+            self.normalize(name, lang)
+        return self.misses - misses
+
+    def aliases(self, names: Iterable[str], lang: str) -> Dict[str, str]:
+        """
+        Get an alias table for cached names whose normalized form differs.
+        Names that were never normalized are not included.
+        :param names: raw drink names
+        :param lang: language of the names
+        :return: dict of normalized alias to raw name, first name wins
+        """
+        cached = self._names.get(lang, {})
+        aliases = dict()
+        for name in names:
+            alias = cached.get(name)
+            if alias and alias != name:
+                aliases.setdefault(alias, name)
+        return aliases
@@ -0,0 +1,210 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Framework
+# All trademark and other rights reserved by their respective owners
+# Copyright 2008-2025 Neongecko.com Inc.
+# Contributors: Daniel McKnight, Guy Daniels, Elon Gasper, Richard Leeds,
+# Regina Bloomstine, Casimiro Ferreira, Andrii Pernatii, Kirill Hrymailo
+# BSD-3 License
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from this
+#    software without specific prior written permission.
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS  BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS;  OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE,  EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import codecs
+import html
+import re
+
+from html.parser import HTMLParser
+from typing import Iterable, Iterator, List, Union
+
+from ovos_utils.log import LOG
+
+CAFFEINE_INFORMER_URL = "https://www.caffeineinformer.com/the-caffeine-database"
+CAFFEINE_WIZ_URL = "http://caffeinewiz.com/"
+# Characters fed to the streaming parser at a time
+_FEED_SIZE = 16 * 1024
+
+_TBLDATA = re.compile(rb"\btbldata\s*=\s*\[")
+_JS_TOKEN = re.compile(rb"""\s*(?:(?P<open>\[)|(?P<close>\])|(?P<sep>,)|"""
+                       rb""""(?P<str>(?:[^"\\]|\\.)*)"|"""
+                       rb"""(?P<bare>[^\s,\[\]"]+))""", re.DOTALL)
+_JS_ESCAPE = re.compile(r"\\(u[0-9a-fA-F]{4}|.)", re.DOTALL)
+_JS_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "b": "\b", "f": "\f"}
+_MARKUP = re.compile(r"<!--.*?-->|</?[a-zA-Z][^>]*>", re.DOTALL)
+
+
+def _unescape_js(match) -> str:
+    char = match.group(1)
+    if char[0] == "u" and len(char) == 5:
+        return chr(int(char[1:], 16))
+    return _JS_ESCAPES.get(char, char)
+
+
+def _informer_cell(raw: bytes) -> str:
+    """
+    Decode a JavaScript string literal body and remove inline markup
+    """
+    cell = raw.decode("utf-8", "replace")
+    if "\\" in cell:
+        cell = _JS_ESCAPE.sub(_unescape_js, cell)
+    if "<" in cell:
+        cell = _MARKUP.sub("", cell)
+    if "&" in cell:
+        cell = html.unescape(cell)
+    return cell.lower()
+
+
+def iter_caffeine_informer_rows(page: bytes) -> Iterator[List[str]]:
+    """
+    Stream drink rows from the `tbldata` array on the caffeineinformer page.
+    Rows that are not flat arrays of at least 3 values are skipped and
+    tokenizing stops at the first unrecognized input, keeping rows read so far.
+    :param page: raw HTML response
+    :return: iterator of [name, oz, mg, category, mg/oz] rows
+    """
+    start = _TBLDATA.search(page)
+    if not start:
+        LOG.warning("No tbldata array found in caffeineinformer page")
+        return
+    pos = start.end()
+    row = None
+    depth = 1
+    match = _JS_TOKEN.match
+    while True:
+        token = match(page, pos)
+        if not token:
+            LOG.warning(f"Unexpected caffeineinformer data at offset {pos}")
+            return
+        pos = token.end()
+        kind = token.lastgroup
+        if kind == "sep":
+            continue
+        if kind == "open":
+            depth += 1
+            row = list() if depth == 2 else None
+        elif kind == "close":
+            depth -= 1
+            if depth == 0:
+                return
+            if depth == 1:
+                if row is not None and len(row) >= 3:
+                    yield row
+                else:
+                    LOG.debug("Skipping malformed caffeineinformer row")
+                row = None
+        elif depth == 2 and row is not None:
+            row.append(_informer_cell(token.group(kind)) if kind == "str"
+                       else token.group(kind).decode("utf-8", "replace"))
+        elif depth == 1:
+            LOG.debug("Skipping malformed caffeineinformer row")
+
+
+def parse_caffeine_informer(page: bytes) -> list:
+    """
+    Parse drink rows from the caffeineinformer database page
+    :param page: raw HTML response
+    :return: list of [name, oz, mg, category, mg/oz] rows
+    """
+    return list(iter_caffeine_informer_rows(page))
+
+
+class _FirstTableParser(HTMLParser):
+    """
+    Event driven parser that collects the text of `<td>` cells in the first
+    `<table>` of a document and ignores everything else.
+    """
+    def __init__(self):
+        HTMLParser.__init__(self, convert_charrefs=True)
+        self.done = False
+        self.cells = list()
+        self._depth = 0
+        self._cell = None
+
+    def handle_starttag(self, tag, attrs):
+        if self.done:
+            return
+        if tag == "table":
+            self._depth += 1
+        elif tag == "td" and self._depth:
+            self._close_cell()
+            self._cell = list()
+
+    def handle_endtag(self, tag):
+        if self.done or not self._depth:
+            return
+        if tag in ("td", "tr"):
+            self._close_cell()
+        elif tag == "table":
+            self._depth -= 1
+            if not self._depth:
+                self._close_cell()
+                self.done = True
+
+    def handle_data(self, data):
+        if self._cell is not None:
+            self._cell.append(data)
+
+    def _close_cell(self):
+        if self._cell is None:
+            return
+        text = "".join(self._cell)
+        self._cell = None
+        if text != "\xa0":
+            self.cells.append(text.lower().replace("\n", ""))
+
+
+def iter_caffeine_wiz_rows(chunks: Iterable[Union[bytes, str]]) -> \
+        Iterator[List[str]]:
+    """
+    Stream drink rows from the first table on the caffeinewiz page. Parsing
+    stops as soon as the table is closed.
+    :param chunks: page content, in one or more pieces
+    :return: iterator of [name, oz, mg] rows
+    """
+    parser = _FirstTableParser()
+    decoder = codecs.getincrementaldecoder("utf-8")("replace")
+    row = list()
+    for chunk in chunks:
+        parser.feed(decoder.decode(chunk) if isinstance(chunk, bytes)
+                    else chunk)
+        for cell in parser.cells:
+            row.append(cell)
+            if len(row) == 3:
+                yield row
+                row = list()
+        parser.cells.clear()
+        if parser.done:
+            break
+    else:
+        parser.feed(decoder.decode(b"", final=True))
+        parser.close()
+        parser._close_cell()
+        row.extend(parser.cells)
+    if row:
+        yield row
+
+
+def parse_caffeine_wiz(page: bytes) -> list:
+    """
+    Parse drink rows from the first table on the caffeinewiz page
+    :param page: raw HTML response
+    :return: list of [name, oz, mg] rows, empty if no table was found
+    """
+    return list(iter_caffeine_wiz_rows(
+        page[i:i + _FEED_SIZE] for i in range(0, len(page), _FEED_SIZE)))
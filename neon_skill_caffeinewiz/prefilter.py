@@ -0,0 +1,77 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Framework
+# All trademark and other rights reserved by their respective owners
+# Copyright 2008-2025 Neongecko.com Inc.
+# Contributors: Daniel McKnight, Guy Daniels, Elon Gasper, Richard Leeds,
+# Regina Bloomstine, Casimiro Ferreira, Andrii Pernatii, Kirill Hrymailo
+# BSD-3 License
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from this
+#    software without specific prior written permission.
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS  BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS;  OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE,  EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+from collections import Counter
+from typing import Iterable, Set
+
+# Characters ignored around words, as in `_clean_drink_name`
+_PUNCTUATION = "?:!/;@#$.,()\"'"
+
+
+def tokenize(text: str) -> Set[str]:
+    """
+    Split text into the set of lowercase words used by `PhraseFilter`
+    :param text: utterance or drink name
+    :return: set of words with surrounding punctuation removed
+    """
+    return {word.strip(_PUNCTUATION) for word in text.lower().split()} - {""}
+
+
+class PhraseFilter:
+    """
+    Cheap check for whether a phrase may be about a known drink. A phrase can
+    only match a drink if it contains every word of that drink's name, so
+    each name is represented by its least common word; phrases with none of
+    those words and no vocabulary word are rejected with a set intersection.
+    """
+    def __init__(self, names: Iterable[str], vocab: Iterable[str] = ()):
+        names = [tokenize(name) for name in names]
+        counts = Counter()
+        for words in names:
+            counts.update(words)
+        # Single letters (e.g. "a") are in most phrases and only used if a
+        # name has no other word. Ties go to the longest word, which is less
+        # likely in other phrases
+        self._words = {min(words,
+                           key=lambda w: (len(w) < 2, counts[w], -len(w), w))
+                       for words in names if words}
+        # Any word of a vocabulary phrase is enough to let a phrase through
+        self._vocab = set().union(*(tokenize(v) for v in vocab))
+
+    def __len__(self):
+        return len(self._words)
+
+    def accepts(self, phrase: str) -> bool:
+        """
+        Check if a phrase may mention a known drink or vocabulary word
+        :param phrase: utterance to check
+        :return: False if the phrase can't match; True if it might
+        """
+        words = tokenize(phrase)
+        return not (words.isdisjoint(self._words) and
+                    words.isdisjoint(self._vocab))
@@ -0,0 +1,440 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Framework
+# All trademark and other rights reserved by their respective owners
+# Copyright 2008-2025 Neongecko.com Inc.
+# Contributors: Daniel McKnight, Guy Daniels, Elon Gasper, Richard Leeds,
+# Regina Bloomstine, Casimiro Ferreira, Andrii Pernatii, Kirill Hrymailo
+# BSD-3 License
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from this
+#    software without specific prior written permission.
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS  BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS;  OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE,  EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import csv
+import io
+import json
+import os
+import pickle
+
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, TimeoutError
+from dataclasses import dataclass, field
+from datetime import datetime
+from time import monotonic, perf_counter
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from ovos_utils.log import LOG
+
+from neon_skill_caffeinewiz.fetch import DEFAULT_DEADLINE, FetchResult, \
+    SourceFetcher
+from neon_skill_caffeinewiz.merge import DrinkTable, merge_drink_tables
+from neon_skill_caffeinewiz.parsers import CAFFEINE_INFORMER_URL, \
+    CAFFEINE_WIZ_URL, parse_caffeine_informer, parse_caffeine_wiz
+from neon_skill_caffeinewiz.store import Source
+
+BUNDLED_DATA = os.path.join(os.path.dirname(__file__),
+                            "caffeine_wiz_data.pickle")
+# Seconds a provider may overrun its timeout before it is abandoned
+TIMEOUT_GRACE = 1
+
+
+@dataclass
+class ProviderResult:
+    """
+    Outcome of reading one provider. `rows` is only set when new rows were
+    parsed; `not_modified` means the previous rows are still current.
+    """
+    name: str
+    rows: Optional[list] = None
+    not_modified: bool = False
+    error: Optional[str] = None
+    # Seconds spent parsing, if a payload was parsed
+    parse_time: Optional[float] = None
+    freshness: dict = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return self.not_modified or bool(self.rows)
+
+
+class DrinkProvider(ABC):
+    """
+    A named source of `[name, oz, mg, ...]` drink rows. Subclasses fetch a
+    raw payload and parse it; `rows` runs both and reports errors instead of
+    raising them.
+    """
+    source = Source.LOCAL
+
+    def __init__(self, name: Optional[str] = None,
+                 timeout: float = DEFAULT_DEADLINE,
+                 fallback: Optional['DrinkProvider'] = None):
+        """
+        :param name: unique provider name (default the source label)
+        :param timeout: seconds allowed for fetching and parsing
+        :param fallback: provider whose rows are used until this one has
+            returned any
+        """
+        self.name = name or self.source.label
+        self.timeout = timeout
+        self.fallback = fallback
+
+    @abstractmethod
+    def fetch(self, deadline: float) -> FetchResult:
+        """
+        Get the raw payload of this provider
+        :param deadline: seconds allowed for the request
+        :return: FetchResult; errors are reported, not raised
+        """
+
+    @abstractmethod
+    def parse(self, body: bytes) -> list:
+        """
+        Parse a payload returned by `fetch` into drink rows
+        """
+
+    def commit(self, result: FetchResult):
+        """
+        Remember a payload that was parsed into rows, so an unchanged
+        payload isn't parsed again
+        """
+
+    def freshness(self) -> dict:
+        """
+        Get metadata describing the age of the last committed payload
+        """
+        return dict()
+
+    def default_rows(self) -> list:
+        """
+        Get the rows to use before this provider has returned any
+        """
+        return self.fallback.default_rows() if self.fallback else list()
+
+    def rows(self, deadline: Optional[float] = None) -> ProviderResult:
+        """
+        Fetch and parse the current rows of this provider
+        :param deadline: seconds allowed for fetching (default `timeout`)
+        :return: ProviderResult with new rows, if any
+        """
+        result = ProviderResult(self.name)
+        fetched = self.fetch(self.timeout if deadline is None else deadline)
+        if fetched.error:
+            result.error = fetched.error
+        elif fetched.not_modified:
+            result.not_modified = True
+        elif fetched.body is not None:
+            start = perf_counter()
+            try:
+                result.rows = self.parse(fetched.body)
+            except Exception as e:
+                result.error = f"Parse error: {e}"
+                LOG.error(f"Error parsing {self.name}: {e}")
+            result.parse_time = perf_counter() - start
+            if result.rows:
+                self.commit(fetched)
+            elif not result.error:
+                result.error = "No rows parsed"
+        else:
+            result.error = "Empty response"
+        result.freshness = self.freshness()
+        return result
+
+
+class HttpProvider(DrinkProvider):
+    """
+    Provider of a web page fetched with conditional requests
+    """
+    def __init__(self, url: str, fetcher: Optional[SourceFetcher] = None,
+                 **kwargs):
+        """
+        :param url: page to fetch
+        :param fetcher: SourceFetcher shared by providers, which stores the
+            cache validators of each page
+        """
+        DrinkProvider.__init__(self, **kwargs)
+        self.url = url
+        self.fetcher = fetcher or SourceFetcher()
+
+    def fetch(self, deadline: float) -> FetchResult:
+        return self.fetcher.fetch(self.name, self.url, deadline)
+
+    def commit(self, result: FetchResult):
+        self.fetcher.commit(result)
+
+    def freshness(self) -> dict:
+        return dict(self.fetcher.validators.get(self.name) or {})
+
+
+class CaffeineWizProvider(HttpProvider):
+    source = Source.CAFFEINEWIZ
+
+    def __init__(self, url: str = CAFFEINE_WIZ_URL, **kwargs):
+        kwargs.setdefault("fallback", BundledProvider())
+        HttpProvider.__init__(self, url, **kwargs)
+
+    def parse(self, body: bytes) -> list:
+        return parse_caffeine_wiz(body)
+
+
+class CaffeineInformerProvider(HttpProvider):
+    source = Source.CAFFEINEINFORMER
+
+    def __init__(self, url: str = CAFFEINE_INFORMER_URL, **kwargs):
+        HttpProvider.__init__(self, url, **kwargs)
+
+    def parse(self, body: bytes) -> list:
+        return parse_caffeine_informer(body)
+
+
+class LocalFileProvider(DrinkProvider):
+    """
+    Provider of a local CSV or JSON file. CSV files have `name,oz,mg`
+    columns; JSON files hold a list of `[name, oz, mg]` lists or of objects
+    with `name`, `oz` and `mg` keys. Rows without numeric values (i.e. a
+    header) are skipped. The file is only parsed again once it is modified.
+    """
+    def __init__(self, path: str, name: Optional[str] = None, **kwargs):
+        DrinkProvider.__init__(self, name or path, **kwargs)
+        self.path = os.path.expanduser(path)
+        self._mtime: Optional[float] = None
+
+    def fetch(self, deadline: float) -> FetchResult:
+        result = FetchResult(self.name)
+        try:
+            mtime = os.stat(self.path).st_mtime
+            if mtime == self._mtime:
+                result.status = 304
+                return result
+            with open(self.path, "rb") as f:
+                result.body = f.read()
+            result.status = 200
+            result.last_modified = str(mtime)
+        except OSError as e:
+            result.error = str(e)
+            LOG.error(f"Error reading {self.name}: {e}")
+        return result
+
+    def parse(self, body: bytes) -> list:
+        text = body.decode("utf-8-sig")
+        if self.path.lower().endswith(".json"):
+            records = json.loads(text)
+        else:
+            records = csv.reader(io.StringIO(text))
+        return list(_drink_rows(records))
+
+    def commit(self, result: FetchResult):
+        self._mtime = float(result.last_modified)
+
+    def freshness(self) -> dict:
+        return {"last_modified": datetime.fromtimestamp(
+            self._mtime).isoformat()} if self._mtime else dict()
+
+
+class MemoryProvider(DrinkProvider):
+    """
+    Provider of rows held in memory
+    """
+    def __init__(self, rows: Sequence[Sequence], name: Optional[str] = None,
+                 source: Source = Source.LOCAL, **kwargs):
+        """
+        :param rows: `[name, oz, mg]` rows
+        :param name: unique provider name
+        :param source: Source recorded for these rows
+        """
+        self.source = source
+        DrinkProvider.__init__(self, name, **kwargs)
+        self._rows = list(rows)
+
+    def set_rows(self, rows: Sequence[Sequence]):
+        """
+        Replace the rows returned by the next update
+        """
+        self._rows = list(rows)
+
+    def fetch(self, deadline: float) -> FetchResult:
+        # Rows are returned by `rows` without a payload
+        return FetchResult(self.name, status=200, body=b"")
+
+    def parse(self, body: bytes) -> list:
+        return self._rows
+
+    def default_rows(self) -> list:
+        return self._rows
+
+    def rows(self, deadline: Optional[float] = None) -> ProviderResult:
+        return ProviderResult(self.name, rows=self._rows, parse_time=0.0)
+
+
+class BundledProvider(DrinkProvider):
+    """
+    Provider of the caffeinewiz table shipped with this skill
+    """
+    source = Source.CAFFEINEWIZ
+
+    def __init__(self, path: str = BUNDLED_DATA, **kwargs):
+        DrinkProvider.__init__(self, **kwargs)
+        self.path = path
+        self._rows: Optional[list] = None
+
+    def fetch(self, deadline: float) -> FetchResult:
+        result = FetchResult(self.name)
+        try:
+            with open(self.path, "rb") as f:
+                result.body = f.read()
+            result.status = 200
+        except OSError as e:
+            result.error = str(e)
+        return result
+
+    def parse(self, body: bytes) -> list:
+        return pickle.loads(body)
+
+    def default_rows(self) -> list:
+        if self._rows is None:
+            result = DrinkProvider.rows(self)
+            if result.error:
+                LOG.error(f"Failed to load bundled data: {result.error}")
+                return list()
+            self._rows = result.rows
+        return self._rows
+
+
+def _drink_rows(records: Iterable) -> Iterable[list]:
+    """
+    Normalize file records to `[name, oz, mg]` rows of strings
+    """
+    for record in records:
+        if isinstance(record, dict):
+            record = [record.get("name"), record.get("oz"), record.get("mg")]
+        if not isinstance(record, (list, tuple)) or len(record) < 3:
+            continue
+        name, oz, mg = (str(value).strip() if value is not None else ""
+                        for value in record[:3])
+        try:
+            float(oz), float(mg)
+        except ValueError:
+            continue
+        if name and not name.startswith("#"):
+            yield [" ".join(name.lower().split()), oz, mg]
+
+
+class ProviderAggregator:
+    """
+    Reads providers concurrently, each under its own timeout, and merges
+    their rows into one table in a deterministic priority order
+    """
+    def __init__(self, providers: Iterable[DrinkProvider] = ()):
+        self.providers: List[DrinkProvider] = list()
+        for provider in providers:
+            self.add(provider)
+
+    def add(self, provider: DrinkProvider):
+        """
+        Add a provider with a lower priority than the existing ones
+        :raises ValueError: if a provider with the same name was added
+        """
+        if self.get(provider.name):
+            raise ValueError(f"Duplicate provider name: {provider.name}")
+        self.providers.append(provider)
+
+    def get(self, name: str) -> Optional[DrinkProvider]:
+        for provider in self.providers:
+            if provider.name == name:
+                return provider
+        return None
+
+    @property
+    def names(self) -> List[str]:
+        return [provider.name for provider in self.providers]
+
+    def collect(self, providers: Optional[Sequence[DrinkProvider]] = None) \
+            -> Dict[str, ProviderResult]:
+        """
+        Read providers concurrently. A provider that doesn't finish within
+        its timeout is reported as failed and its result is discarded.
+        :param providers: providers to read (default all)
+        :return: dict of provider name to ProviderResult, in provider order
+        """
+        providers = self.providers if providers is None else providers
+        if not providers:
+            return dict()
+        executor = ThreadPoolExecutor(max_workers=len(providers))
+        try:
+            start = monotonic()
+            futures = [(provider, executor.submit(provider.rows))
+                       for provider in providers]
+            results = dict()
+            for provider, future in futures:
+                remaining = start + provider.timeout + TIMEOUT_GRACE - \
+                    monotonic()
+                try:
+                    results[provider.name] = future.result(max(remaining, 0))
+                except TimeoutError:
+                    LOG.error(f"{provider.name} timed out after "
+                              f"{provider.timeout}s")
+                    results[provider.name] = ProviderResult(
+                        provider.name,
+                        error=f"Timed out after {provider.timeout}s")
+                except Exception as e:
+                    LOG.error(f"Error reading {provider.name}: {e}")
+                    results[provider.name] = ProviderResult(
+                        provider.name, error=str(e) or type(e).__name__)
+            return results
+        finally:
+            # Don't wait for providers that overran their timeout
+            executor.shutdown(wait=False)
+
+    def resolve(self, tables: Dict[str, Optional[list]]) -> Dict[str, list]:
+        """
+        Get the rows of every provider, using the default rows of providers
+        without any
+        :param tables: dict of provider name to its last known rows
+        :return: dict of provider name to rows, in provider order
+        """
+        return {provider.name: tables.get(provider.name) or
+                provider.default_rows() for provider in self.providers}
+
+    def merge(self, tables: Dict[str, Optional[list]],
+              priority: Optional[Sequence[str]] = None) -> DrinkTable:
+        """
+        Merge provider rows into one drink table. When providers have the
+        same drink, the row of the provider listed first in `priority`
+        is kept.
+        :param tables: dict of provider name to rows; providers not included
+            use their default rows
+        :param priority: provider names in priority order; providers not
+            listed follow in the order they were added
+        :return: immutable table sorted by drink name
+        """
+        order = [name for name in priority or () if self.get(name)]
+        order.extend(name for name in self.names if name not in order)
+        providers = [self.get(name) for name in order]
+        return merge_drink_tables(
+            *(tables[p.name] if tables.get(p.name) is not None
+              else p.default_rows() for p in providers),
+            sources=[p.source for p in providers])
+
+    def status(self) -> dict:
+        """
+        Get the configuration and freshness of each provider
+        """
+        return {provider.name: {"source": provider.source.label,
+                                "timeout": provider.timeout,
+                                **provider.freshness()}
+                for provider in self.providers}
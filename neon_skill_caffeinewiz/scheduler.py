@@ -0,0 +1,226 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Framework
+# All trademark and other rights reserved by their respective owners
+# Copyright 2008-2025 Neongecko.com Inc.
+# Contributors: Daniel McKnight, Guy Daniels, Elon Gasper, Richard Leeds,
+# Regina Bloomstine, Casimiro Ferreira, Andrii Pernatii, Kirill Hrymailo
+# BSD-3 License
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from this
+#    software without specific prior written permission.
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS  BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS;  OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE,  EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import random
+
+from concurrent.futures import Future
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from threading import Lock, Thread
+from typing import Callable, Dict, Optional
+
+from ovos_utils.log import LOG
+
+# Fraction of the interval each scheduled run is randomly moved by
+JITTER = 0.1
+# Delay before retrying a source after its first failure (seconds)
+RETRY_DELAY = 300
+# Longest delay between attempts at a failing source (seconds)
+MAX_BACKOFF = 24 * 3600
+
+
+def _isoformat(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+@dataclass
+class SourceState:
+    """
+    Update history of a single data source
+    """
+    failures: int = 0
+    last_success: Optional[datetime] = None
+    last_failure: Optional[datetime] = None
+    next_attempt: Optional[datetime] = None
+
+    def as_dict(self) -> dict:
+        return {"failures": self.failures,
+                "last_success": _isoformat(self.last_success),
+                "last_failure": _isoformat(self.last_failure),
+                "next_attempt": _isoformat(self.next_attempt)}
+
+
+class RefreshScheduler:
+    """
+    Decides when data is refreshed: runs are spaced by `interval` seconds
+    with random jitter, failing sources and failing runs back off
+    exponentially and only one refresh runs at a time (callers join a
+    refresh that is in flight).
+    """
+    def __init__(self, interval: float, jitter: float = JITTER,
+                 retry_delay: float = RETRY_DELAY,
+                 max_backoff: float = MAX_BACKOFF,
+                 rand: Optional[random.Random] = None,
+                 on_complete: Optional[Callable[[], None]] = None):
+        """
+        :param interval: seconds between successful runs
+        :param jitter: fraction of `interval` runs are randomly moved by
+        :param retry_delay: seconds before retrying a failed source
+        :param max_backoff: longest delay between attempts at a source
+        :param rand: random generator for jitter
+        :param on_complete: called after each run, once `last_success` is
+            updated, i.e. to plan the next run
+        """
+        self.interval = interval
+        self.on_complete = on_complete
+        self.jitter = jitter
+        self.retry_delay = retry_delay
+        self.max_backoff = max_backoff
+        self.next_run: Optional[datetime] = None
+        self.last_run: Optional[datetime] = None
+        self.last_success: Optional[datetime] = None
+        # Consecutive runs that failed or raised
+        self.failures = 0
+        self.sources: Dict[str, SourceState] = dict()
+        self._rand = rand or random.Random()
+        self._lock = Lock()
+        self._running: Optional[Future] = None
+
+    @property
+    def running(self) -> bool:
+        return self._running is not None
+
+    def schedule(self, now: Optional[datetime] = None) -> datetime:
+        """
+        Plan the next run: one jittered interval after the last successful
+        run, or earlier if a failed source is due for a retry. After failed
+        runs, the next run backs off like a failing source.
+        :param now: current time
+        :return: time of the next run, never before `now`
+        """
+        now = now or datetime.now()
+        spread = self.interval * self._rand.uniform(-self.jitter,
+                                                    self.jitter)
+        next_run = (self.last_success or now) + \
+            timedelta(seconds=self.interval + spread)
+        retries = [state.next_attempt for state in self.sources.values()
+                   if state.failures and state.next_attempt]
+        if retries:
+            next_run = min(next_run, min(retries))
+        if self.failures and self.last_run:
+            next_run = max(next_run, self.last_run + timedelta(
+                seconds=self._backoff(self.failures)))
+        self.next_run = max(next_run, now)
+        return self.next_run
+
+    def is_due(self, source: str, now: Optional[datetime] = None) -> bool:
+        """
+        Check if a source may be fetched or is still backing off
+        :param source: name of the source
+        :param now: current time
+        :return: True if the source should be fetched
+        """
+        state = self.sources.get(source)
+        if not state or not state.next_attempt:
+            return True
+        return state.next_attempt <= (now or datetime.now())
+
+    def record(self, source: str, success: bool,
+               now: Optional[datetime] = None):
+        """
+        Record the outcome of fetching a source
+        :param source: name of the source
+        :param success: True if the source returned usable (or unchanged)
+            data
+        :param now: time of the attempt
+        """
+        now = now or datetime.now()
+        state = self.sources.setdefault(source, SourceState())
+        if success:
+            state.failures = 0
+            state.last_success = now
+            state.next_attempt = None
+            return
+        state.failures += 1
+        state.last_failure = now
+        state.next_attempt = now + timedelta(
+            seconds=self._backoff(state.failures))
+        LOG.info(f"{source} failed {state.failures} time(s), next attempt "
+                 f"at {state.next_attempt}")
+
+    def _backoff(self, failures: int) -> float:
+        """
+        Get the delay in seconds before retrying after `failures` failures
+        """
+        return min(self.retry_delay * 2 ** (failures - 1), self.max_backoff)
+
+    def run(self, func: Callable[..., bool], *args, **kwargs) -> Future:
+        """
+        Run a refresh in a background thread, unless one is already running
+        :param func: refresh method, returning True on success
+        :return: Future of the running refresh
+        """
+        with self._lock:
+            if self._running is not None:
+                LOG.debug("Joining refresh in progress")
+                return self._running
+            future = Future()
+            self._running = future
+
+        def _run():
+            self.last_run = datetime.now()
+            result = error = None
+            try:
+                result = func(*args, **kwargs)
+            except BaseException as e:
+                LOG.exception(f"Refresh failed: {e}")
+                error = e
+            if result:
+                self.last_success = self.last_run
+                self.failures = 0
+            else:
+                self.failures += 1
+            # Runs after `last_success` is updated so the next run is
+            # planned one interval after this one
+            if self.on_complete:
+                try:
+                    self.on_complete()
+                except Exception as e:
+                    LOG.error(f"Failed to complete refresh: {e}")
+            with self._lock:
+                self._running = None
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
+
+        Thread(target=_run, daemon=True).start()
+        return future
+
+    def status(self) -> dict:
+        """
+        Get the scheduler state as a JSON-serializable dict
+        """
+        return {"interval": self.interval,
+                "running": self.running,
+                "next_run": _isoformat(self.next_run),
+                "last_run": _isoformat(self.last_run),
+                "last_success": _isoformat(self.last_success),
+                "failures": self.failures,
+                "sources": {name: state.as_dict()
+                            for name, state in self.sources.items()}}
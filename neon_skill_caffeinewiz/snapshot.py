@@ -0,0 +1,264 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Framework
+# All trademark and other rights reserved by their respective owners
+# Copyright 2008-2025 Neongecko.com Inc.
+# Contributors: Daniel McKnight, Guy Daniels, Elon Gasper, Richard Leeds,
+# Regina Bloomstine, Casimiro Ferreira, Andrii Pernatii, Kirill Hrymailo
+# BSD-3 License
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from this
+#    software without specific prior written permission.
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS  BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS;  OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE,  EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import datetime
+import hashlib
+import json
+import mmap
+import os
+import pickle
+import struct
+import sys
+import traceback
+import zlib
+
+from array import array
+from typing import Callable, Dict, Optional, Sequence
+
+from neon_skill_caffeinewiz.index import DrinkIndex
+from neon_skill_caffeinewiz.store import DrinkStore
+
+SNAPSHOT_VERSION = 4
+SNAPSHOT_MAGIC = b"CWZSNAP\0"
+# magic, schema version, metadata length, metadata crc32
+_HEADER = struct.Struct("<8sHII")
+_ALIGN = 8
+# Column sections of a DrinkStore and their memoryview formats
+_COLUMNS = (("volume", "d"), ("caffeine", "d"), ("source", "b"),
+            ("metric_mg", "i"), ("metric_size", "H"), ("metric_unit", "b"))
+# DrinkIndex keys and the rows they map to, stored like store columns. The
+# rest of the index state is pickled and only loaded on the first lookup
+_INDEX_KEYS = (("_keys", "_key_rows"), ("_extra_keys", "_extra_rows"))
+
+
+class SnapshotError(Exception):
+    """
+    Raised when a snapshot file is missing, corrupt or from another schema
+    """
+
+
+def source_checksum(rows: Sequence[Sequence[str]]) -> str:
+    """
+    Get a stable checksum of a parsed source table
+    :param rows: rows as parsed from a source
+    :return: hex sha256 digest
+    """
+    return hashlib.sha256(json.dumps(rows, default=str).encode()).hexdigest()
+
+
+class Snapshot:
+    """
+    Drink table, lookup index and metadata loaded from a snapshot file.
+    Store columns are views of the memory-mapped file; raw source tables are
+    only deserialized when `sources` is called.
+    """
+    def __init__(self, store: DrinkStore, index: DrinkIndex, metadata: dict,
+                 buffer: Optional[mmap.mmap] = None,
+                 sources: Optional[Callable[[], Dict[str, list]]] = None):
+        self.store = store
+        self.index = index
+        self.metadata = metadata
+        self._buffer = buffer
+        self._sources = sources
+
+    @property
+    def created(self) -> datetime.datetime:
+        """Time the data in this snapshot was fetched"""
+        return datetime.datetime.fromisoformat(self.metadata["created"])
+
+    @property
+    def checksums(self) -> Dict[str, str]:
+        """Checksum of each source table included in this snapshot"""
+        return {name: source["checksum"] for name, source in
+                self.metadata.get("sources", {}).items()}
+
+    @property
+    def validators(self) -> Dict[str, dict]:
+        """HTTP cache validators of the sources in this snapshot"""
+        return dict(self.metadata.get("validators") or {})
+
+    def sources(self) -> Dict[str, list]:
+        """
+        Get the raw source tables this snapshot was built from
+        """
+        if self._sources is None:
+            return dict()
+        return self._sources()
+
+
+def _join_keys(keys: Sequence[str]) -> bytes:
+    return "\0".join(k.replace("\0", "") for k in keys).encode("utf-8")
+
+
+def _split_keys(section: memoryview) -> tuple:
+    keys = str(section, "utf-8")
+    return tuple(keys.split("\0")) if keys else tuple()
+
+
+def write_snapshot(path: str, store: DrinkStore, index: DrinkIndex,
+                   sources: Dict[str, list],
+                   created: datetime.datetime,
+                   validators: Optional[Dict[str, dict]] = None):
+    """
+    Atomically write a snapshot file
+    :param path: file to write
+    :param store: merged drink table
+    :param index: DrinkIndex built over `store`
+    :param sources: raw source tables by source name
+    :param created: time the source data was fetched
+    :param validators: HTTP cache validators by source name
+    """
+    sections = [("names", _join_keys(store.names))]
+    for name, fmt in _COLUMNS:
+        sections.append((name, array(fmt, getattr(store, name)).tobytes()))
+    state = index.export_state()
+    for keys, rows in _INDEX_KEYS:
+        sections.append((keys, _join_keys(state.pop(keys))))
+        sections.append((rows, array("i", state.pop(rows)).tobytes()))
+    sections.append(("index", pickle.dumps(state, pickle.HIGHEST_PROTOCOL)))
+    sections.append(("sources", pickle.dumps(sources,
+                                             pickle.HIGHEST_PROTOCOL)))
+
+    payload = bytearray()
+    offsets = dict()
+    for name, data in sections:
+        payload.extend(b"\0" * (-len(payload) % _ALIGN))
+        # Each section has its own checksum, so it can be checked in place
+        offsets[name] = [len(payload), len(data), zlib.crc32(data)]
+        payload.extend(data)
+    metadata = {"schema_version": SNAPSHOT_VERSION,
+                "created": created.isoformat(),
+                "byteorder": sys.byteorder,
+                "rows": len(store),
+                "sources": {name: {"rows": len(rows),
+                                   "checksum": source_checksum(rows)}
+                            for name, rows in sources.items()},
+                "validators": validators or dict(),
+                "sections": offsets}
+    meta = json.dumps(metadata).encode("utf-8")
+    header = _HEADER.pack(SNAPSHOT_MAGIC, SNAPSHOT_VERSION, len(meta),
+                          zlib.crc32(meta))
+    padding = b"\0" * (-(len(header) + len(meta)) % _ALIGN)
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(header + meta + padding)
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def load_snapshot(path: str) -> Snapshot:
+    """
+    Open a snapshot file without parsing or rebuilding the drink table.
+    Every section is checked, so a corrupt file is rejected here; the rest
+    of the index and the source tables are only deserialized when first
+    used.
+    :param path: snapshot file to read
+    :return: Snapshot backed by a read-only memory map of `path`
+    :raises SnapshotError: if the file is missing, corrupt or incompatible
+    """
+    try:
+        with open(path, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError) as e:
+        raise SnapshotError(f"Unable to open {path}: {e}") from e
+    try:
+        return _read_snapshot(buffer)
+    except Exception as e:
+        # Views of the buffer held by failed frames prevent closing it
+        traceback.clear_frames(e.__traceback__)
+        buffer.close()
+        if isinstance(e, SnapshotError):
+            raise
+        raise SnapshotError(f"Invalid snapshot {path}: {e}") from e
+
+
+def _read_snapshot(buffer: mmap.mmap) -> Snapshot:
+    view = memoryview(buffer)
+    if len(view) < _HEADER.size:
+        raise SnapshotError("Truncated header")
+    magic, version, meta_len, meta_crc = _HEADER.unpack_from(view)
+    if magic != SNAPSHOT_MAGIC:
+        raise SnapshotError("Not a snapshot file")
+    if version != SNAPSHOT_VERSION:
+        raise SnapshotError(f"Unsupported schema version: {version}")
+    meta_end = _HEADER.size + meta_len
+    meta = view[_HEADER.size:meta_end]
+    if zlib.crc32(meta) != meta_crc:
+        raise SnapshotError("Metadata checksum mismatch")
+    metadata = json.loads(bytes(meta))
+    if metadata.get("byteorder") != sys.byteorder:
+        raise SnapshotError("Snapshot written with another byte order")
+    payload = view[meta_end + (-meta_end % _ALIGN):]
+    sections = metadata["sections"]
+    names = _split_keys(_section(payload, sections, "names"))
+    columns = {name: _section(payload, sections, name).cast(fmt)
+               for name, fmt in _COLUMNS}
+    if any(len(col) != len(names) for col in columns.values()):
+        raise SnapshotError("Column length mismatch")
+    store = DrinkStore(names, columns["volume"], columns["caffeine"],
+                       columns["source"],
+                       (columns["metric_mg"], columns["metric_size"],
+                        columns["metric_unit"]))
+    state = dict()
+    for keys, rows in _INDEX_KEYS:
+        state[keys] = _split_keys(_section(payload, sections, keys))
+        state[rows] = _section(payload, sections, rows).cast("i")
+        if len(state[keys]) != len(state[rows]):
+            raise SnapshotError("Index length mismatch")
+    index_state = _section(payload, sections, "index")
+    sources = _section(payload, sections, "sources")
+    index = DrinkIndex.from_state(store, state,
+                                  lambda: _unpickle(index_state, "index"))
+    return Snapshot(store, index, metadata, buffer,
+                    lambda: _unpickle(sources, "sources"))
+
+
+def _section(payload: memoryview, sections: dict, name: str) -> memoryview:
+    """
+    Get a checked section of a snapshot payload
+    :param payload: snapshot data following the metadata
+    :param sections: section offsets, lengths and checksums by name
+    :param name: section to get
+    :return: view of the section
+    :raises SnapshotError: if the section doesn't match its checksum
+    """
+    offset, length, crc = sections[name]
+    section = payload[offset:offset + length]
+    if len(section) != length or zlib.crc32(section) != crc:
+        raise SnapshotError(f"Checksum mismatch in {name}")
+    return section
+
+
+def _unpickle(section: memoryview, name: str):
+    try:
+        return pickle.loads(section)
+    except Exception as e:
+        raise SnapshotError(f"Invalid {name} section: {e}") from e
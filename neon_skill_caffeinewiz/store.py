@@ -0,0 +1,288 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Framework
+# All trademark and other rights reserved by their respective owners
+# Copyright 2008-2025 Neongecko.com Inc.
+# Contributors: Daniel McKnight, Guy Daniels, Elon Gasper, Richard Leeds,
+# Regina Bloomstine, Casimiro Ferreira, Andrii Pernatii, Kirill Hrymailo
+# BSD-3 License
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+# 1. Redistributions of source code must retain the above copyright notice,
+#    this list of conditions and the following disclaimer.
+# 2. Redistributions in binary form must reproduce the above copyright notice,
+#    this list of conditions and the following disclaimer in the documentation
+#    and/or other materials provided with the distribution.
+# 3. Neither the name of the copyright holder nor the names of its
+#    contributors may be used to endorse or promote products derived from this
+#    software without specific prior written permission.
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO,
+# THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR
+# PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR
+# CONTRIBUTORS  BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL,
+# EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO,
+# PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA,
+# OR PROFITS;  OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF
+# LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING
+# NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE,  EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+
+import sys
+
+from array import array
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from ovos_utils.log import LOG
+
+
+class Source(IntEnum):
+    """
+    Origin of a drink row, stored as one byte per row
+    """
+    CAFFEINEWIZ = 0
+    CAFFEINEINFORMER = 1
+    SKILL = 2
+    LOCAL = 3  # Local files and other configured providers
+
+    @property
+    def label(self) -> str:
+        return self.name.lower()
+
+
+class MetricUnit(IntEnum):
+    """
+    Unit of a precomputed metric drink size, stored as one byte per row
+    """
+    MILLILITERS = 0
+    LITER = 1
+
+    @property
+    def resource(self) -> str:
+        """Name of the dialog file used to speak this unit"""
+        return "word_liter" if self == MetricUnit.LITER else \
+            "word_milliliters"
+
+
+def metric_columns(volume: Sequence[float], caffeine: Sequence[float]) -> \
+        Tuple[array, array, array]:
+    """
+    Compute metric serving columns for a whole table in one pass, with the
+    same buckets and arithmetic as `CaffeineWizSkill.convert_metric`.
+    :param volume: drink volumes in oz
+    :param caffeine: caffeine content in mg
+    :return: caffeine (mg) per serving, serving size and MetricUnit columns
+    """
+    metric_mg = array('i')
+    size = array('H')
+    unit = array('b')
+    for oz, mg in zip(volume, caffeine):
+        if oz < 16:
+            ml, serving, serving_unit = 250, 250, MetricUnit.MILLILITERS
+        elif oz < 32:
+            ml, serving, serving_unit = 500, 500, MetricUnit.MILLILITERS
+        else:
+            ml, serving, serving_unit = 1000, 1, MetricUnit.LITER
+        metric_mg.append(int((mg / (oz * 29.5735)) * ml))
+        size.append(serving)
+        unit.append(serving_unit)
+    return metric_mg, size, unit
+
+
+class DrinkRecord:
+    """
+    Lightweight view of one row in a DrinkStore. Indexing is supported for
+    code written against `[name, oz, mg]` rows.
+    """
+    __slots__ = ("store", "index")
+
+    def __init__(self, store: 'DrinkStore', index: int):
+        self.store = store
+        self.index = index
+
+    @property
+    def name(self) -> str:
+        return self.store.names[self.index]
+
+    @property
+    def volume(self) -> float:
+        """Drink volume in oz"""
+        return self.store.volume[self.index]
+
+    @property
+    def caffeine(self) -> float:
+        """Caffeine content in mg"""
+        return self.store.caffeine[self.index]
+
+    @property
+    def source(self) -> Source:
+        return Source(self.store.source[self.index])
+
+    @property
+    def metric(self) -> Tuple[str, str, str]:
+        """
+        Precomputed metric serving as returned by `convert_metric`
+        :return: mg, serving size, unit resource
+        """
+        return (str(self.store.metric_mg[self.index]),
+                str(self.store.metric_size[self.index]),
+                MetricUnit(self.store.metric_unit[self.index]).resource)
+
+    @property
+    def metric_ml(self) -> int:
+        """Metric serving size in mL"""
+        size = self.store.metric_size[self.index]
+        return size * 1000 if self.store.metric_unit[self.index] == \
+            MetricUnit.LITER else size
+
+    def __getitem__(self, item):
+        return (self.name, self.volume, self.caffeine)[item]
+
+    def __iter__(self):
+        return iter((self.name, self.volume, self.caffeine))
+
+    def __len__(self):
+        return 3
+
+    def __eq__(self, other):
+        if isinstance(other, DrinkRecord):
+            return tuple(self) == tuple(other) and \
+                self.source == other.source
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(tuple(self))
+
+    def __repr__(self):
+        return f"DrinkRecord({self.name!r}, {self.volume!r}, " \
+               f"{self.caffeine!r}, {self.source.label})"
+
+
+@dataclass
+class StoreDelta:
+    """
+    Drink names added, removed and with changed values between two stores
+    """
+    added: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    changed: List[str] = field(default_factory=list)
+
+    def __bool__(self):
+        return bool(self.added or self.removed or self.changed)
+
+    def summary(self) -> dict:
+        """
+        Get the number of added, removed and changed drinks
+        """
+        return {"added": len(self.added), "removed": len(self.removed),
+                "changed": len(self.changed)}
+
+
+class DrinkStore(Sequence):
+    """
+    Immutable, column oriented drink table. Values are parsed once when the
+    store is built: names are interned strings, volume (oz) and caffeine (mg)
+    are doubles and the source is a byte per row. Metric servings are
+    computed for every row when the store is built.
+    """
+    def __init__(self, names: Tuple[str, ...], volume: Sequence[float],
+                 caffeine: Sequence[float], source: Sequence[int],
+                 metric: Optional[Tuple[Sequence[int], Sequence[int],
+                                        Sequence[int]]] = None):
+        """
+        :param names: drink names
+        :param volume: volume column (oz), an array or memoryview
+        :param caffeine: caffeine column (mg), an array or memoryview
+        :param source: Source column
+        :param metric: precomputed `metric_columns`, computed if not provided
+        """
+        self.names = names
+        self.volume = volume
+        self.caffeine = caffeine
+        self.source = source
+        self.metric_mg, self.metric_size, self.metric_unit = \
+            metric or metric_columns(volume, caffeine)
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Sequence],
+                  default_source: Source = Source.CAFFEINEWIZ) -> \
+            'DrinkStore':
+        """
+        Build a store from `[name, oz, mg(, source)]` rows. Rows with values
+        that can't be parsed or without a positive volume are dropped.
+        :param rows: rows as parsed from a source or returned by
+            `merge_drink_tables`
+        :param default_source: Source of rows without a source column
+        :return: DrinkStore with one entry per valid row
+        """
+        names: List[str] = list()
+        volume = array('d')
+        caffeine = array('d')
+        source = array('b')
+        for row in rows:
+            try:
+                oz = float(row[1])
+                mg = float(row[2])
+            except (IndexError, TypeError, ValueError):
+                LOG.debug(f"Skipping invalid drink row: {row}")
+                continue
+            if oz <= 0:
+                LOG.debug(f"Skipping drink without volume: {row}")
+                continue
+            names.append(sys.intern(row[0]))
+            volume.append(oz)
+            caffeine.append(mg)
+            source.append(int(row[3]) if len(row) > 3 else default_source)
+        return cls(tuple(names), volume, caffeine, source)
+
+    def __len__(self):
+        return len(self.names)
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return [DrinkRecord(self, i)
+                    for i in range(*item.indices(len(self)))]
+        if item < 0:
+            item += len(self)
+        if not 0 <= item < len(self):
+            raise IndexError(item)
+        return DrinkRecord(self, item)
+
+    def __iter__(self) -> Iterator[DrinkRecord]:
+        return (DrinkRecord(self, i) for i in range(len(self)))
+
+    def _values(self) -> dict:
+        values = dict()
+        for idx, name in enumerate(self.names):
+            values.setdefault(name, list()).append(
+                (self.volume[idx], self.caffeine[idx], self.source[idx]))
+        return values
+
+    def diff(self, other: 'DrinkStore') -> StoreDelta:
+        """
+        Compare this store to an updated version of it
+        :param other: updated store
+        :return: StoreDelta of drink names from this store to `other`
+        """
+        old = self._values()
+        delta = StoreDelta()
+        for name, values in other._values().items():
+            previous = old.pop(name, None)
+            if previous is None:
+                delta.added.append(name)
+            elif previous != values:
+                delta.changed.append(name)
+        delta.removed.extend(old)
+        return delta
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Approximate memory used by the store, including name strings
+        """
+        return sys.getsizeof(self.names) + \
+            sum(sys.getsizeof(n) for n in self.names) + \
+            sum(memoryview(col).nbytes for col in (
+                self.volume, self.caffeine, self.source, self.metric_mg,
+                self.metric_size, self.metric_unit))
@@ -0,0 +1,88 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Development System
+#
+# Copyright 2008-2025 Neongecko.com Inc. | All Rights Reserved
+#
+# Notice of License - Duplicating this Notice of License near the start of any file containing
+# a derivative of this software is a condition of license for this software.
+# Friendly Licensing:
+# No charge, open source royalty free use of the Neon AI software source and object is offered for
+# educational users, noncommercial enthusiasts, Public Benefit Corporations (and LLCs) and
+# Social Purpose Corporations (and LLCs). Developers can contact developers@neon.ai
+# For commercial licensing, distribution of derivative works or redistribution please contact licenses@neon.ai
+# Distributed on an "AS IS” basis without warranties or conditions of any kind, either express or implied.
+# Trademarks of Neongecko: Neon AI(TM), Neon Assist (TM), Neon Communicator(TM), Klat(TM)
+# Authors: Guy Daniels, Daniel McKnight, Regina Bloomstine, Elon Gasper, Richard Leeds
+#
+# Specialized conversational reconveyance options from Conversation Processing Intelligence Corp.
+# US Patents 2008-2021: US7424516, US20140161250, US20140177813, US8638908, US8068604, US8553852, US10530923, US10530924
+# China Patent: CN102017585  -  Europe Patent: EU2156652  -  Patents Pending
+
+"""
+Local stand-in for the caffeine data sources, serving recorded pages from
+`test/fixtures` with ETag/Last-Modified and gzip support.
+"""
+import gzip
+import hashlib
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from os.path import dirname, join
+from threading import Thread
+from time import sleep
+
+FIXTURES = join(dirname(__file__), "fixtures")
+LAST_MODIFIED = "Mon, 05 Jan 2026 10:00:00 GMT"
+
+
+def load_fixture(name: str) -> bytes:
+    with open(join(FIXTURES, name), 'rb') as f:
+        return f.read()
+
+
+class SourceServer:
+    """
+    Serves `pages` (path -> bytes) on localhost. `requests` records
+    (path, status) for every request handled.
+    """
+    def __init__(self, pages: dict):
+        self.pages = pages
+        self.requests = list()
+        self.delay = 0
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                page = server.pages.get(self.path)
+                if page is None:
+                    return self._reply(404)
+                etag = f'"{hashlib.md5(page).hexdigest()}"'
+                if self.headers.get("If-None-Match") == etag or \
+                        self.headers.get("If-Modified-Since") == \
+                        LAST_MODIFIED:
+                    return self._reply(304)
+                sleep(server.delay)
+                headers = {"ETag": etag, "Last-Modified": LAST_MODIFIED,
+                           "Content-Type": "text/html"}
+                if "gzip" in self.headers.get("Accept-Encoding", ""):
+                    page = gzip.compress(page)
+                    headers["Content-Encoding"] = "gzip"
+                self._reply(200, page, headers)
+
+            def _reply(self, status, body=b"", headers=None):
+                server.requests.append((self.path, status))
+                self.send_response(status)
+                for key, val in (headers or {}).items():
+                    self.send_header(key, val)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self._httpd.server_address[1]}"
+        Thread(target=self._httpd.serve_forever, daemon=True).start()
+
+    def shutdown(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
@@ -0,0 +1,69 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Development System
+#
+# Copyright 2008-2025 Neongecko.com Inc. | All Rights Reserved
+#
+# Notice of License - Duplicating this Notice of License near the start of any file containing
+# a derivative of this software is a condition of license for this software.
+# Friendly Licensing:
+# No charge, open source royalty free use of the Neon AI software source and object is offered for
+# educational users, noncommercial enthusiasts, Public Benefit Corporations (and LLCs) and
+# Social Purpose Corporations (and LLCs). Developers can contact developers@neon.ai
+# For commercial licensing, distribution of derivative works or redistribution please contact licenses@neon.ai
+# Distributed on an "AS IS” basis without warranties or conditions of any kind, either express or implied.
+# Trademarks of Neongecko: Neon AI(TM), Neon Assist (TM), Neon Communicator(TM), Klat(TM)
+# Authors: Guy Daniels, Daniel McKnight, Regina Bloomstine, Elon Gasper, Richard Leeds
+#
+# Specialized conversational reconveyance options from Conversation Processing Intelligence Corp.
+# US Patents 2008-2021: US7424516, US20140161250, US20140177813, US8638908, US8068604, US8553852, US10530923, US10530924
+# China Patent: CN102017585  -  Europe Patent: EU2156652  -  Patents Pending
+
+
+import unittest
+
+from neon_skill_caffeinewiz.answers import Answer, AnswerCache
+
+
+class TestAnswerCache(unittest.TestCase):
+    def setUp(self):
+        self.now = 0.0
+        self.cache = AnswerCache(size=2, ttl=10, clock=lambda: self.now)
+
+    def test_lru(self):
+        coffee = Answer({"drink": "coffee"}, [])
+        self.cache.put("coffee", 1, coffee)
+        self.cache.put("coke", 1, Answer({"drink": "coke"}, []))
+        self.assertIs(self.cache.get("coffee", 1), coffee)
+        self.cache.put("red bull", 1, Answer({"drink": "red bull"}, []))
+        self.assertEqual(len(self.cache), 2)
+        # Least recently used entry is evicted
+        self.assertIsNone(self.cache.get("coke", 1))
+        self.assertIs(self.cache.get("coffee", 1), coffee)
+        self.assertEqual((self.cache.hits, self.cache.misses), (2, 1))
+
+    def test_ttl(self):
+        self.cache.put("coffee", 1, Answer({}, []))
+        self.now = 10
+        self.assertIsNotNone(self.cache.get("coffee", 1))
+        self.now = 10.1
+        self.assertIsNone(self.cache.get("coffee", 1))
+        self.assertEqual(len(self.cache), 0)
+
+    def test_generation(self):
+        self.cache.put("coffee", 1, Answer({}, []))
+        self.assertIsNone(self.cache.get("coffee", 2))
+        self.assertEqual(len(self.cache), 0)
+        # Answers built from older data are not stored
+        self.cache.put("coffee", 1, Answer({}, []))
+        self.assertEqual(len(self.cache), 0)
+        self.assertIsNone(self.cache.get("coffee", 1))
+        self.assertEqual(self.cache.stats(),
+                         {"size": 0, "max_size": 2, "ttl": 10,
+                          "generation": 2, "hits": 0, "misses": 2})
+
+        disabled = AnswerCache(size=0)
+        disabled.put("coffee", 1, Answer({}, []))
+        self.assertEqual(len(disabled), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
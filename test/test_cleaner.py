@@ -0,0 +1,90 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Development System
+#
+# Copyright 2008-2025 Neongecko.com Inc. | All Rights Reserved
+#
+# Notice of License - Duplicating this Notice of License near the start of any file containing
+# a derivative of this software is a condition of license for this software.
+# Friendly Licensing:
+# No charge, open source royalty free use of the Neon AI software source and object is offered for
+# educational users, noncommercial enthusiasts, Public Benefit Corporations (and LLCs) and
+# Social Purpose Corporations (and LLCs). Developers can contact developers@neon.ai
+# For commercial licensing, distribution of derivative works or redistribution please contact licenses@neon.ai
+# Distributed on an "AS IS” basis without warranties or conditions of any kind, either express or implied.
+# Trademarks of Neongecko: Neon AI(TM), Neon Assist (TM), Neon Communicator(TM), Klat(TM)
+# Authors: Guy Daniels, Daniel McKnight, Regina Bloomstine, Elon Gasper, Richard Leeds
+#
+# Specialized conversational reconveyance options from Conversation Processing Intelligence Corp.
+# US Patents 2008-2021: US7424516, US20140161250, US20140177813, US8638908, US8068604, US8553852, US10530923, US10530924
+# China Patent: CN102017585  -  Europe Patent: EU2156652  -  Patents Pending
+
+
+import unittest
+
+from os.path import dirname, join
+
+from ovos_workshop.resource_files import SkillResources
+
+from neon_skill_caffeinewiz.cleaner import DrinkNameCleaner
+
+SKILL_DIR = join(dirname(dirname(__file__)), "neon_skill_caffeinewiz")
+
+
+class TestDrinkNameCleaner(unittest.TestCase):
+    def test_clean(self):
+        cleaner = DrinkNameCleaner(
+            ["a", "an"], ["cup of", "glass of"], "?!",
+            {"coke": "coca-cola classic", "Diet  Cherry Coke":
+             "diet cherry coca-cola", "starbucks blonde":
+             "starbucks coffee blonde roast"},
+            ["diet coke", "coke zero", "coca-cola classic", "coffee"])
+        self.assertEqual(cleaner.clean("A Cup of Coffee?"), "coffee")
+        self.assertEqual(cleaner.clean("an espresso!"), "espresso")
+        self.assertEqual(cleaner.clean("a shot of espresso"),
+                         "shot of espresso")
+        self.assertEqual(cleaner.clean("a cup of"), "")
+        self.assertEqual(cleaner.clean("a"), "")
+        self.assertEqual(cleaner.clean("mcdonald 's  coffee"),
+                         "mcdonald's coffee")
+
+        # Aliases are replaced anywhere, longest first
+        self.assertEqual(cleaner.clean("coke"), "coca-cola classic")
+        self.assertEqual(cleaner.clean("a glass of coke please"),
+                         "coca-cola classic please")
+        self.assertEqual(cleaner.clean("diet cherry coke"),
+                         "diet cherry coca-cola")
+        self.assertEqual(cleaner.clean("iced starbucks blonde"),
+                         "iced starbucks coffee blonde roast")
+        self.assertEqual(cleaner.clean("cokes"), "cokes")
+        self.assertEqual(cleaner.clean("a coke, a diet coke, coffee"),
+                         "coca-cola classic, a diet coke, coffee")
+        self.assertEqual(cleaner.clean("coffee (decaf, brewed)"),
+                         "coffee (decaf, brewed)")
+        # Known drinks containing an alias are kept
+        self.assertEqual(cleaner.clean("diet coke"), "diet coke")
+        self.assertEqual(cleaner.clean("a coke zero?"), "coke zero")
+        self.assertEqual(cleaner.with_names([]).clean("diet coke"),
+                         "diet coca-cola classic")
+
+        self.assertEqual(DrinkNameCleaner().clean(" A Coffee? "),
+                         "a coffee?")
+
+    def test_from_resources(self):
+        en = DrinkNameCleaner.from_resources(
+            SkillResources(SKILL_DIR, "en-us"), ["diet coke"])
+        self.assertEqual(en.aliases["coke"], "coca-cola classic")
+        self.assertEqual(en.clean("a mug of coke?"), "coca-cola classic")
+        self.assertEqual(en.clean("diet coke"), "diet coke")
+
+        de = DrinkNameCleaner.from_resources(SkillResources(SKILL_DIR,
+                                                            "de-de"))
+        self.assertEqual(de.clean("eine Tasse Kaffee?"), "coffee")
+        self.assertEqual(de.clean("grüner Tee"), "green tea")
+
+        uk = DrinkNameCleaner.from_resources(SkillResources(SKILL_DIR,
+                                                            "uk-ua"))
+        self.assertEqual(uk.clean("чашка кави"), "coffee")
+        self.assertEqual(uk.clean("зеленому чаї"), "green tea")
+
+
+if __name__ == '__main__':
+    unittest.main()
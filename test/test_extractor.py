@@ -0,0 +1,85 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Development System
+#
+# Copyright 2008-2025 Neongecko.com Inc. | All Rights Reserved
+#
+# Notice of License - Duplicating this Notice of License near the start of any file containing
+# a derivative of this software is a condition of license for this software.
+# Friendly Licensing:
+# No charge, open source royalty free use of the Neon AI software source and object is offered for
+# educational users, noncommercial enthusiasts, Public Benefit Corporations (and LLCs) and
+# Social Purpose Corporations (and LLCs). Developers can contact developers@neon.ai
+# For commercial licensing, distribution of derivative works or redistribution please contact licenses@neon.ai
+# Distributed on an "AS IS” basis without warranties or conditions of any kind, either express or implied.
+# Trademarks of Neongecko: Neon AI(TM), Neon Assist (TM), Neon Communicator(TM), Klat(TM)
+# Authors: Guy Daniels, Daniel McKnight, Regina Bloomstine, Elon Gasper, Richard Leeds
+#
+# Specialized conversational reconveyance options from Conversation Processing Intelligence Corp.
+# US Patents 2008-2021: US7424516, US20140161250, US20140177813, US8638908, US8068604, US8553852, US10530923, US10530924
+# China Patent: CN102017585  -  Europe Patent: EU2156652  -  Patents Pending
+
+
+import unittest
+
+from os.path import dirname, join
+
+from ovos_workshop.resource_files import SkillResources
+
+from neon_skill_caffeinewiz.extractor import DrinkQuery, QueryExtractor
+
+SKILL_DIR = join(dirname(dirname(__file__)), "neon_skill_caffeinewiz")
+
+
+class TestQueryExtractor(unittest.TestCase):
+    def test_extract(self):
+        extractor = QueryExtractor(["(of|in) (?P<drink>.*)",
+                                    "(?P<size>large) (?P<Drink>.*)"],
+                                   ["caffeine", "caff"])
+        self.assertEqual(extractor.extract("caffeine content of diet coke"),
+                         DrinkQuery("diet coke", True))
+        # The leftmost pattern match wins
+        self.assertEqual(
+            extractor.extract("how much caffeine is in a cup of coffee"),
+            DrinkQuery("a cup of coffee", True))
+        self.assertEqual(extractor.extract("a large latte"),
+                         DrinkQuery("latte", False))
+        self.assertEqual(extractor.extract("Caff In Tea"),
+                         DrinkQuery("Tea", True))
+        # Patterns and vocab only match whole words
+        self.assertEqual(extractor.extract("protein shake"),
+                         DrinkQuery(None, False))
+        self.assertEqual(extractor.extract("caffeinated coffee"),
+                         DrinkQuery(None, False))
+
+        self.assertEqual(QueryExtractor().extract("caffeine in coffee"),
+                         DrinkQuery(None, False))
+
+    def test_separates(self):
+        extractor = QueryExtractor(separators=["and", "&"])
+        self.assertTrue(extractor.separates(" and a "))
+        self.assertTrue(extractor.separates(", "))
+        self.assertTrue(extractor.separates(" & "))
+        self.assertFalse(extractor.separates(" sandwich "))
+        self.assertFalse(extractor.separates("a&w root beer"))
+        self.assertFalse(extractor.separates(" "))
+        self.assertTrue(QueryExtractor().separates("tea, coffee"))
+
+    def test_from_resources(self):
+        en = QueryExtractor.from_resources(SkillResources(SKILL_DIR, "en-us"))
+        self.assertEqual(en.extract("what is the caffeine content of coke"),
+                         DrinkQuery("coke", True))
+
+        de = QueryExtractor.from_resources(SkillResources(SKILL_DIR, "de-de"))
+        self.assertEqual(de.extract("wie viel Koffein ist in einer Cola"),
+                         DrinkQuery("einer Cola", True))
+        self.assertEqual(de.extract("Koffeingehalt von Kaffee"),
+                         DrinkQuery("Kaffee", True))
+
+        uk = QueryExtractor.from_resources(SkillResources(SKILL_DIR, "uk-ua"))
+        self.assertEqual(uk.extract("скільки кофеїну в каві"),
+                         DrinkQuery("каві", True))
+        self.assertTrue(uk.separates(" та "))
+        self.assertTrue(de.separates(" und "))
+
+
+if __name__ == '__main__':
+    unittest.main()
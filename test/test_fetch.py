@@ -0,0 +1,126 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Development System
+#
+# Copyright 2008-2025 Neongecko.com Inc. | All Rights Reserved
+#
+# Notice of License - Duplicating this Notice of License near the start of any file containing
+# a derivative of this software is a condition of license for this software.
+# Friendly Licensing:
+# No charge, open source royalty free use of the Neon AI software source and object is offered for
+# educational users, noncommercial enthusiasts, Public Benefit Corporations (and LLCs) and
+# Social Purpose Corporations (and LLCs). Developers can contact developers@neon.ai
+# For commercial licensing, distribution of derivative works or redistribution please contact licenses@neon.ai
+# Distributed on an "AS IS” basis without warranties or conditions of any kind, either express or implied.
+# Trademarks of Neongecko: Neon AI(TM), Neon Assist (TM), Neon Communicator(TM), Klat(TM)
+# Authors: Guy Daniels, Daniel McKnight, Regina Bloomstine, Elon Gasper, Richard Leeds
+#
+# Specialized conversational reconveyance options from Conversation Processing Intelligence Corp.
+# US Patents 2008-2021: US7424516, US20140161250, US20140177813, US8638908, US8068604, US8553852, US10530923, US10530924
+# China Patent: CN102017585  -  Europe Patent: EU2156652  -  Patents Pending
+
+import unittest
+
+from neon_skill_caffeinewiz.fetch import SourceFetcher
+from neon_skill_caffeinewiz.parsers import parse_caffeine_informer, \
+    parse_caffeine_wiz
+from source_server import SourceServer, load_fixture
+
+
+class TestSourceFetcher(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.wiz_page = load_fixture("caffeinewiz.html")
+        cls.informer_page = load_fixture("caffeineinformer.html")
+        cls.server = SourceServer({"/wiz": cls.wiz_page,
+                                   "/informer": cls.informer_page,
+                                   "/large": b"x" * 4096})
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.server.shutdown()
+
+    def setUp(self):
+        self.server.requests.clear()
+        self.server.delay = 0
+
+    def test_fetch_errors(self):
+        fetcher = SourceFetcher(max_bytes=1024)
+        result = fetcher.fetch("large", f"{self.server.url}/large")
+        self.assertIsNone(result.body)
+        self.assertIn("1024", result.error)
+
+        result = fetcher.fetch("missing", f"{self.server.url}/missing")
+        self.assertEqual(result.status, 404)
+        self.assertIsNotNone(result.error)
+
+        self.server.delay = 1
+        result = SourceFetcher().fetch("slow", f"{self.server.url}/wiz", 0.2)
+        self.assertIsNone(result.body)
+        self.assertIsNotNone(result.error)
+
+        result = fetcher.fetch("unreachable", "http://127.0.0.1:9/", 1)
+        self.assertIsNone(result.status)
+        self.assertIsNotNone(result.error)
+
+    def test_parse_fixtures(self):
+        wiz = parse_caffeine_wiz(self.wiz_page)
+        self.assertEqual(wiz[0], ["beverage", "quantity (oz)",
+                                  "caffeine content (mg)"])
+        self.assertIn(["10 hour energy shot", "1.93", "422"], wiz)
+        self.assertIn(["a&w root beer", "12", "0"], wiz)
+        self.assertTrue(all(len(r) == 3 for r in wiz))
+
+        informer = parse_caffeine_informer(self.informer_page)
+        self.assertEqual(len(informer), 80)
+        self.assertTrue(all(len(r) == 5 for r in informer))
+        self.assertEqual(informer[0][:3], ["bawls exxtra", "16", "150"])
+
+        self.assertEqual(parse_caffeine_wiz(b"<html></html>"), [])
+
+    def test_iter_caffeine_wiz_rows(self):
+        from neon_skill_caffeinewiz.parsers import iter_caffeine_wiz_rows
+        expected = parse_caffeine_wiz(self.wiz_page)
+
+        # Chunk boundaries may split tags, entities and utf-8 sequences
+        chunks = [self.wiz_page[i:i + 7]
+                  for i in range(0, len(self.wiz_page), 7)]
+        self.assertEqual(list(iter_caffeine_wiz_rows(chunks)), expected)
+        self.assertEqual(list(iter_caffeine_wiz_rows(
+            [self.wiz_page.decode()])), expected)
+
+        # Only the first table is read and the rest is never consumed
+        consumed = list()
+
+        def _chunks():
+            for chunk in (b"<p>skip</p><table><tr><td>Caf\xc3",
+                          b"\xa9 Latte</td><td>8</td>", b"<td>&nbsp;</td>",
+                          b"<td>75</td></tr></table>", b"<table><td>x"):
+                consumed.append(chunk)
+                yield chunk
+        self.assertEqual(list(iter_caffeine_wiz_rows(_chunks())),
+                         [["caf\xe9 latte", "8", "75"]])
+        self.assertEqual(len(consumed), 4)
+
+        # A truncated page yields the cells that were read
+        self.assertEqual(parse_caffeine_wiz(b"<table><td>a</td><td>b"),
+                         [["a", "b"]])
+
+    def test_iter_caffeine_informer_rows(self):
+        from neon_skill_caffeinewiz.parsers import iter_caffeine_informer_rows
+        rows = iter_caffeine_informer_rows(self.informer_page)
+        self.assertEqual(next(rows),
+                         ["bawls exxtra", "16", "150", "coffee", "9.38"])
+        self.assertEqual(len(list(rows)), 79)
+
+        # Markup, entities and escapes are handled per cell; malformed rows
+        # are skipped and unrecognized input ends the array
+        page = b'<script>var tbldata = [["<a href=\\"/x\\">Caf\\u00e9 ' \
+               b'&amp; <b>Cream</b></a>","8","75"],["short"],' \
+               b'[["nested"],"1","2"],null,["Tea","8",40],["bad'
+        self.assertEqual(parse_caffeine_informer(page),
+                         [["caf\xe9 & cream", "8", "75"],
+                          ["tea", "8", "40"]])
+        self.assertEqual(parse_caffeine_informer(b"<html></html>"), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
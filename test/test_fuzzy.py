@@ -0,0 +1,68 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Development System
+#
+# Copyright 2008-2025 Neongecko.com Inc. | All Rights Reserved
+#
+# Notice of License - Duplicating this Notice of License near the start of any file containing
+# a derivative of this software is a condition of license for this software.
+# Friendly Licensing:
+# No charge, open source royalty free use of the Neon AI software source and object is offered for
+# educational users, noncommercial enthusiasts, Public Benefit Corporations (and LLCs) and
+# Social Purpose Corporations (and LLCs). Developers can contact developers@neon.ai
+# For commercial licensing, distribution of derivative works or redistribution please contact licenses@neon.ai
+# Distributed on an "AS IS” basis without warranties or conditions of any kind, either express or implied.
+# Trademarks of Neongecko: Neon AI(TM), Neon Assist (TM), Neon Communicator(TM), Klat(TM)
+# Authors: Guy Daniels, Daniel McKnight, Regina Bloomstine, Elon Gasper, Richard Leeds
+#
+# Specialized conversational reconveyance options from Conversation Processing Intelligence Corp.
+# US Patents 2008-2021: US7424516, US20140161250, US20140177813, US8638908, US8068604, US8553852, US10530923, US10530924
+# China Patent: CN102017585  -  Europe Patent: EU2156652  -  Patents Pending
+
+import unittest
+
+from neon_skill_caffeinewiz.fuzzy import FuzzyIndex, trigrams
+
+
+class TestFuzzyIndex(unittest.TestCase):
+    names = ["red bull", "red bull sugar free", "monster energy drink",
+             "dr pepper", "diet dr pepper", "coffee", "coca-cola classic",
+             "cult cola"]
+
+    def test_trigrams(self):
+        self.assertEqual(trigrams("ab"), {"  a", " ab", "ab "})
+        self.assertEqual(trigrams(""), {"   "})
+
+    def test_search(self):
+        index = FuzzyIndex(self.names)
+        self.assertEqual(len(index), len(self.names))
+        results = index.search("red bul")
+        self.assertEqual(results[0][0], 0)
+        self.assertEqual([r[1] for r in results],
+                         sorted([r[1] for r in results], reverse=True))
+        self.assertEqual(index.search("dr peper", limit=1)[0][0], 3)
+        self.assertEqual(index.search("monstr energy")[0][0], 2)
+        # Misspelled names still match names with more words
+        self.assertEqual(index.search("coka cola")[0][0], 6)
+        self.assertEqual(index.search("software"), [])
+        self.assertEqual(index.search("coffee")[0], (5, 1.0))
+        self.assertEqual(len(index.search("red", limit=1, cutoff=0.01)), 1)
+
+    def test_search_matches_full_scan(self):
+        index = FuzzyIndex(self.names)
+        for query in ("red bul", "pepper", "diet", "energy drink", "x"):
+            for cutoff in (0.1, 0.3, 0.5):
+                expected = sorted(((i, index.score(query, i))
+                                   for i in range(len(self.names))
+                                   if index.score(query, i) >= cutoff),
+                                  key=lambda s: (-s[1], s[0]))
+                self.assertEqual(index.search(query, len(self.names), cutoff),
+                                 expected)
+
+    def test_rank(self):
+        index = FuzzyIndex(self.names)
+        ranked = index.rank("dr pepper", [4, 3])
+        self.assertEqual(ranked[0], (3, 1.0))
+        self.assertEqual(ranked[1][0], 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,211 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Development System
+#
+# Copyright 2008-2025 Neongecko.com Inc. | All Rights Reserved
+#
+# Notice of License - Duplicating this Notice of License near the start of any file containing
+# a derivative of this software is a condition of license for this software.
+# Friendly Licensing:
+# No charge, open source royalty free use of the Neon AI software source and object is offered for
+# educational users, noncommercial enthusiasts, Public Benefit Corporations (and LLCs) and
+# Social Purpose Corporations (and LLCs). Developers can contact developers@neon.ai
+# For commercial licensing, distribution of derivative works or redistribution please contact licenses@neon.ai
+# Distributed on an "AS IS” basis without warranties or conditions of any kind, either express or implied.
+# Trademarks of Neongecko: Neon AI(TM), Neon Assist (TM), Neon Communicator(TM), Klat(TM)
+# Authors: Guy Daniels, Daniel McKnight, Regina Bloomstine, Elon Gasper, Richard Leeds
+#
+# Specialized conversational reconveyance options from Conversation Processing Intelligence Corp.
+# US Patents 2008-2021: US7424516, US20140161250, US20140177813, US8638908, US8068604, US8553852, US10530923, US10530924
+# China Patent: CN102017585  -  Europe Patent: EU2156652  -  Patents Pending
+
+import pickle
+import random
+import unittest
+
+from os.path import dirname, join
+
+from neon_skill_caffeinewiz.index import DrinkIndex, MatchType, \
+    NameAutomaton, SubstringIndex
+
+BUNDLED_DATA = join(dirname(dirname(__file__)), "neon_skill_caffeinewiz",
+                    "caffeine_wiz_data.pickle")
+
+
+def _scan(rows, drink):
+    # Reference implementation replaced by DrinkIndex
+    return [i for i in rows if i[0] in drink or drink in i[0]]
+
+
+class TestDrinkIndex(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        with open(BUNDLED_DATA, 'rb') as f:
+            cls.rows = pickle.load(f)
+        cls.rows.append(['rocket chocolate', '.4', '150'])
+        cls.index = DrinkIndex(cls.rows)
+
+    def _queries(self):
+        rand = random.Random(1234)
+        names = [r[0] for r in self.rows]
+        queries = {"coke", "coffee", "software", "diet coke", "red bull",
+                   "a", "co", "zz", "what is in a diet coke and a red bull",
+                   "coca-cola classic", "coke zero sugar", " ", "-"}
+        for name in rand.sample(names, 200):
+            start = rand.randrange(len(name))
+            queries.add(name)
+            queries.add(name[start:start + rand.randint(1, 8)])
+            queries.add(f"how much caffeine is in {name} please")
+            queries.add(name + "x")
+        return sorted(queries)
+
+    def test_parity_with_scan(self):
+        for query in self._queries():
+            self.assertEqual(_scan(self.rows, query), self.index.match(query),
+                             query)
+            self.assertEqual(bool(_scan(self.rows, query)),
+                             self.index.contains(query), query)
+
+    def test_find(self):
+        for query in self._queries():
+            result = self.index.find(query)
+            rows = _scan(self.rows, query)
+            self.assertEqual(bool(result), bool(rows))
+            self.assertEqual(sorted(result.rows), sorted(rows))
+            if not rows:
+                self.assertTrue(all(m.match_type == MatchType.FUZZY
+                                    for m in result.matches))
+                continue
+            scores = [m.score for m in result.matches]
+            self.assertEqual(scores, sorted(scores, reverse=True))
+            self.assertEqual(result.alternatives, result.matches[1:])
+
+        result = self.index.find("coca-cola classic")
+        self.assertEqual(result.best.name, "coca-cola classic")
+        self.assertEqual(result.best.match_type, MatchType.EXACT)
+        self.assertEqual(result.best.score, 1.0)
+        result = self.index.find("diet coke with")
+        self.assertEqual(result.best.match_type, MatchType.SUBSTRING)
+        self.assertTrue(result.best.name.startswith("diet coke with"))
+        self.assertFalse(self.index.find("software"))
+
+        result = self.index.find("monstr energy")
+        self.assertEqual(result.best.match_type, MatchType.FUZZY)
+        self.assertTrue(result.best.name.startswith("monster energy"))
+        result = self.index.find("coka cola")
+        self.assertEqual(result.best.match_type, MatchType.FUZZY)
+        self.assertEqual(result.best.name, "coca-cola classic")
+        self.assertEqual(self.index.find("red bul").best.name, "red bull")
+
+    def test_duplicate_names(self):
+        rows = [["coffee", "8", "95"], ["tea", "8", "47"],
+                ["coffee", "16", "190"]]
+        index = DrinkIndex(rows)
+        self.assertEqual(index.match("coffee"), [rows[0], rows[2]])
+        self.assertEqual(index.match_ids("iced coffee"), [0, 2])
+
+    def test_aliases(self):
+        rows = [["7-up", "12", "0"], ["7 up", "12", "0"],
+                ["five hour energy", "2", "200"], ["tea", "8", "47"]]
+        index = DrinkIndex(rows, {"7 up": "7-up", "5 hour energy":
+                                  "five hour energy", "chai": "missing"})
+        # Aliases that are already names or point to no row are ignored
+        self.assertEqual(index.aliases, {"5 hour energy": "five hour energy"})
+
+        result = index.find("5 hour energy")
+        self.assertEqual(result.rows, [rows[2]])
+        self.assertEqual(result.best.match_type, MatchType.EXACT)
+        self.assertEqual(index.match("a 5 hour energy"), [rows[2]])
+        self.assertEqual(index.match("hour energy"), [rows[2]])
+        self.assertEqual(index.find("5 hour enrgy").best.name,
+                         "five hour energy")
+        self.assertFalse(index.contains("chai"))
+
+        restored = DrinkIndex.from_state(rows, pickle.loads(
+            pickle.dumps(index.export_state())))
+        self.assertEqual(restored.match("5 hour energy"), [rows[2]])
+
+    def test_apply(self):
+        rand = random.Random(42)
+        rows = sorted(self.rows)
+        updated = [row for row in rows if rand.random() > 0.02]
+        updated += [[f"{row[0]} zero", row[1], row[2]]
+                    for row in rand.sample(rows, 20)]
+        updated.sort()
+        aliases = {"seven up": "7-up", "5 hour energy": "5-hour energy"}
+        applied = DrinkIndex(rows).apply(updated, aliases)
+        rebuilt = DrinkIndex(updated, aliases)
+        self.assertTrue(applied._extra_keys)
+        self.assertEqual(applied.aliases, rebuilt.aliases)
+        for query in self._queries() + ["seven up", "coke zero", "sevn up"]:
+            self.assertEqual(applied.match(query), rebuilt.match(query),
+                             query)
+            self.assertEqual(applied.contains(query), rebuilt.contains(query))
+            self.assertEqual(sorted(applied.find(query).rows),
+                             sorted(rebuilt.find(query).rows), query)
+        self.assertEqual(applied.find("seven up").best.match_type,
+                         MatchType.EXACT)
+
+        # The original index is not modified
+        self.assertEqual(DrinkIndex(rows).match("coke"),
+                         DrinkIndex(rows).apply(rows).match("coke"))
+
+        # Large changes rebuild the index
+        rebuilt = DrinkIndex(rows).apply(rows[:len(rows) // 2])
+        self.assertEqual(rebuilt._unused, 0)
+        self.assertFalse(DrinkIndex([]).apply(rows)._extra_keys)
+
+    def test_mentions(self):
+        rows = [["coke", "12", "34"], ["diet coke", "12", "46"],
+                ["red bull", "8.4", "80"], ["red bull sugarfree", "8.4", "80"],
+                ["tea", "8", "47"], ["five hour energy", "2", "200"]]
+        index = DrinkIndex(rows, {"5 hour energy": "five hour energy"})
+
+        mentions = index.mentions("a diet coke, red bull and tea")
+        self.assertEqual([(m.start, m.end, m.key) for m in mentions],
+                         [(2, 11, "diet coke"), (13, 21, "red bull"),
+                          (26, 29, "tea")])
+        self.assertEqual([m.row for m in mentions],
+                         [rows[1], rows[2], rows[4]])
+        # The longest name starting first wins and aliases resolve to rows
+        self.assertEqual([m.name for m in index.mentions(
+            "red bull sugarfree and 5 hour energy")],
+                         ["red bull sugarfree", "five hour energy"])
+        # Names must start and end at word boundaries
+        self.assertEqual(index.mentions("steak and cokes"), [])
+        self.assertEqual(DrinkIndex([]).mentions("coke"), [])
+
+        # Names added or removed by `apply` are handled
+        rows = sorted(self.rows)
+        updated = [row for row in rows if row[0] != "red bull"] + \
+            [["moon juice", "12", "30"]]
+        applied = DrinkIndex(rows).apply(updated)
+        self.assertTrue(applied._extra_keys)
+        self.assertEqual([m.name for m in applied.mentions(
+            "red bull and moon juice")], ["moon juice"])
+        self.assertEqual([m.name for m in applied.mentions(
+            "diet coke and moon juice")], ["diet coke", "moon juice"])
+
+    def test_empty(self):
+        index = DrinkIndex([])
+        self.assertEqual(len(index), 0)
+        self.assertEqual(index.match("coke"), [])
+        self.assertFalse(index.contains("coke"))
+        self.assertFalse(index.contains(""))
+
+    def test_substring_index(self):
+        index = SubstringIndex(["abcde", "bcd", "xyz"])
+        self.assertEqual(index.search(""), [0, 1, 2])
+        self.assertEqual(index.search("b"), [0, 1])
+        self.assertEqual(index.search("bcd"), [0, 1])
+        self.assertEqual(index.search("bcde"), [0])
+        self.assertEqual(index.search("bcdx"), [])
+
+    def test_name_automaton(self):
+        automaton = NameAutomaton(["he", "she", "his", "hers", ""])
+        self.assertEqual(automaton.search("ushers"), [0, 1, 3, 4])
+        self.assertEqual(automaton.search("hi"), [4])
+        self.assertEqual(list(automaton.finditer("ushers")),
+                         [(4, 1), (4, 0), (6, 3)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Development System
+#
+# Copyright 2008-2025 Neongecko.com Inc. | All Rights Reserved
+#
+# Notice of License - Duplicating this Notice of License near the start of any file containing
+# a derivative of this software is a condition of license for this software.
+# Friendly Licensing:
+# No charge, open source royalty free use of the Neon AI software source and object is offered for
+# educational users, noncommercial enthusiasts, Public Benefit Corporations (and LLCs) and
+# Social Purpose Corporations (and LLCs). Developers can contact developers@neon.ai
+# For commercial licensing, distribution of derivative works or redistribution please contact licenses@neon.ai
+# Distributed on an "AS IS” basis without warranties or conditions of any kind, either express or implied.
+# Trademarks of Neongecko: Neon AI(TM), Neon Assist (TM), Neon Communicator(TM), Klat(TM)
+# Authors: Guy Daniels, Daniel McKnight, Regina Bloomstine, Elon Gasper, Richard Leeds
+#
+# Specialized conversational reconveyance options from Conversation Processing Intelligence Corp.
+# US Patents 2008-2021: US7424516, US20140161250, US20140177813, US8638908, US8068604, US8553852, US10530923, US10530924
+# China Patent: CN102017585  -  Europe Patent: EU2156652  -  Patents Pending
+
+import unittest
+
+from neon_skill_caffeinewiz.merge import HEADER_ROW, merge_drink_tables, \
+    normalize_key
+
+
+class TestMerge(unittest.TestCase):
+    def test_normalize_key(self):
+        self.assertEqual(normalize_key(" Diet  Coke "), "diet coke")
+
+    def test_merge_drink_tables(self):
+        primary = [list(HEADER_ROW), ["coffee", "8", "95"], ["tea", "8", "47"],
+                   ["tea", "8", "40"], ["bad row"]]
+        secondary = [["Coffee", "8", "100", "x", "y"], ["cola", "12", "34"]]
+        merged = merge_drink_tables(primary, secondary)
+        self.assertIsInstance(merged, tuple)
+        self.assertEqual(merged, (("coffee", "8", "95"), ("cola", "12", "34"),
+                                  ("tea", "8", "47")))
+
+        # Duplicates are resolved by table order
+        merged = merge_drink_tables(secondary, primary)
+        self.assertEqual(merged, (("Coffee", "8", "100"),
+                                  ("cola", "12", "34"), ("tea", "8", "47")))
+
+        merged = merge_drink_tables(primary, secondary, sources=[3, 4])
+        self.assertEqual(merged, (("coffee", "8", "95", 3),
+                                  ("cola", "12", "34", 4),
+                                  ("tea", "8", "47", 3)))
+
+        self.assertEqual(merge_drink_tables(), tuple())
+        self.assertEqual(merge_drink_tables(None, []), tuple())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Development System
+#
+# Copyright 2008-2025 Neongecko.com Inc. | All Rights Reserved
+#
+# Notice of License - Duplicating this Notice of License near the start of any file containing
+# a derivative of this software is a condition of license for this software.
+# Friendly Licensing:
+# No charge, open source royalty free use of the Neon AI software source and object is offered for
+# educational users, noncommercial enthusiasts, Public Benefit Corporations (and LLCs) and
+# Social Purpose Corporations (and LLCs). Developers can contact developers@neon.ai
+# For commercial licensing, distribution of derivative works or redistribution please contact licenses@neon.ai
+# Distributed on an "AS IS” basis without warranties or conditions of any kind, either express or implied.
+# Trademarks of Neongecko: Neon AI(TM), Neon Assist (TM), Neon Communicator(TM), Klat(TM)
+# Authors: Guy Daniels, Daniel McKnight, Regina Bloomstine, Elon Gasper, Richard Leeds
+#
+# Specialized conversational reconveyance options from Conversation Processing Intelligence Corp.
+# US Patents 2008-2021: US7424516, US20140161250, US20140177813, US8638908, US8068604, US8553852, US10530923, US10530924
+# China Patent: CN102017585  -  Europe Patent: EU2156652  -  Patents Pending
+
+
+import json
+import unittest
+
+from neon_skill_caffeinewiz.metrics import Histogram, Metrics
+
+
+class TestMetrics(unittest.TestCase):
+    def test_histogram(self):
+        hist = Histogram((1, 10, 100))
+        self.assertIsNone(hist.quantile(0.5))
+        for value in (0.5, 2, 3, 5, 50, 500):
+            hist.observe(value)
+        self.assertEqual(hist.counts, [1, 3, 1, 1])
+        self.assertEqual(hist.quantile(0.5), 10)
+        self.assertEqual(hist.quantile(0.1), 1)
+        # Values above every bound are reported as the maximum
+        self.assertEqual(hist.quantile(0.99), 500)
+        stats = hist.as_dict()
+        self.assertEqual(stats["count"], 6)
+        self.assertEqual(stats["max_ms"], 500)
+        self.assertAlmostEqual(stats["mean_ms"], 560.5 / 6, 3)
+
+    def test_disabled(self):
+        metrics = Metrics()
+        metrics.increment("queries")
+        metrics.observe("lookup", 0.1)
+        with metrics.timer("lookup"):
+            pass
+        snapshot = metrics.snapshot()
+        self.assertFalse(snapshot["enabled"])
+        self.assertEqual(snapshot["counters"], {})
+        self.assertEqual(snapshot["latency"], {})
+
+    def test_enabled(self):
+        metrics = Metrics(enabled=True)
+        metrics.increment("queries")
+        metrics.increment("queries", 2)
+        with metrics.timer("lookup"):
+            pass
+        metrics.observe("lookup", 0.002)
+        metrics.add_gauge("drinks", lambda: 42)
+        metrics.add_gauge("broken", lambda: 1 / 0)
+        snapshot = metrics.snapshot()
+        self.assertEqual(snapshot["counters"], {"queries": 3})
+        self.assertEqual(snapshot["latency"]["lookup"]["count"], 2)
+        self.assertEqual(snapshot["latency"]["lookup"]["max_ms"], 2)
+        self.assertEqual(snapshot["gauges"], {"drinks": 42, "broken": None})
+        json.dumps(snapshot)
+
+        metrics.reset()
+        snapshot = metrics.snapshot()
+        self.assertEqual(snapshot["counters"], {})
+        self.assertEqual(snapshot["latency"], {})
+        self.assertEqual(snapshot["gauges"]["drinks"], 42)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Development System
+#
+# Copyright 2008-2025 Neongecko.com Inc. | All Rights Reserved
+#
+# Notice of License - Duplicating this Notice of License near the start of any file containing
+# a derivative of this software is a condition of license for this software.
+# Friendly Licensing:
+# No charge, open source royalty free use of the Neon AI software source and object is offered for
+# educational users, noncommercial enthusiasts, Public Benefit Corporations (and LLCs) and
+# Social Purpose Corporations (and LLCs). Developers can contact developers@neon.ai
+# For commercial licensing, distribution of derivative works or redistribution please contact licenses@neon.ai
+# Distributed on an "AS IS” basis without warranties or conditions of any kind, either express or implied.
+# Trademarks of Neongecko: Neon AI(TM), Neon Assist (TM), Neon Communicator(TM), Klat(TM)
+# Authors: Guy Daniels, Daniel McKnight, Regina Bloomstine, Elon Gasper, Richard Leeds
+#
+# Specialized conversational reconveyance options from Conversation Processing Intelligence Corp.
+# US Patents 2008-2021: US7424516, US20140161250, US20140177813, US8638908, US8068604, US8553852, US10530923, US10530924
+# China Patent: CN102017585  -  Europe Patent: EU2156652  -  Patents Pending
+
+
+import json
+import unittest
+
+from os.path import join
+from tempfile import TemporaryDirectory
+
+from neon_skill_caffeinewiz.names import NameCache, normalize_drink_name
+
+
+class TestNameCache(unittest.TestCase):
+    def setUp(self):
+        self.calls = list()
+
+    def _normalizer(self, name, lang):
+        self.calls.append((name, lang))
+        return name.replace("-", " ").replace("five", "5")
+
+    def test_normalize_drink_name(self):
+        from lingua_franca import load_language
+        load_language("en")
+        self.assertEqual(normalize_drink_name("five-hour energy", "en"),
+                         "5 hour energy")
+
+    def test_memoized(self):
+        cache = NameCache(normalizer=self._normalizer)
+        self.assertEqual(cache.update(["7-up", "tea", "7-up"], "en"), 2)
+        self.assertEqual(cache.normalize("7-up", "en"), "7 up")
+        self.assertEqual(cache.update(["tea", "five hour energy"], "en"), 1)
+        self.assertEqual(cache.normalize("tea", "de"), "tea")
+        self.assertEqual(len(self.calls), 4)
+        self.assertEqual(len(cache), 4)
+        self.assertEqual(cache.get("7-up", "en"), "7 up")
+        self.assertIsNone(cache.get("7-up", "de"))
+
+    def test_aliases(self):
+        cache = NameCache(normalizer=self._normalizer)
+        cache.update(["7-up", "7 up", "five-hour", "five hour"], "en")
+        self.assertEqual(cache.aliases(["7-up", "five-hour", "five hour",
+                                        "coffee"], "en"),
+                         {"7 up": "7-up", "5 hour": "five-hour"})
+        self.assertEqual(cache.aliases(["7-up"], "de"), {})
+
+    def test_persisted(self):
+        with TemporaryDirectory() as tmp:
+            path = join(tmp, "names.json")
+            cache = NameCache(path, self._normalizer)
+            cache.save()
+            self.assertEqual(cache.update(["7-up", "tea"], "en"), 2)
+            cache.save()
+
+            cache = NameCache(path, self._normalizer)
+            self.assertEqual(cache.update(["7-up", "tea", "cola"], "en"), 1)
+            self.assertEqual(cache.aliases(["7-up"], "en"), {"7 up": "7-up"})
+            self.assertEqual(len(self.calls), 3)
+
+            # Incompatible files are discarded
+            with open(path, 'w') as f:
+                json.dump({"version": 0, "names": {"en": {"a": "b"}}}, f)
+            self.assertEqual(len(NameCache(path, self._normalizer)), 0)
+            with open(path, 'w') as f:
+                f.write("{")
+            self.assertEqual(len(NameCache(path, self._normalizer)), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
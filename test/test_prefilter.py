@@ -0,0 +1,57 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Development System
+#
+# Copyright 2008-2025 Neongecko.com Inc. | All Rights Reserved
+#
+# Notice of License - Duplicating this Notice of License near the start of any file containing
+# a derivative of this software is a condition of license for this software.
+# Friendly Licensing:
+# No charge, open source royalty free use of the Neon AI software source and object is offered for
+# educational users, noncommercial enthusiasts, Public Benefit Corporations (and LLCs) and
+# Social Purpose Corporations (and LLCs). Developers can contact developers@neon.ai
+# For commercial licensing, distribution of derivative works or redistribution please contact licenses@neon.ai
+# Distributed on an "AS IS” basis without warranties or conditions of any kind, either express or implied.
+# Trademarks of Neongecko: Neon AI(TM), Neon Assist (TM), Neon Communicator(TM), Klat(TM)
+# Authors: Guy Daniels, Daniel McKnight, Regina Bloomstine, Elon Gasper, Richard Leeds
+#
+# Specialized conversational reconveyance options from Conversation Processing Intelligence Corp.
+# US Patents 2008-2021: US7424516, US20140161250, US20140177813, US8638908, US8068604, US8553852, US10530923, US10530924
+# China Patent: CN102017585  -  Europe Patent: EU2156652  -  Patents Pending
+
+
+import unittest
+
+from neon_skill_caffeinewiz.prefilter import PhraseFilter, tokenize
+
+
+class TestPhraseFilter(unittest.TestCase):
+    def test_tokenize(self):
+        self.assertEqual(tokenize("What's in Peet's (Large) coffee?"),
+                         {"what's", "in", "peet's", "large", "coffee"})
+        self.assertEqual(tokenize(" ? "), set())
+
+    def test_accepts(self):
+        phrase_filter = PhraseFilter(
+            ["rip it energy drink", "rip it energy shot", "red bull",
+             "red bull sugar free", "diet coke", "coffee"],
+            ["caffeine", "caffeine content"])
+        self.assertEqual(len(phrase_filter), 6)
+        self.assertTrue(phrase_filter.accepts("what is in diet coke"))
+        self.assertTrue(phrase_filter.accepts("Coffee?"))
+        self.assertTrue(phrase_filter.accepts("how much caffeine is in tea"))
+        self.assertTrue(phrase_filter.accepts("tell me about content"))
+        # Common words are not used to represent a name
+        self.assertFalse(phrase_filter.accepts("what time is it"))
+        self.assertFalse(phrase_filter.accepts("what color is red"))
+        self.assertTrue(phrase_filter.accepts("a can of rip it energy shot"))
+        # Only whole names can match
+        self.assertFalse(phrase_filter.accepts("a can of rip it"))
+        self.assertFalse(PhraseFilter([]).accepts("coffee"))
+        # Single letters are only used if a name has no other word
+        phrase_filter = PhraseFilter(["chick fil a iced coffee",
+                                      "chick fil iced coffee", "7 up"])
+        self.assertFalse(phrase_filter.accepts("tell me a joke"))
+        self.assertTrue(phrase_filter.accepts("what is in a 7 up"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,213 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Development System
+#
+# Copyright 2008-2025 Neongecko.com Inc. | All Rights Reserved
+#
+# Notice of License - Duplicating this Notice of License near the start of any file containing
+# a derivative of this software is a condition of license for this software.
+# Friendly Licensing:
+# No charge, open source royalty free use of the Neon AI software source and object is offered for
+# educational users, noncommercial enthusiasts, Public Benefit Corporations (and LLCs) and
+# Social Purpose Corporations (and LLCs). Developers can contact developers@neon.ai
+# For commercial licensing, distribution of derivative works or redistribution please contact licenses@neon.ai
+# Distributed on an "AS IS” basis without warranties or conditions of any kind, either express or implied.
+# Trademarks of Neongecko: Neon AI(TM), Neon Assist (TM), Neon Communicator(TM), Klat(TM)
+# Authors: Guy Daniels, Daniel McKnight, Regina Bloomstine, Elon Gasper, Richard Leeds
+#
+# Specialized conversational reconveyance options from Conversation Processing Intelligence Corp.
+# US Patents 2008-2021: US7424516, US20140161250, US20140177813, US8638908, US8068604, US8553852, US10530923, US10530924
+# China Patent: CN102017585  -  Europe Patent: EU2156652  -  Patents Pending
+
+
+import json
+import os
+import unittest
+
+from tempfile import TemporaryDirectory
+from threading import Event
+from time import monotonic
+
+from neon_skill_caffeinewiz.fetch import FetchResult, SourceFetcher
+from neon_skill_caffeinewiz.providers import BundledProvider, \
+    CaffeineInformerProvider, CaffeineWizProvider, DrinkProvider, \
+    LocalFileProvider, MemoryProvider, ProviderAggregator
+from neon_skill_caffeinewiz.store import Source
+from source_server import SourceServer, load_fixture
+
+
+class _SlowProvider(DrinkProvider):
+    def __init__(self, name, release: Event, **kwargs):
+        DrinkProvider.__init__(self, name, **kwargs)
+        self.release = release
+
+    def fetch(self, deadline):
+        self.release.wait(10)
+        return FetchResult(self.name, status=200, body=b"")
+
+    def parse(self, body):
+        return [["slow drink", "8", "1"]]
+
+
+class TestProviders(unittest.TestCase):
+    def test_local_file_provider(self):
+        with TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "drinks.csv")
+            with open(path, "w") as f:
+                f.write("name,oz,mg\n"
+                        "Office  Coffee,8,120\n"
+                        "# comment,1,1\n"
+                        "short,8\n"
+                        "Office Tea,8,30\n")
+            provider = LocalFileProvider(path, timeout=2)
+            self.assertEqual(provider.name, path)
+            self.assertEqual(provider.source, Source.LOCAL)
+            result = provider.rows()
+            self.assertIsNone(result.error)
+            self.assertEqual(result.rows, [["office coffee", "8", "120"],
+                                           ["office tea", "8", "30"]])
+            self.assertIn("last_modified", result.freshness)
+
+            # An unchanged file is not parsed again
+            result = provider.rows()
+            self.assertTrue(result.not_modified)
+            self.assertIsNone(result.rows)
+            self.assertTrue(result.ok)
+
+            path = os.path.join(tmp, "drinks.json")
+            with open(path, "w") as f:
+                json.dump([["Cold Brew", 12, 200],
+                           {"name": "Matcha", "oz": "8", "mg": "70"},
+                           {"name": "No Values"}], f)
+            self.assertEqual(LocalFileProvider(path).rows().rows,
+                             [["cold brew", "12", "200"],
+                              ["matcha", "8", "70"]])
+
+            with open(path, "w") as f:
+                f.write("not json")
+            result = LocalFileProvider(path).rows()
+            self.assertIsNone(result.rows)
+            self.assertIn("Parse error", result.error)
+            self.assertFalse(result.ok)
+
+        result = LocalFileProvider(path).rows()
+        self.assertIsNotNone(result.error)
+
+    def test_memory_and_bundled_providers(self):
+        provider = MemoryProvider([["a drink", "8", "10"]], "memory")
+        self.assertEqual(provider.rows().rows, [["a drink", "8", "10"]])
+        self.assertEqual(provider.default_rows(), [["a drink", "8", "10"]])
+        provider.set_rows([])
+        self.assertFalse(provider.rows().ok)
+        self.assertEqual(MemoryProvider([], source=Source.SKILL).name,
+                         "skill")
+
+        bundled = BundledProvider().default_rows()
+        self.assertGreater(len(bundled), 100)
+        wiz = CaffeineWizProvider(url="http://127.0.0.1:9/")
+        self.assertEqual(wiz.default_rows(), bundled)
+        self.assertEqual(CaffeineInformerProvider().default_rows(), [])
+
+    def test_http_providers(self):
+        server = SourceServer({"/wiz": load_fixture("caffeinewiz.html"),
+                               "/informer": load_fixture(
+                                   "caffeineinformer.html")})
+        try:
+            fetcher = SourceFetcher()
+            wiz = CaffeineWizProvider(f"{server.url}/wiz", fetcher=fetcher)
+            informer = CaffeineInformerProvider(f"{server.url}/informer",
+                                                fetcher=fetcher)
+            result = wiz.rows()
+            self.assertIn(["10 hour energy shot", "1.93", "422"], result.rows)
+            self.assertIsNotNone(result.parse_time)
+            self.assertIn("etag", result.freshness)
+            self.assertEqual(len(informer.rows().rows), 80)
+
+            # Parsed pages are requested conditionally
+            self.assertTrue(wiz.rows().not_modified)
+            self.assertEqual(server.requests[-1], ("/wiz", 304))
+
+            result = CaffeineWizProvider(f"{server.url}/missing").rows()
+            self.assertIsNotNone(result.error)
+            self.assertFalse(result.ok)
+        finally:
+            server.shutdown()
+
+    def test_aggregator_collect(self):
+        release = Event()
+        slow = _SlowProvider("slow", release, timeout=0.2)
+        fast = MemoryProvider([["fast drink", "8", "2"]], "fast")
+        aggregator = ProviderAggregator([slow, fast])
+        with self.assertRaises(ValueError):
+            aggregator.add(MemoryProvider([], "fast"))
+        self.assertEqual(aggregator.names, ["slow", "fast"])
+
+        # A provider over its timeout doesn't hold up the others
+        start = monotonic()
+        results = aggregator.collect()
+        self.assertLess(monotonic() - start, 5)
+        release.set()
+        self.assertEqual(list(results), ["slow", "fast"])
+        self.assertIn("Timed out", results["slow"].error)
+        self.assertEqual(results["fast"].rows, [["fast drink", "8", "2"]])
+
+        self.assertEqual(list(aggregator.collect([fast])), ["fast"])
+        self.assertEqual(aggregator.collect([]), {})
+        self.assertEqual(set(aggregator.status()), {"slow", "fast"})
+
+    def test_aggregator_collect_http(self):
+        server = SourceServer({"/wiz": load_fixture("caffeinewiz.html"),
+                               "/informer": load_fixture(
+                                   "caffeineinformer.html")})
+        try:
+            server.delay = 0.5
+            fetcher = SourceFetcher()
+            aggregator = ProviderAggregator([
+                CaffeineWizProvider(f"{server.url}/wiz", fetcher=fetcher),
+                CaffeineInformerProvider(f"{server.url}/informer",
+                                         fetcher=fetcher)])
+            # Pages are requested concurrently
+            start = monotonic()
+            results = aggregator.collect()
+            self.assertLess(monotonic() - start, 0.95)
+            self.assertTrue(all(r.rows for r in results.values()))
+
+            # Both pages are requested conditionally once parsed
+            results = aggregator.collect()
+            self.assertTrue(all(r.not_modified for r in results.values()))
+            self.assertEqual(sorted(server.requests[-2:]),
+                             [("/informer", 304), ("/wiz", 304)])
+        finally:
+            server.shutdown()
+
+    def test_drink_provider_abstract(self):
+        with self.assertRaises(TypeError):
+            DrinkProvider("abstract")
+
+    def test_aggregator_merge(self):
+        first = MemoryProvider([["shared", "8", "1"]], "first")
+        second = MemoryProvider([["shared", "8", "2"], ["other", "8", "3"]],
+                                "second", source=Source.SKILL)
+        aggregator = ProviderAggregator([first, second])
+        self.assertEqual(aggregator.merge({}),
+                         (("other", "8", "3", Source.SKILL),
+                          ("shared", "8", "1", Source.LOCAL)))
+        self.assertEqual(aggregator.merge({}, ["second"]),
+                         (("other", "8", "3", Source.SKILL),
+                          ("shared", "8", "2", Source.SKILL)))
+
+        # Given rows replace the default rows, unknown providers are ignored
+        tables = {"first": [], "unknown": [["ignored", "8", "1"]]}
+        self.assertEqual(aggregator.merge(tables, ["unknown", "first"]),
+                         (("other", "8", "3", Source.SKILL),
+                          ("shared", "8", "2", Source.SKILL)))
+        # Merging is independent of the order of `tables`
+        tables = {"second": [["b", "8", "1"]], "first": [["a", "8", "1"]]}
+        self.assertEqual(aggregator.merge(tables),
+                         aggregator.merge(dict(reversed(tables.items()))))
+
+        self.assertEqual(aggregator.resolve({"first": []}),
+                         {"first": [["shared", "8", "1"]],
+                          "second": second.default_rows()})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,176 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Development System
+#
+# Copyright 2008-2025 Neongecko.com Inc. | All Rights Reserved
+#
+# Notice of License - Duplicating this Notice of License near the start of any file containing
+# a derivative of this software is a condition of license for this software.
+# Friendly Licensing:
+# No charge, open source royalty free use of the Neon AI software source and object is offered for
+# educational users, noncommercial enthusiasts, Public Benefit Corporations (and LLCs) and
+# Social Purpose Corporations (and LLCs). Developers can contact developers@neon.ai
+# For commercial licensing, distribution of derivative works or redistribution please contact licenses@neon.ai
+# Distributed on an "AS IS” basis without warranties or conditions of any kind, either express or implied.
+# Trademarks of Neongecko: Neon AI(TM), Neon Assist (TM), Neon Communicator(TM), Klat(TM)
+# Authors: Guy Daniels, Daniel McKnight, Regina Bloomstine, Elon Gasper, Richard Leeds
+#
+# Specialized conversational reconveyance options from Conversation Processing Intelligence Corp.
+# US Patents 2008-2021: US7424516, US20140161250, US20140177813, US8638908, US8068604, US8553852, US10530923, US10530924
+# China Patent: CN102017585  -  Europe Patent: EU2156652  -  Patents Pending
+
+
+import json
+import random
+import unittest
+
+from datetime import datetime, timedelta
+from threading import Event
+
+from neon_skill_caffeinewiz.scheduler import RefreshScheduler
+
+
+class TestRefreshScheduler(unittest.TestCase):
+    now = datetime(2026, 1, 5, 10, 0, 0)
+
+    def test_schedule_jitter(self):
+        scheduler = RefreshScheduler(3600, jitter=0.1,
+                                     rand=random.Random(1))
+        runs = {scheduler.schedule(self.now) for _ in range(50)}
+        self.assertGreater(len(runs), 1)
+        for run in runs:
+            self.assertGreaterEqual(run, self.now + timedelta(seconds=3240))
+            self.assertLessEqual(run, self.now + timedelta(seconds=3960))
+        self.assertIn(scheduler.next_run, runs)
+
+        # Runs are planned from the last success and never in the past
+        scheduler.last_success = self.now - timedelta(minutes=30)
+        self.assertLess(scheduler.schedule(self.now),
+                        self.now + timedelta(minutes=37))
+        scheduler.last_success = self.now - timedelta(days=1)
+        self.assertEqual(scheduler.schedule(self.now), self.now)
+
+    def test_backoff(self):
+        scheduler = RefreshScheduler(3600, jitter=0, retry_delay=300,
+                                     max_backoff=3000)
+        scheduler.record("wiz", True, self.now)
+        self.assertTrue(scheduler.is_due("wiz", self.now))
+        self.assertTrue(scheduler.is_due("unknown", self.now))
+
+        delays = list()
+        for _ in range(6):
+            scheduler.record("wiz", False, self.now)
+            delays.append(scheduler.sources["wiz"].next_attempt - self.now)
+        self.assertEqual([d.total_seconds() for d in delays],
+                         [300, 600, 1200, 2400, 3000, 3000])
+        self.assertFalse(scheduler.is_due("wiz", self.now))
+        self.assertTrue(scheduler.is_due("wiz",
+                                         self.now + timedelta(hours=1)))
+
+        # A failed source is retried before the next interval
+        scheduler.sources["wiz"].failures = 1
+        scheduler.sources["wiz"].next_attempt = \
+            self.now + timedelta(seconds=300)
+        self.assertEqual(scheduler.schedule(self.now),
+                         self.now + timedelta(seconds=300))
+
+        scheduler.record("wiz", True, self.now)
+        state = scheduler.sources["wiz"]
+        self.assertEqual(state.failures, 0)
+        self.assertEqual(state.last_success, self.now)
+        self.assertEqual(scheduler.schedule(self.now),
+                         self.now + timedelta(seconds=3600))
+
+    def test_single_flight(self):
+        scheduler = RefreshScheduler(3600)
+        release = Event()
+        calls = list()
+
+        def _refresh(value):
+            calls.append(value)
+            release.wait(5)
+            return value
+
+        first = scheduler.run(_refresh, True)
+        second = scheduler.run(_refresh, False)
+        self.assertIs(first, second)
+        self.assertTrue(scheduler.running)
+        release.set()
+        self.assertTrue(first.result(5))
+        self.assertEqual(calls, [True])
+        self.assertFalse(scheduler.running)
+        self.assertEqual(scheduler.last_success, scheduler.last_run)
+
+        # A new refresh starts once the previous one completed
+        failed = scheduler.run(_refresh, False)
+        self.assertIsNot(failed, first)
+        self.assertFalse(failed.result(5))
+        self.assertNotEqual(scheduler.last_success, scheduler.last_run)
+
+        def _error():
+            raise RuntimeError("refresh failed")
+        with self.assertRaises(RuntimeError):
+            scheduler.run(_error).result(5)
+        self.assertFalse(scheduler.running)
+
+    def test_schedule_after_run(self):
+        planned = list()
+        scheduler = RefreshScheduler(3600, jitter=0.1)
+        scheduler.on_complete = lambda: planned.append(scheduler.schedule())
+        # A successful run plans the next one about an interval later
+        scheduler.last_success = datetime.now() - timedelta(days=1)
+        self.assertTrue(scheduler.run(lambda: True).result(5))
+        self.assertEqual(len(planned), 1)
+        delay = (planned[0] - scheduler.last_run).total_seconds()
+        self.assertGreaterEqual(delay, 3240)
+        self.assertLessEqual(delay, 3960)
+        self.assertEqual(scheduler.next_run, planned[0])
+
+        # Failed runs keep the previous success
+        last_success = scheduler.last_success
+        self.assertFalse(scheduler.run(lambda: False).result(5))
+        with self.assertRaises(RuntimeError):
+            scheduler.run(self._fail).result(5)
+        self.assertEqual(len(planned), 3)
+        self.assertEqual(scheduler.last_success, last_success)
+
+    def test_backoff_failed_runs(self):
+        planned = list()
+        scheduler = RefreshScheduler(3600, jitter=0, retry_delay=300,
+                                     max_backoff=1000)
+        scheduler.on_complete = lambda: planned.append(
+            (scheduler.schedule() - scheduler.last_run).total_seconds())
+        scheduler.last_success = datetime.now() - timedelta(hours=5)
+        # Consecutive failed or raising runs are retried with backoff, even
+        # though the last success is more than an interval ago
+        for func in (lambda: False, self._fail, lambda: None, self._fail):
+            try:
+                scheduler.run(func).result(5)
+            except RuntimeError:
+                pass
+        self.assertEqual(scheduler.failures, 4)
+        self.assertEqual(json.loads(json.dumps(scheduler.status()))
+                         ["failures"], 4)
+        self.assertEqual(planned, [300, 600, 1000, 1000])
+
+        # A successful run resets the backoff
+        self.assertTrue(scheduler.run(lambda: True).result(5))
+        self.assertEqual(scheduler.failures, 0)
+        self.assertEqual(planned[-1], 3600)
+
+    @staticmethod
+    def _fail():
+        raise RuntimeError("refresh failed")
+
+    def test_status(self):
+        scheduler = RefreshScheduler(600)
+        scheduler.schedule(self.now)
+        scheduler.record("caffeinewiz", False, self.now)
+        status = json.loads(json.dumps(scheduler.status()))
+        self.assertEqual(status["interval"], 600)
+        self.assertFalse(status["running"])
+        self.assertIsNone(status["last_success"])
+        self.assertEqual(status["sources"]["caffeinewiz"]["failures"], 1)
+        self.assertEqual(status["next_run"], scheduler.next_run.isoformat())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -17,10 +17,11 @@
 # US Patents 2008-2021: US7424516, US20140161250, US20140177813, US8638908, US8068604, US8553852, US10530923, US10530924
 # China Patent: CN102017585  -  Europe Patent: EU2156652  -  Patents Pending
 
+import re
 import unittest
 
 from copy import deepcopy
-from mock import Mock
+from mock import Mock, call, patch
 from ovos_bus_client import Message
 from neon_minerva.tests.skill_unit_test_base import SkillTestCase
 
@@ -35,21 +36,27 @@ class TestSkillMethods(SkillTestCase):
         # self.assertIsInstance(self.skill, CommonQuerySkill)
         self.assertIsInstance(self.skill.translate_drinks, dict)
 
-        self.skill._update_event.wait()
+        # Data is available as soon as the skill is loaded
+        self.assertGreater(self.skill._data.generation, 0)
+        self.assertGreater(len(self.skill.drink_table), 0)
 
         self.skill._get_new_info()
-        self.assertTrue(self.skill._update_event.is_set())
         self.assertIsNotNone(self.skill.from_caffeine_wiz)
         self.assertIsInstance(self.skill.from_caffeine_wiz, list)
         self.assertIsNotNone(self.skill.from_caffeine_informer)
         self.assertIsInstance(self.skill.from_caffeine_informer, list)
+        from neon_skill_caffeinewiz.store import DrinkRecord, DrinkStore
+        self.assertIsInstance(self.skill.drink_table, DrinkStore)
+        table_names = set(self.skill.drink_table.names)
         self.assertTrue(all([d for d in self.skill.from_caffeine_informer
-                             if d in self.skill.from_caffeine_wiz]))
-        for d in self.skill.from_caffeine_wiz:
-            self.assertIsInstance(d, list)
-            self.assertIsInstance(d[0], str)
-            self.assertIsInstance(float(d[1]), float)
-            self.assertIsInstance(int(d[2]), int)
+                             if d[0] in table_names]))
+        for d in self.skill.drink_table:
+            self.assertIsInstance(d, DrinkRecord)
+            self.assertIsInstance(d.name, str)
+            self.assertIsInstance(d.volume, float)
+            self.assertIsInstance(d.caffeine, float)
+        self.assertEqual(list(self.skill.drink_table.names),
+                         sorted(self.skill.drink_table.names))
 
     def test_CQS_match_query_phrase(self):
         from neon_utils.skills.common_query_skill import CQSMatchLevel
@@ -84,12 +91,153 @@ class TestSkillMethods(SkillTestCase):
         self.assertIsInstance(non_match[2], str)
         self.assertIsInstance(non_match[3], dict)
 
+    def test_match_query_phrase_locales(self):
+        from neon_utils.skills.common_query_skill import CQSMatchLevel
+        queries = {"en-us": "how much caffeine is in a cup of coffee?",
+                   "de-de": "wie viel Koffein ist in einer Tasse Kaffee",
+                   "uk-ua": "скільки кофеїну в каві"}
+        for lang, query in queries.items():
+            message = Message("test", {}, {"lang": lang})
+            match = self.skill._match_query_phrase(query, message, lang)
+            self.assertEqual(match[1], CQSMatchLevel.EXACT, lang)
+            self.assertEqual(match[3]["drink"], "coffee", lang)
+
+        query = self.skill._get_extractor("de-de").extract(
+            "wie viel Koffein ist im Eistee")
+        self.assertEqual(query.drink, "Eistee")
+        self.assertTrue(query.caffeine)
+        self.assertIs(self.skill._get_extractor("de-de"),
+                      self.skill._extractors["de-de"])
+
+    def test_CQS_match_query_phrase_multiple_drinks(self):
+        from neon_utils.skills.common_query_skill import CQSMatchLevel
+        query_str = "how much caffeine is in a coke, a diet coke and red bull"
+        match = self.skill.CQS_match_query_phrase(query_str)
+        self.assertEqual(match[1], CQSMatchLevel.EXACT)
+        self.assertEqual(match[3]["drinks"], ["coca-cola classic",
+                                              "diet coke", "red bull"])
+        self.assertIsNone(match[3]["rows"])
+        for drink in match[3]["drinks"]:
+            self.assertIn(drink, match[2])
+        # The total per serving is spoken after the drinks, followed by the
+        # data source
+        amounts = [float(a) for a in re.findall(r"([\d.]+) milligrams",
+                                                 match[2])]
+        self.assertEqual(len(amounts), 4)
+        info = self.skill.get_caffeine_info(
+            CaffeineRequest(drink="coke, diet coke and red bull", total=True))
+        self.assertEqual(amounts[3], info.total_caffeine_mg)
+        self.assertNotIn("</speak>", match[2])
+        self.assertEqual(match[2].count("CaffeineWiz"), 1)
+        self.assertTrue(match[2].endswith(
+            "Provided by CaffeineWiz. Stay caffeinated!"))
+
+        self.skill.settings["speakTotalCaffeine"] = False
+        try:
+            self.skill._answers.clear()
+            spoken = self.skill._match_query_phrase(query_str)[2]
+            self.assertEqual(len(re.findall("milligrams", spoken)), 3)
+        finally:
+            self.skill.settings.pop("speakTotalCaffeine")
+
+        # A drink name containing a separator is one drink
+        self.assertEqual(self.skill._find_drinks("a&w root beer", "en-us"),
+                         [])
+        self.assertEqual(self.skill._find_drinks("coke zero", "en-us"), [])
+
+    def test_CQS_callback_data(self):
+        query_str = "what is the caffeine content of coffee"
+        callback = self.skill.CQS_match_query_phrase(query_str)[3]
+        self.assertEqual(set(callback),
+                         {"user", "units", "drink", "generation", "rows"})
+        self.assertEqual(callback["generation"], self.skill._data.generation)
+        self.assertTrue(all(isinstance(i, int) for i in callback["rows"]))
+        expected = self.skill._match_drink(callback["drink"]).rows
+        self.assertEqual(self.skill._resolve_results(callback), expected)
+
+        # Rows from an older generation are looked up again
+        data = self.skill._data
+        try:
+            self.skill._data = data.update(data.table, data.index)
+            self.assertEqual(self.skill._resolve_results(callback), expected)
+        finally:
+            self.skill._data = data
+        self.assertEqual(self.skill._resolve_results(
+            {"generation": -1, "rows": [1]}), [])
+
+        # User preferences are read once per query
+        import neon_skill_caffeinewiz
+        self.skill._answers.clear()
+        with patch.object(neon_skill_caffeinewiz, "get_user_prefs",
+                          wraps=neon_skill_caffeinewiz.get_user_prefs) as prefs:
+            message = Message("test", {}, {})
+            callback = self.skill._match_query_phrase(query_str, message)[3]
+            prefs.assert_called_once_with(message)
+        self.assertEqual(callback["units"], neon_skill_caffeinewiz
+                         .get_user_prefs(message)['units']['measure'])
+
+    def test_CQS_match_query_phrase_rejected(self):
+        rejected = self.skill._rejected
+        data = self.skill._data
+        real_match = self.skill._match_query_phrase
+        self.skill._match_query_phrase = Mock(side_effect=real_match)
+        try:
+            # Phrases sharing no word with a drink name are not parsed
+            self.assertIsNone(
+                self.skill.CQS_match_query_phrase("tell me a joke"))
+            self.skill._match_query_phrase.assert_not_called()
+            # Caffeine vocabulary of any language is accepted
+            self.assertTrue(self.skill._get_phrase_filter(data).accepts(
+                "кофеїн в каві"))
+
+            # Repeated misses are answered from the negative cache
+            phrase = "is it going to rain"
+            self.assertIsNone(self.skill.CQS_match_query_phrase(phrase))
+            self.assertEqual(self.skill._match_query_phrase.call_count, 1)
+            hits = rejected.hits
+            self.assertIsNone(self.skill.CQS_match_query_phrase(phrase))
+            self.assertEqual(self.skill._match_query_phrase.call_count, 1)
+            self.assertEqual(rejected.hits, hits + 1)
+            self.assertIsNotNone(
+                self.skill.CQS_match_query_phrase("what is in diet coke"))
+
+            # New data may answer previously rejected phrases
+            self.skill._data = data.update(data.table, data.index)
+            self.assertIsNone(self.skill.CQS_match_query_phrase(phrase))
+            self.assertEqual(self.skill._match_query_phrase.call_count, 3)
+            self.assertEqual(
+                self.skill.get_answer_cache_stats()["rejected"]["generation"],
+                self.skill._data.generation)
+        finally:
+            self.skill._data = data
+            self.skill._match_query_phrase = real_match
+
     def test_handle_caffeine_intent_valid(self):
         calls = deepcopy(self.skill.speak.call_count)
         message = Message("test_message", {"drink": "coke"}, {})
         self.skill.handle_caffeine_intent(message)
         self.assertEqual(self.skill.speak.call_count, calls + 1)
 
+        # The answer is rendered in the language of the message
+        message = Message("test_message", {"drink": "coffee"},
+                          {"lang": "de-de"})
+        with patch.object(self.skill, "_generate_drink_dialog",
+                          wraps=self.skill._generate_drink_dialog) as dialog:
+            self.skill.handle_caffeine_intent(message)
+            dialog.assert_called_once_with("coffee", message, "de-de")
+
+    def test_handle_caffeine_intent_multiple_drinks(self):
+        calls = deepcopy(self.skill.speak.call_count)
+        message = Message("test_message",
+                          {"drink": "a coke and a red bull"}, {})
+        self.skill.handle_caffeine_intent(message)
+        self.assertEqual(self.skill.speak.call_count, calls + 1)
+        spoken = self.skill.speak.call_args[0][0]
+        self.assertIn("coca-cola classic", spoken)
+        self.assertIn("red bull", spoken)
+        self.assertEqual(spoken.count("CaffeineWiz"), 1)
+        self.assertNotIn("</speak>", spoken)
+
     def test_handle_caffeine_intent_no_drink(self):
         message = Message("test_message", {}, {})
         self.skill.handle_caffeine_intent(message)
@@ -103,16 +251,24 @@ class TestSkillMethods(SkillTestCase):
 
     def test_handle_caffeine_update(self):
         real_get_new_info = self.skill._get_new_info
-        self.skill._get_new_info = Mock()
+        self.skill._get_new_info = Mock(return_value=True)
         self.skill.handle_caffeine_update(Message(""))
-        self.skill.speak_dialog.assert_called_with("updating")
-        self.skill._get_new_info.assert_called_once_with(reply=True)
+        self.assertEqual(self.skill.speak_dialog.call_args_list,
+                         [call("updating"), call("update_complete")])
+        self.skill._get_new_info.assert_called_once_with(force=True)
+
+        self.skill._get_new_info = Mock(return_value=False)
+        self.skill.handle_caffeine_update(Message(""))
+        self.skill.speak_dialog.assert_called_with("update_error")
 
         self.skill._get_new_info = real_get_new_info
 
     def test_CQS_action(self):
         phrase = 'test'
-        data = {'results': ['one', 'two']}
+        table = self.skill.drink_table
+        generation = self.skill._data.generation
+        data = {'units': 'imperial', 'drink': 'test',
+                'generation': generation, 'rows': [3, 4]}
 
         real_ask_yesno = self.skill.ask_yesno
         self.skill.ask_yesno = Mock()
@@ -123,13 +279,20 @@ class TestSkillMethods(SkillTestCase):
         # No match
         self.skill.CQS_action(phrase, {})
         self.skill.speak_dialog.assert_not_called()
-        self.skill.CQS_action(phrase, {'results': None})
-        self.skill.speak_dialog.assert_not_called()
-        self.skill.CQS_action(phrase, {'results': []})
+        self.skill.CQS_action(phrase, {'rows': None})
+        self.skill.CQS_action(phrase, {'generation': generation, 'rows': []})
         self.skill.speak_dialog.assert_not_called()
 
+        # Several drinks were already answered
+        self.skill.CQS_action(phrase, {'drinks': ['coke', 'tea'],
+                                       'rows': None})
+        self.skill.speak_dialog.assert_called_once_with("stay_caffeinated")
+        self.skill.ask_yesno.assert_not_called()
+        self.skill.speak_dialog.reset_mock()
+
         # Single match
-        self.skill.CQS_action(phrase, {'results': ['test']})
+        self.skill.CQS_action(phrase, {'generation': generation,
+                                       'rows': [3]})
         self.skill.speak_dialog.assert_called_once_with("stay_caffeinated")
         self.skill.speak_dialog.reset_mock()
 
@@ -149,7 +312,7 @@ class TestSkillMethods(SkillTestCase):
         self.skill.ask_yesno.return_value = 'yes'
         self.skill.CQS_action(phrase, data)
         self.skill._speak_alternate_results.assert_called_once_with(
-            None, data['results'])
+            None, [table[3], table[4]], 'imperial')
         self.skill.speak_dialog.assert_called_once_with(
             "provided_by_caffeinewiz")
         self.skill.speak_dialog.reset_mock()
@@ -178,36 +341,365 @@ class TestSkillMethods(SkillTestCase):
 
     def test_add_more_caffeine_data(self):
         real_data = self.skill.from_caffeine_wiz
-        self.skill.from_caffeine_wiz = list()
-        self.skill._add_more_caffeine_data()
-        self.assertGreaterEqual(len(self.skill.from_caffeine_wiz), 1)
+        real_informer = self.skill.from_caffeine_informer
+        self.skill._add_more_caffeine_data(list(), list())
+        self.assertGreaterEqual(len(self.skill.drink_table), 1)
+        self.assertTrue(self.skill._drink_in_database("rocket chocolate"))
         invalid_entry = ["beverage", "quantity (oz)", "caffeine content (mg)"]
-        self.skill.from_caffeine_wiz.append(invalid_entry)
+        self.skill._add_more_caffeine_data([invalid_entry])
+        self.assertNotIn(invalid_entry[0], self.skill.drink_table.names)
+
+        # Duplicates are resolved in favor of the preferred source
+        self.skill._add_more_caffeine_data(
+            [["test drink", "8", "10"]],
+            [["test drink", "8", "20", "", ""],
+             ["other drink", "8", "5", "", ""]])
+        rows = {r.name: (r.volume, r.caffeine, r.source.label)
+                for r in self.skill.drink_table}
+        self.assertEqual(rows["test drink"], (8.0, 10.0, "caffeinewiz"))
+        self.assertEqual(rows["other drink"], (8.0, 5.0, "caffeineinformer"))
+        self.assertEqual(rows["rocket chocolate"], (0.4, 150.0, "skill"))
+        self.assertEqual(len(self.skill.drink_table), 3)
+        self.skill.settings["preferredSource"] = "caffeineinformer"
         self.skill._add_more_caffeine_data()
-        self.assertNotIn(invalid_entry, self.skill.from_caffeine_wiz)
+        rows = {r.name: (r.volume, r.caffeine, r.source.label)
+                for r in self.skill.drink_table}
+        self.assertEqual(rows["test drink"], (8.0, 20.0, "caffeineinformer"))
+        self.skill.settings.pop("preferredSource")
+
+        self.skill._add_more_caffeine_data(real_data, real_informer)
+
+    def test_add_more_caffeine_data_phrase_filter(self):
+        real_data = self.skill.from_caffeine_wiz
+        real_informer = self.skill.from_caffeine_informer
+        from lingua_franca import load_language
+        load_language("en")
+        self.skill._name_cache.update(["7-up"], "en")
+        try:
+            self.skill._add_more_caffeine_data([["7-up", "12", "0"]], list())
+            # The filter is built with the data, not on the first query
+            generation, phrase_filter = self.skill._phrase_filter
+            self.assertEqual(generation, self.skill._data.generation)
+            # Phrases naming a drink only by an indexed alias are accepted
+            self.assertEqual(self.skill.drink_index.aliases.get("7 up"),
+                             "7-up")
+            self.assertTrue(phrase_filter.accepts("what is in 7 up"))
+        finally:
+            self.skill._add_more_caffeine_data(real_data, real_informer)
+
+    def test_add_more_caffeine_data_alias_collisions(self):
+        real_data = self.skill.from_caffeine_wiz
+        real_informer = self.skill.from_caffeine_informer
+        aliases = {"en": {"cola": "coca-cola", "joe": "coffee"},
+                   "de": {"cola": "pepsi cola"}}
+        langs = ["en", "de"]
+        try:
+            with patch.object(self.skill._name_cache, "aliases",
+                              side_effect=lambda _, lang: aliases[lang]), \
+                    patch("neon_skill_caffeinewiz.LOG") as log, \
+                    patch.object(type(self.skill), "_name_langs", langs):
+                self.skill._add_more_caffeine_data(
+                    [["coca-cola", "12", "34"], ["pepsi cola", "12", "38"],
+                     ["coffee", "8", "95"]], list())
+            # The first language wins; other languages are logged
+            self.assertEqual(self.skill.drink_index.aliases,
+                             {"cola": "coca-cola", "joe": "coffee"})
+            log.warning.assert_called_once()
+            self.assertIn("'cola' (de: pepsi cola)",
+                          log.warning.call_args[0][0])
+        finally:
+            self.skill._add_more_caffeine_data(real_data, real_informer)
+
+    def test_load_cached_data(self):
+        from datetime import datetime
+        from neon_skill_caffeinewiz import SNAPSHOT_FILE
+        real_wiz = self.skill.from_caffeine_wiz
+        real_informer = self.skill.from_caffeine_informer
+        self.skill._write_snapshot(datetime.now())
+
+        # Persisted snapshot is loaded when available, sources are only
+        # read from it when needed
+        generation = self.skill._data.generation
+        self.skill._snapshot = None
+        self.skill._load_cached_data()
+        self.assertIsNotNone(self.skill._snapshot)
+        self.assertIs(self.skill.drink_table, self.skill._snapshot.store)
+        self.assertEqual(self.skill._data.generation, generation + 1)
+        self.assertEqual(self.skill._data.caffeine_wiz, list())
+        self.assertEqual(self.skill.last_updated,
+                         self.skill._snapshot.created)
+        self.assertTrue(self.skill._drink_in_database("coca-cola classic"))
+        wiz, informer = self.skill._data.source_tables()
+        self.assertEqual(wiz, real_wiz)
+        self.assertEqual(informer, real_informer)
+
+        # Corrupt snapshot is discarded and bundled data is used
+        with self.skill.file_system.open(SNAPSHOT_FILE, 'wb') as f:
+            f.write(b"not a snapshot")
+        self.skill._load_cached_data()
+        self.assertFalse(self.skill.file_system.exists(SNAPSHOT_FILE))
+        self.assertIsNone(self.skill._snapshot)
+        from neon_skill_caffeinewiz.providers import BundledProvider
+        self.assertEqual(self.skill.from_caffeine_wiz,
+                         BundledProvider().default_rows())
+        self.assertTrue(self.skill._drink_in_database("coca-cola classic"))
 
-        self.skill.from_caffeine_wiz = real_data
+        self.skill._add_more_caffeine_data(real_wiz, real_informer)
+        self.skill._write_snapshot(datetime.now())
+
+    def test_load_cached_data_corrupt_sections(self):
+        from datetime import datetime
+        from neon_skill_caffeinewiz import SNAPSHOT_FILE
+        from neon_skill_caffeinewiz.fetch import FetchResult
+        from test_snapshot import corrupt_section
+        real_wiz = self.skill.from_caffeine_wiz
+        real_informer = self.skill.from_caffeine_informer
+        real_fetch = self.skill._fetcher.fetch
+        self.skill._fetcher.fetch = Mock(
+            side_effect=lambda name, url, deadline: FetchResult(
+                name, error="offline"))
+        try:
+            for section in ("index", "sources"):
+                self.skill._write_snapshot(datetime.now())
+                corrupt_section(self.skill._snapshot_path, section)
+                self.skill._load_cached_data()
+                # The file is discarded and bundled data is used instead
+                self.assertFalse(self.skill.file_system.exists(SNAPSHOT_FILE),
+                                 section)
+                self.assertIsNone(self.skill._snapshot)
+                self.skill._answers.clear()
+                self.assertIsNotNone(self.skill.CQS_match_query_phrase(
+                    "how much caffeine is in coca-cola classic"), section)
+                self.skill._get_new_info(force=True)
+                self.assertTrue(
+                    self.skill._drink_in_database("coca-cola classic"))
+        finally:
+            self.skill._fetcher.fetch = real_fetch
+            self.skill._refresh.sources.clear()
+            self.skill._add_more_caffeine_data(real_wiz, real_informer)
+            self.skill._write_snapshot(datetime.now())
 
     def test_get_new_info(self):
+        from neon_skill_caffeinewiz.fetch import FetchResult
         real_method = self.skill._add_more_caffeine_data
         self.skill._add_more_caffeine_data = Mock()
-        self.skill.from_caffeine_wiz = None
-        self.skill.from_caffeine_informer = None
+        # Every source fails to update
+        self.skill._fetcher.fetch = Mock(
+            side_effect=lambda name, url, deadline: FetchResult(
+                name, error="offline"))
+        self.skill._refresh.sources.clear()
+        generation = self.skill._data.generation
         self.skill._get_new_info()
+        self.assertEqual(self.skill._data.generation, generation)
         self.assertIsInstance(self.skill.from_caffeine_wiz, list)
         self.assertIsInstance(self.skill.from_caffeine_informer, list)
         self.skill.speak_dialog.assert_not_called()
-        self.skill._add_more_caffeine_data.assert_called_once()
+        # Sources failed to update, so nothing is rebuilt
+        self.skill._add_more_caffeine_data.assert_not_called()
 
         self.assertTrue(self.skill.file_system.exists(
-            "drinkList_from_caffeine_wiz.txt"))
-        # TODO: Replace after resolving update errors DM
-        # self.assertTrue(self.skill.file_system.exists(
-        #     "drinkList_from_caffeine_informer.txt"))
+            "caffeine_snapshot.bin"))
+        self.assertEqual(set(self.skill._snapshot.checksums),
+                         {"caffeinewiz", "caffeineinformer", "skill"})
+        self.assertGreater(self.skill.last_updated,
+                           self.skill._snapshot.created)
+
+        # Failed sources back off and are skipped until their retry time
+        status = self.skill.get_refresh_status()
+        self.assertEqual(status["sources"]["caffeinewiz"]["failures"], 1)
+        self.assertIsNotNone(status["sources"]["caffeinewiz"]["next_attempt"])
+        self.skill._get_new_info()
+        self.assertEqual(self.skill._fetcher.fetch.call_count, 2)
+        self.skill._get_new_info(force=True)
+        self.assertEqual(self.skill._fetcher.fetch.call_count, 4)
+        self.assertEqual(
+            self.skill._refresh.sources["caffeinewiz"].failures, 2)
 
         self.assertTrue(self.skill._get_new_info(True))
         self.skill.speak_dialog.assert_called_once_with("update_complete")
         self.skill._add_more_caffeine_data = real_method
+        del self.skill._fetcher.fetch
+        self.skill._refresh.sources.clear()
+
+    def test_add_more_caffeine_data_delta(self):
+        table, index = self.skill.drink_table, self.skill.drink_index
+        real_wiz = self.skill.from_caffeine_wiz
+
+        # Unchanged data keeps the current table and index
+        self.assertFalse(self.skill._add_more_caffeine_data())
+        self.assertIs(self.skill.drink_table, table)
+        self.assertIs(self.skill.drink_index, index)
+
+        changed = [list(row) for row in real_wiz]
+        changed[1][2] = "1000"
+        removed = changed.pop(2)[0]
+        changed.append(["decaf mud", "8", "1"])
+        delta = self.skill._add_more_caffeine_data(changed)
+        self.assertEqual(delta.summary(),
+                         {"added": 1, "removed": 1, "changed": 1})
+        self.assertEqual(delta.added, ["decaf mud"])
+        self.assertEqual(delta.removed, [removed])
+        self.assertEqual(self.skill._match_drink("decaf mud").best.name,
+                         "decaf mud")
+        self.assertFalse(self.skill._drink_in_database(removed))
+        self.assertIsNot(self.skill.drink_index, index)
+
+        self.assertTrue(self.skill._add_more_caffeine_data(real_wiz))
+        self.assertEqual(list(self.skill.drink_table), list(table))
+
+    def test_publish_data(self):
+        from threading import Thread
+        real_wiz, real_informer = self.skill._data.source_tables()
+        tables = ([["alpha drink", "8", "10"]],
+                  [["alpha drink", "8", "20"], ["beta drink", "8", "30"]])
+        self.skill._add_more_caffeine_data(tables[0], list())
+        data = self.skill._data
+        self.assertIs(data.index.rows, data.table)
+
+        # Readers only ever see a complete generation
+        seen = list()
+        done = list()
+
+        def _read():
+            while not done:
+                current = self.skill._data
+                rows = current.index.match("alpha drink")
+                seen.append((current.generation, len(current.table),
+                             rows[0].caffeine, rows[0].store is current.table))
+        reader = Thread(target=_read)
+        reader.start()
+        for i in range(20):
+            self.skill._add_more_caffeine_data(tables[(i + 1) % 2])
+        done.append(True)
+        reader.join()
+        for generation, size, caffeine, consistent in seen:
+            self.assertTrue(consistent)
+            self.assertEqual(caffeine, 10.0 if size == 2 else 20.0)
+        self.assertEqual(self.skill._data.generation, data.generation + 20)
+
+        # Published data is never modified
+        self.assertEqual(data.table.names, ("alpha drink", "rocket chocolate"))
+        self.assertEqual(data.caffeine_wiz, tables[0])
+        self.skill._add_more_caffeine_data(real_wiz, real_informer)
+
+    def test_get_new_info_from_sources(self):
+        from datetime import datetime
+        from source_server import SourceServer, load_fixture
+
+        server = SourceServer({
+            "/wiz": load_fixture("caffeinewiz.html"),
+            "/informer": load_fixture("caffeineinformer.html")})
+        wiz_provider = self.skill._providers.get("caffeinewiz")
+        informer_provider = self.skill._providers.get("caffeineinformer")
+        real_urls = (wiz_provider.url, informer_provider.url)
+        real_wiz = self.skill.from_caffeine_wiz
+        real_informer = self.skill.from_caffeine_informer
+        wiz_provider.url = f"{server.url}/wiz"
+        informer_provider.url = f"{server.url}/informer"
+        self.skill._fetcher.validators = dict()
+        updates = list()
+        self.skill.bus.on("caffeinewiz.data.updated", updates.append)
+
+        # Sources may be backing off after failed updates in other tests
+        self.assertTrue(self.skill._get_new_info(force=True))
+        self.assertEqual(self.skill._refresh.sources["caffeinewiz"].failures,
+                         0)
+        self.assertEqual(len(updates), 1)
+        self.assertEqual(updates[0].data["drinks"],
+                         len(self.skill.drink_table))
+        self.assertTrue(any(updates[0].data[key] for key in
+                            ("added", "removed", "changed")))
+        self.assertIn(["10 hour energy shot", "1.93", "422"],
+                      self.skill.from_caffeine_wiz)
+        self.assertGreaterEqual(len(self.skill.from_caffeine_informer), 80)
+        self.assertTrue(self.skill._drink_in_database("bawls exxtra"))
+        self.assertEqual(set(self.skill._snapshot.validators),
+                         {"caffeinewiz", "caffeineinformer"})
+
+        # Normalized names are cached and indexed as aliases, not rows
+        self.assertTrue(self.skill.file_system.exists("caffeine_names.json"))
+        self.assertEqual(self.skill.drink_index.aliases.get("7 up"), "7-up")
+        self.assertEqual(self.skill._match_drink("7 up").best.name, "7-up")
+        self.assertNotIn("7 up", self.skill.drink_table.names)
+        misses = self.skill._name_cache.misses
+        self.skill._fetcher.validators = dict()
+        index = self.skill.drink_index
+        self.assertTrue(self.skill._get_new_info())
+        self.assertEqual(self.skill._name_cache.misses, misses)
+        # Unchanged data is not rebuilt and not announced
+        self.assertIs(self.skill.drink_index, index)
+        self.assertEqual(len(updates), 1)
+
+        # Unchanged sources are not downloaded or parsed again
+        server.requests.clear()
+        parsed_wiz = self.skill.from_caffeine_wiz
+        self.assertTrue(self.skill._get_new_info())
+        self.assertEqual(sorted(server.requests),
+                         [("/informer", 304), ("/wiz", 304)])
+        self.assertIs(self.skill.from_caffeine_wiz, parsed_wiz)
+        self.assertTrue(self.skill._drink_in_database("bawls exxtra"))
+
+        server.shutdown()
+        wiz_provider.url, informer_provider.url = real_urls
+        self.skill.bus.remove("caffeinewiz.data.updated", updates.append)
+        self.skill._fetcher.validators = dict()
+        self.skill._add_more_caffeine_data(real_wiz, real_informer)
+        self.skill._write_snapshot(datetime.now())
+
+    def test_data_providers(self):
+        import os
+        from tempfile import TemporaryDirectory
+        from neon_skill_caffeinewiz.fetch import FetchResult
+        from neon_skill_caffeinewiz.providers import MemoryProvider
+        real_wiz = self.skill.from_caffeine_wiz
+        real_informer = self.skill.from_caffeine_informer
+        self.skill._fetcher.fetch = Mock(
+            side_effect=lambda name, url, deadline: FetchResult(
+                name, error="offline"))
+        try:
+            self.assertEqual(self.skill._providers.names,
+                             ["caffeinewiz", "skill", "caffeineinformer"])
+
+            # Added providers take priority over the built-in sources
+            provider = MemoryProvider([["coca-cola classic", "12", "1"],
+                                       ["office brew", "8", "150"]],
+                                      "office")
+            self.assertTrue(self.skill.add_provider(provider).result(10))
+            rows = {r.name: (r.caffeine, r.source.label)
+                    for r in self.skill.drink_table}
+            self.assertEqual(rows["coca-cola classic"], (1.0, "local"))
+            self.assertEqual(rows["office brew"], (150.0, "local"))
+            self.assertIn("office", self.skill.get_refresh_status()[
+                "providers"])
+            with self.assertRaises(ValueError):
+                self.skill.add_provider(MemoryProvider([], "office"))
+
+            # Local files and built-in sources are configured in settings
+            with TemporaryDirectory() as tmp:
+                path = os.path.join(tmp, "catalog.csv")
+                with open(path, "w") as f:
+                    f.write("name,oz,mg\noffice brew,8,100\n")
+                self.skill.settings["localSources"] = path
+                self.skill.settings["enableCaffeineInformer"] = False
+                self.skill._on_settings_changed()
+                self.skill._refresh_data().result(10)
+                self.assertEqual(self.skill._providers.names,
+                                 [path, "office", "caffeinewiz", "skill"])
+                self.assertEqual(
+                    self.skill._match_drink("office brew").best.row.caffeine,
+                    100.0)
+                self.assertNotIn("caffeineinformer",
+                                 self.skill._data.source_rows())
+        finally:
+            self.skill.settings.pop("localSources", None)
+            self.skill.settings.pop("enableCaffeineInformer", None)
+            self.skill._added_providers.clear()
+            self.skill._on_settings_changed()
+            self.skill._refresh_data().result(10)
+            del self.skill._fetcher.fetch
+            self.skill._refresh.sources.clear()
+            self.skill._add_more_caffeine_data(real_wiz, real_informer)
+        self.assertNotIn("office brew", self.skill.drink_table.names)
 
     def test_clean_drink_name(self):
         self.assertEqual("coffee", self.skill._clean_drink_name("a coffee"))
@@ -229,6 +721,13 @@ class TestSkillMethods(SkillTestCase):
         for spoken, translated in self.skill.translate_drinks.items():
             self.assertEqual(translated, self.skill._clean_drink_name(spoken))
 
+        self.assertEqual("coca-cola classic please",
+                         self.skill._clean_drink_name("a can of coke please"))
+        self.assertEqual("diet coke", self.skill._clean_drink_name("diet coke"))
+        self.assertEqual("coffee",
+                         self.skill._clean_drink_name("eine Tasse Kaffee",
+                                                      "de-de"))
+
     def test_drink_in_database(self):
         self.assertTrue(self.skill._drink_in_database("coke"))
         self.assertTrue(self.skill._drink_in_database("coca-cola classic"))
@@ -241,9 +740,75 @@ class TestSkillMethods(SkillTestCase):
         self.assertIsInstance(self.skill._get_matching_drinks("software"),
                               list)
 
+    def test_match_drink(self):
+        from neon_skill_caffeinewiz.index import MatchResult, MatchType
+        match = self.skill._match_drink("coca-cola classic")
+        self.assertIsInstance(match, MatchResult)
+        self.assertEqual(match.best.name, "coca-cola classic")
+        self.assertEqual(match.best.match_type, MatchType.EXACT)
+        self.assertEqual(len(match.rows),
+                         len(self.skill._get_matching_drinks(
+                             "coca-cola classic")))
+        self.assertFalse(self.skill._match_drink("software"))
+
     def test_generate_drink_dialog(self):
-        # TODO: Write this test DM
-        pass
+        message = Message("test_message", {}, {})
+        match = self.skill._match_drink("diet coke")
+        dialog, results = self.skill._generate_drink_dialog("diet coke",
+                                                            message)
+        self.assertIsInstance(dialog, str)
+        self.assertIn("diet coke", dialog)
+        self.assertEqual(results, match.rows)
+        self.assertEqual(results[0][0], "diet coke")
+        self.assertIsNone(self.skill._generate_drink_dialog("software",
+                                                            message))
+
+    def test_generate_drink_dialog_cached(self):
+        from neon_skill_caffeinewiz.index import DrinkIndex
+        message = Message("test_message", {}, {})
+        answers = self.skill._answers
+        answers.clear()
+        renderer = self.skill.dialog_renderer
+        render = Mock(side_effect=renderer.render)
+        find = Mock(side_effect=DrinkIndex.find, autospec=True)
+        data = self.skill._data
+        try:
+            with patch.object(renderer, "render", render), \
+                    patch.object(DrinkIndex, "find",
+                                 lambda *args: find(*args)):
+                first = self.skill._generate_drink_dialog("red bull", message)
+                hits = answers.hits
+                second = self.skill._generate_drink_dialog("red bull",
+                                                           message)
+            self.assertEqual(first, second)
+            self.assertEqual(answers.hits, hits + 1)
+            find.assert_called_once()
+            # The dialog is rendered for every request so variants rotate
+            rendered = [c for c in render.call_args_list
+                        if c.args[0] == "drink_caffeine"]
+            self.assertEqual(len(rendered), 2)
+            self.assertEqual(rendered[0], rendered[1])
+            self.assertEqual(render.call_args, rendered[1])
+
+            # Units are part of the key
+            misses = answers.misses
+            with patch("neon_skill_caffeinewiz.get_user_prefs") as prefs:
+                prefs.return_value = {"units": {"measure": "imperial"}}
+                self.skill._generate_drink_dialog("red bull", message)
+                prefs.return_value = {"units": {"measure": "metric"}}
+                self.skill._generate_drink_dialog("red bull", message)
+            self.assertEqual(answers.misses, misses + 1)
+
+            # A new data generation invalidates cached answers
+            self.skill._data = data.update(data.table, data.index)
+            misses = answers.misses
+            self.skill._generate_drink_dialog("red bull", message)
+            self.assertEqual(answers.misses, misses + 1)
+            self.assertEqual(len(answers), 1)
+            stats = self.skill.get_answer_cache_stats()["answers"]
+            self.assertEqual(stats["generation"], self.skill._data.generation)
+        finally:
+            self.skill._data = data
 
     def test_get_caffeine_info(self):
         info = self.skill.get_caffeine_info(CaffeineRequest(drink="coke"))
@@ -258,7 +823,89 @@ class TestSkillMethods(SkillTestCase):
         self.assertGreater(best_match.caffeine_mg, 0)
         self.assertGreater(best_match.volume, 0)
         self.assertNotEqual(best_match.formatted_imperial, best_match.formatted_metric)
+        self.assertIsNone(info.error)
+
+        with self.assertRaises(ValueError):
+            self.skill.get_caffeine_info(CaffeineRequest(drink="software"))
+
+    def test_get_caffeine_info_multiple_drinks(self):
+        info = self.skill.get_caffeine_info(
+            CaffeineRequest(drink="diet coke and red bull", total=True))
+        self.assertEqual([d.name for d in info.drinks],
+                         ["diet coke", "red bull"])
+        self.assertEqual(info.best_match, info.drinks[0])
+        self.assertEqual(info.total_caffeine_mg,
+                         sum(d.caffeine_mg for d in info.drinks))
+
+        info = self.skill.get_caffeine_info(CaffeineRequest(drink="coke"))
+        self.assertEqual(info.drinks, [])
+        self.assertIsNone(info.total_caffeine_mg)
+        info = self.skill.get_caffeine_info(CaffeineRequest(drink="coke",
+                                                            total=True))
+        self.assertEqual(info.total_caffeine_mg, info.best_match.caffeine_mg)
+
+        responses = self.skill.get_caffeine_info_batch(
+            [CaffeineRequest(drink="diet coke and red bull"),
+             CaffeineRequest(drink="diet coke and red bull", total=True)])
+        self.assertEqual(len(responses[0].drinks), 2)
+        self.assertIsNone(responses[0].total_caffeine_mg)
+        self.assertEqual(responses[1].total_caffeine_mg,
+                         sum(d.caffeine_mg for d in responses[1].drinks))
+
+    def test_get_caffeine_info_batch(self):
+        requests = [CaffeineRequest(drink="coke"),
+                    CaffeineRequest(drink="software"),
+                    {"drink": "diet coke"},
+                    CaffeineRequest(drink="coke"),
+                    {"name": "invalid"}]
+        responses = self.skill.get_caffeine_info_batch(requests)
+        self.assertEqual(len(responses), len(requests))
+        self.assertTrue(all(isinstance(r, CaffeineResponse)
+                            for r in responses))
+        self.assertEqual(responses[0], self.skill.get_caffeine_info(
+            CaffeineRequest(drink="coke")))
+        self.assertIsNone(responses[1].best_match)
+        self.assertIn("software", responses[1].error)
+        self.assertEqual(responses[2].best_match.name, "diet coke")
+        self.assertEqual(responses[3], responses[0])
+        self.assertIsNone(responses[4].best_match)
+        self.assertIsNotNone(responses[4].error)
+        self.assertEqual(self.skill.get_caffeine_info_batch([]), [])
+
+    def test_metrics(self):
+        self.assertFalse(self.skill.metrics_enabled)
+        self.assertFalse(self.skill.get_metrics()["enabled"])
+
+        self.skill._metrics.enabled = True
+        try:
+            self.skill._metrics.reset()
+            self.skill.CQS_match_query_phrase("tell me a joke")
+            self.skill.CQS_match_query_phrase("what is in diet coke")
+            metrics = self.skill.get_metrics()
+            self.assertTrue(metrics["enabled"])
+            self.assertEqual(metrics["counters"]["cqs.queries"], 2)
+            self.assertEqual(metrics["counters"]["cqs.filtered"], 1)
+            for stage in ("cqs", "clean_drink_name", "lookup", "render"):
+                self.assertGreater(metrics["latency"][stage]["count"], 0)
+            self.assertEqual(metrics["gauges"]["drinks"],
+                             len(self.skill.drink_table))
+            self.assertEqual(metrics["gauges"]["generation"],
+                             self.skill._data.generation)
+
+            # Snapshots are available over the messagebus
+            responses = list()
+            self.skill.bus.on("caffeinewiz.metrics.response",
+                              responses.append)
+            self.skill.bus.emit(Message("caffeinewiz.metrics"))
+            self.skill.bus.remove("caffeinewiz.metrics.response",
+                                  responses.append)
+            self.assertEqual(len(responses), 1)
+            self.assertEqual(responses[0].data["counters"]["cqs.queries"], 2)
+        finally:
+            self.skill._metrics.enabled = False
+            self.skill._metrics.reset()
 
 
 if __name__ == '__main__':
     unittest.main()
+
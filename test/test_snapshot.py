@@ -0,0 +1,184 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Development System
+#
+# Copyright 2008-2025 Neongecko.com Inc. | All Rights Reserved
+#
+# Notice of License - Duplicating this Notice of License near the start of any file containing
+# a derivative of this software is a condition of license for this software.
+# Friendly Licensing:
+# No charge, open source royalty free use of the Neon AI software source and object is offered for
+# educational users, noncommercial enthusiasts, Public Benefit Corporations (and LLCs) and
+# Social Purpose Corporations (and LLCs). Developers can contact developers@neon.ai
+# For commercial licensing, distribution of derivative works or redistribution please contact licenses@neon.ai
+# Distributed on an "AS IS” basis without warranties or conditions of any kind, either express or implied.
+# Trademarks of Neongecko: Neon AI(TM), Neon Assist (TM), Neon Communicator(TM), Klat(TM)
+# Authors: Guy Daniels, Daniel McKnight, Regina Bloomstine, Elon Gasper, Richard Leeds
+#
+# Specialized conversational reconveyance options from Conversation Processing Intelligence Corp.
+# US Patents 2008-2021: US7424516, US20140161250, US20140177813, US8638908, US8068604, US8553852, US10530923, US10530924
+# China Patent: CN102017585  -  Europe Patent: EU2156652  -  Patents Pending
+
+import json
+import mmap
+import os
+import shutil
+import struct
+import unittest
+
+from datetime import datetime
+from mock import Mock, patch
+from tempfile import mkdtemp
+
+from neon_skill_caffeinewiz.index import DrinkIndex
+from neon_skill_caffeinewiz.merge import merge_drink_tables
+from neon_skill_caffeinewiz.snapshot import SNAPSHOT_VERSION, SnapshotError, \
+    load_snapshot, source_checksum, write_snapshot
+from neon_skill_caffeinewiz.store import DrinkStore, Source
+
+
+def corrupt_section(path: str, name: str):
+    """
+    Flip one byte in the middle of a section of a snapshot file
+    """
+    with open(path, "rb") as f:
+        data = bytearray(f.read())
+    meta_len = struct.unpack_from("<I", data, 10)[0]
+    meta_end = 18 + meta_len
+    metadata = json.loads(bytes(data[18:meta_end]))
+    offset, length, _ = metadata["sections"][name]
+    pos = meta_end + (-meta_end % 8) + offset + length // 2
+    data[pos] ^= 0xFF
+    with open(path, "wb") as f:
+        f.write(data)
+
+
+class TestSnapshot(unittest.TestCase):
+    sources = {"caffeinewiz": [["coffee", "8", "95"], ["tea", "8", "47"],
+                               ["diet coke", "12", "46"]],
+               "caffeineinformer": [["red bull", "8.4", "80", "x", "y"]]}
+
+    def setUp(self):
+        self.test_dir = mkdtemp()
+        self.path = os.path.join(self.test_dir, "snapshot.bin")
+        merged = merge_drink_tables(
+            self.sources["caffeinewiz"],
+            [r[:-2] for r in self.sources["caffeineinformer"]],
+            sources=[Source.CAFFEINEWIZ, Source.CAFFEINEINFORMER])
+        self.store = DrinkStore.from_rows(merged)
+        self.index = DrinkIndex(self.store)
+        self.created = datetime(2026, 1, 2, 3, 4, 5)
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_round_trip(self):
+        validators = {"caffeinewiz": {"etag": '"abc"',
+                                      "last_modified": None}}
+        write_snapshot(self.path, self.store, self.index, self.sources,
+                       self.created, validators)
+        self.assertFalse(os.path.exists(f"{self.path}.tmp"))
+        snapshot = load_snapshot(self.path)
+        self.assertEqual(snapshot.created, self.created)
+        self.assertEqual(snapshot.metadata["schema_version"],
+                         SNAPSHOT_VERSION)
+        self.assertEqual(snapshot.metadata["rows"], len(self.store))
+        self.assertEqual(snapshot.checksums["caffeinewiz"],
+                         source_checksum(self.sources["caffeinewiz"]))
+        self.assertEqual(snapshot.sources(), self.sources)
+        self.assertEqual(snapshot.validators, validators)
+
+        store = snapshot.store
+        self.assertIsInstance(store.volume, memoryview)
+        self.assertEqual(store.names, self.store.names)
+        self.assertEqual(list(store), list(self.store))
+        self.assertEqual([r.metric for r in store],
+                         [r.metric for r in self.store])
+        self.assertEqual([r.source for r in store],
+                         [r.source for r in self.store])
+
+        self.assertIs(snapshot.index.rows, store)
+        # Index lookup structures are only loaded when first used
+        self.assertIn("_deferred", snapshot.index.__dict__)
+        self.assertEqual(snapshot.index.aliases, self.index.aliases)
+        self.assertIn("_deferred", snapshot.index.__dict__)
+        for query in ("coffee", "coke", "red bul", "software"):
+            self.assertEqual(
+                [m.row for m in snapshot.index.find(query).matches],
+                [m.row for m in self.index.find(query).matches])
+
+    def test_empty_store(self):
+        store = DrinkStore.from_rows([])
+        write_snapshot(self.path, store, DrinkIndex(store), {}, self.created)
+        snapshot = load_snapshot(self.path)
+        self.assertEqual(len(snapshot.store), 0)
+        self.assertEqual(snapshot.sources(), {})
+
+    def test_aliases(self):
+        index = self.index.apply(self.store, {"joe": "coffee"}).apply(
+            self.store, {"joe": "coffee", "redbull": "red bull"})
+        write_snapshot(self.path, self.store, index, self.sources,
+                       self.created)
+        snapshot = load_snapshot(self.path)
+        self.assertEqual(snapshot.index.aliases,
+                         {"joe": "coffee", "redbull": "red bull"})
+        self.assertEqual(snapshot.index.find("redbull").best.name,
+                         "red bull")
+        self.assertNotIn("_deferred", snapshot.index.__dict__)
+
+    def test_invalid_snapshots(self):
+        with self.assertRaises(SnapshotError):
+            load_snapshot(self.path)
+
+        write_snapshot(self.path, self.store, self.index, self.sources,
+                       self.created)
+        with open(self.path, "rb") as f:
+            valid = f.read()
+
+        offset = valid.index(b"coffee")
+        invalid = {"truncated": valid[:4],
+                   "magic": b"X" + valid[1:],
+                   "version": valid[:8] + struct.pack("<H", 0) + valid[10:],
+                   "metadata": valid[:30] + b"X" + valid[31:],
+                   "corrupt": valid[:offset] + b"C" + valid[offset + 1:],
+                   "empty": b""}
+        buffers = list()
+        real_mmap = mmap.mmap
+
+        def _mmap(*args, **kwargs):
+            buffers.append(real_mmap(*args, **kwargs))
+            return buffers[-1]
+
+        for label, data in invalid.items():
+            with open(self.path, "wb") as f:
+                f.write(data)
+            with patch("mmap.mmap", _mmap):
+                with self.assertRaises(SnapshotError, msg=label):
+                    load_snapshot(self.path)
+        # The file is not left mapped after it is rejected
+        self.assertEqual(len(buffers), 5)
+        self.assertTrue(all(buffer.closed for buffer in buffers))
+
+        # Sections that are deserialized lazily are still checked on load
+        for section in ("index", "sources"):
+            with open(self.path, "wb") as f:
+                f.write(valid)
+            corrupt_section(self.path, section)
+            with self.assertRaises(SnapshotError, msg=section):
+                load_snapshot(self.path)
+
+    def test_deferred_index_errors(self):
+        write_snapshot(self.path, self.store, self.index, self.sources,
+                       self.created)
+        snapshot = load_snapshot(self.path)
+        index = snapshot.index
+        loader = index.__dict__["_deferred"]
+        index.__dict__["_deferred"] = Mock(side_effect=SnapshotError("x"))
+        # A failed load is raised again on the next use
+        for _ in range(2):
+            with self.assertRaises(SnapshotError):
+                index.find("coffee")
+        index.__dict__["_deferred"] = loader
+        self.assertEqual(index.find("coffee").best.name, "coffee")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+# NEON AI (TM) SOFTWARE, Software Development Kit & Application Development System
+#
+# Copyright 2008-2025 Neongecko.com Inc. | All Rights Reserved
+#
+# Notice of License - Duplicating this Notice of License near the start of any file containing
+# a derivative of this software is a condition of license for this software.
+# Friendly Licensing:
+# No charge, open source royalty free use of the Neon AI software source and object is offered for
+# educational users, noncommercial enthusiasts, Public Benefit Corporations (and LLCs) and
+# Social Purpose Corporations (and LLCs). Developers can contact developers@neon.ai
+# For commercial licensing, distribution of derivative works or redistribution please contact licenses@neon.ai
+# Distributed on an "AS IS” basis without warranties or conditions of any kind, either express or implied.
+# Trademarks of Neongecko: Neon AI(TM), Neon Assist (TM), Neon Communicator(TM), Klat(TM)
+# Authors: Guy Daniels, Daniel McKnight, Regina Bloomstine, Elon Gasper, Richard Leeds
+#
+# Specialized conversational reconveyance options from Conversation Processing Intelligence Corp.
+# US Patents 2008-2021: US7424516, US20140161250, US20140177813, US8638908, US8068604, US8553852, US10530923, US10530924
+# China Patent: CN102017585  -  Europe Patent: EU2156652  -  Patents Pending
+
+import pickle
+import unittest
+
+from array import array
+from os.path import dirname, join
+
+from neon_skill_caffeinewiz import CaffeineWizSkill
+from neon_skill_caffeinewiz.index import DrinkIndex
+from neon_skill_caffeinewiz.merge import merge_drink_tables
+from neon_skill_caffeinewiz.store import DrinkRecord, DrinkStore, MetricUnit, \
+    Source
+
+BUNDLED_DATA = join(dirname(dirname(__file__)), "neon_skill_caffeinewiz",
+                    "caffeine_wiz_data.pickle")
+
+
+class TestDrinkStore(unittest.TestCase):
+    rows = [["coffee", "8", "95", Source.CAFFEINEWIZ],
+            ["rocket chocolate", ".4", "150", Source.SKILL],
+            ["bad", "n/a", "10"],
+            ["no volume", "0", "10"],
+            ["tea", "8", "47"]]
+
+    def test_from_rows(self):
+        store = DrinkStore.from_rows(self.rows)
+        self.assertEqual(len(store), 3)
+        self.assertEqual(store.names, ("coffee", "rocket chocolate", "tea"))
+        self.assertIsInstance(store.volume, array)
+        self.assertEqual(store.volume.typecode, 'd')
+        self.assertEqual(list(store.caffeine), [95.0, 150.0, 47.0])
+        self.assertEqual([r.source for r in store],
+                         [Source.CAFFEINEWIZ, Source.SKILL,
+                          Source.CAFFEINEWIZ])
+        self.assertGreater(store.nbytes, 0)
+
+    def test_record(self):
+        store = DrinkStore.from_rows(self.rows)
+        record = store[1]
+        self.assertIsInstance(record, DrinkRecord)
+        self.assertFalse(hasattr(record, "__dict__"))
+        self.assertEqual(record.name, "rocket chocolate")
+        self.assertEqual(record.volume, 0.4)
+        self.assertEqual(record.caffeine, 150.0)
+        self.assertEqual(record.source.label, "skill")
+        self.assertEqual(list(record), ["rocket chocolate", 0.4, 150.0])
+        self.assertEqual(record[0], "rocket chocolate")
+        self.assertEqual(record, store[1])
+        self.assertNotEqual(record, store[0])
+        self.assertEqual(store[-1].name, "tea")
+        self.assertEqual([r.name for r in store[:2]],
+                         ["coffee", "rocket chocolate"])
+        with self.assertRaises(IndexError):
+            _ = store[3]
+
+    def test_index_store(self):
+        merged = merge_drink_tables([["coffee", "8", "95"]],
+                                    [["iced coffee", "16", "165"]],
+                                    sources=[Source.CAFFEINEWIZ,
+                                             Source.CAFFEINEINFORMER])
+        store = DrinkStore.from_rows(merged)
+        index = DrinkIndex(store)
+        self.assertIs(index.rows, store)
+        result = index.find("coffee")
+        self.assertEqual(result.best.row.name, "coffee")
+        self.assertEqual(result.alternatives[0].row.source,
+                         Source.CAFFEINEINFORMER)
+
+    def test_metric_parity(self):
+        with open(BUNDLED_DATA, 'rb') as f:
+            rows = pickle.load(f)
+        rows += [["edge", str(oz), "100"] for oz in
+                 (0.1, 15.99, 16, 16.01, 31.99, 32, 32.01, 128)]
+        store = DrinkStore.from_rows(rows)
+        self.assertEqual(len(store), len(rows) - 1)
+        for record in store:
+            expected = CaffeineWizSkill.convert_metric(record.volume,
+                                                       record.caffeine)
+            self.assertEqual(record.metric, expected, record)
+            expected_ml = 1000 if expected[2] == "word_liter" else \
+                int(expected[1])
+            self.assertEqual(record.metric_ml, expected_ml)
+        self.assertEqual(MetricUnit.LITER.resource, "word_liter")
+
+    def test_pickle_round_trip(self):
+        store = DrinkStore.from_rows(self.rows)
+        loaded = pickle.loads(pickle.dumps(store))
+        self.assertEqual(list(loaded), list(store))
+
+    def test_diff(self):
+        store = DrinkStore.from_rows([["coffee", "8", "95"],
+                                      ["tea", "8", "47"],
+                                      ["cola", "12", "34"]])
+        self.assertFalse(store.diff(DrinkStore.from_rows(
+            [["coffee", "8", "95"], ["tea", "8.0", "47"],
+             ["cola", "12", "34"]])))
+        delta = store.diff(DrinkStore.from_rows(
+            [["coffee", "8", "95", Source.CAFFEINEINFORMER],
+             ["tea", "8", "40"], ["mate", "8", "80"]]))
+        self.assertEqual(delta.added, ["mate"])
+        self.assertEqual(delta.removed, ["cola"])
+        self.assertEqual(delta.changed, ["coffee", "tea"])
+        self.assertEqual(delta.summary(),
+                         {"added": 1, "removed": 1, "changed": 2})
+
+
+if __name__ == '__main__':
+    unittest.main()